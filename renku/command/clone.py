@@ -40,6 +40,7 @@ def _project_clone(
     raise_git_except: bool = False,
     checkout_revision: Optional[str] = None,
     use_renku_credentials: bool = False,
+    reference: Optional[Union[str, Path]] = None,
 ):
     """Clone Renku project repo, install Git hooks and LFS.
 
@@ -56,6 +57,7 @@ def _project_clone(
         raise_git_except(bool): Whether to raise Git exceptions or not (Default value = False).
         checkout_revision(Optional[str]): Specific revision to check out (Default value = None).
         use_renku_credentials(bool): Whether to use credentials stored in renku (Default value = False).
+        reference(Optional[Union[str, Path]]): Local repository to borrow objects from (Default value = None).
 
     Returns:
         Tuple of cloned ``Repository`` and whether it's a Renku project or not.
@@ -79,6 +81,7 @@ def _project_clone(
         raise_git_except=raise_git_except,
         checkout_revision=checkout_revision,
         use_renku_credentials=use_renku_credentials,
+        reference=reference,
     )
 
     with project_context.with_path(repository.path):
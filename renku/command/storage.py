@@ -16,7 +16,7 @@
 # limitations under the License.
 """Renku storage command."""
 
-from typing import List
+from typing import List, Optional
 
 from pydantic import validate_arguments
 
@@ -93,13 +93,18 @@ def pull_command():
 
 
 @validate_arguments(config=dict(arbitrary_types_allowed=True))
-def _clean(paths: List[str]):
+def _clean(paths: List[str], target_size: Optional[int] = None):
     """Remove files from lfs cache/turn them back into pointer files.
 
     Args:
         paths:List[str]: Paths to turn back to pointer files.
+        target_size(Optional[int]): Number of bytes to free by cleaning least recently accessed files first
+            (Default value = None).
+
+    Returns:
+        Number of reclaimed bytes.
     """
-    untracked_paths, local_only_paths = clean_storage_cache(*paths)
+    untracked_paths, local_only_paths, reclaimed_size = clean_storage_cache(*paths, target_size=target_size)
 
     if untracked_paths:
         communication.warn(
@@ -113,6 +118,8 @@ def _clean(paths: List[str]):
             + "a remote with git LFS:\n\t{}\n".format("\n\t".join(local_only_paths))
         )
 
+    return reclaimed_size
+
 
 def clean_command():
     """Command to remove files from lfs cache/turn them back into pointer files."""
@@ -20,7 +20,7 @@ import html
 import io
 import json
 from enum import Enum
-from typing import Dict, Iterator, List, Optional, cast
+from typing import IO, Dict, Iterator, List, Optional, cast
 
 import pyld
 import rdflib
@@ -68,6 +68,19 @@ class GraphViewModel:
         output = pyld.jsonld.flatten(self._graph)
         return json.dumps(output, indent=indentation)
 
+    def write_jsonld(self, output: IO[bytes], indentation: Optional[int] = None) -> None:
+        """Write the JSON-LD representation to a binary stream without building it as a string.
+
+        Args:
+            output(IO[bytes]): The stream to write to.
+            indentation(int, optional): The indentation to use for pretty-printing (Default value = None).
+        """
+        writer = io.TextIOWrapper(output, encoding="utf-8")
+        try:
+            json.dump(pyld.jsonld.flatten(self._graph), writer, indent=indentation)
+        finally:
+            writer.detach()
+
     def as_rdflib_graph(self) -> Graph:
         """Get the graph as an RDFLib graph.
 
@@ -86,6 +99,14 @@ class GraphViewModel:
         """
         return self.as_rdflib_graph().serialize(format="nt")
 
+    def write_nt(self, output: IO[bytes]) -> None:
+        """Write the graph in nt format to a binary stream.
+
+        Args:
+            output(IO[bytes]): The stream to write to.
+        """
+        self.as_rdflib_graph().serialize(destination=output, format="nt", encoding="utf-8")
+
     def as_rdf_string(self) -> str:
         """Get the graph as a string in rdf+xml format.
 
@@ -94,6 +115,14 @@ class GraphViewModel:
         """
         return self.as_rdflib_graph().serialize(format="application/rdf+xml")
 
+    def write_rdf(self, output: IO[bytes]) -> None:
+        """Write the graph in rdf+xml format to a binary stream.
+
+        Args:
+            output(IO[bytes]): The stream to write to.
+        """
+        self.as_rdflib_graph().serialize(destination=output, format="application/rdf+xml", encoding="utf-8")
+
     def as_dot_string(self, format: DotFormat = DotFormat.FULL) -> str:
         """Get the graph as a Graphviz Dot string.
 
@@ -102,6 +131,34 @@ class GraphViewModel:
         Returns:
             str: The Dot string representation of the graph.
         """
+        output = io.StringIO()
+
+        try:
+            self._write_dot(output, format)
+            return output.getvalue()
+        finally:
+            output.close()
+
+    def write_dot(self, output: IO[bytes], format: DotFormat = DotFormat.FULL) -> None:
+        """Write the graph as Graphviz Dot to a binary stream.
+
+        Args:
+            output(IO[bytes]): The stream to write to.
+            format(DotFormat): The format to use (Default value = `DotFormat.FULL`).
+        """
+        writer = io.TextIOWrapper(output, encoding="utf-8")
+        try:
+            self._write_dot(writer, format)
+        finally:
+            writer.detach()
+
+    def _write_dot(self, output: IO[str], format: DotFormat) -> None:
+        """Write the graph as Graphviz Dot to a text stream.
+
+        Args:
+            output(IO[str]): The stream to write to.
+            format(DotFormat): The format to use.
+        """
         graph = self.as_rdflib_graph()
 
         graph.bind("prov", "http://www.w3.org/ns/prov#")
@@ -109,30 +166,23 @@ class GraphViewModel:
         graph.bind("schema", "http://schema.org/")
         graph.bind("renku", "https://swissdatasciencecenter.github.io/renku-ontology/")
 
-        output = io.StringIO()
-
-        try:
-            if format == DotFormat.DEBUG:
-                rdf2dot(graph, output)
-                return output.getvalue()
+        if format == DotFormat.DEBUG:
+            rdf2dot(graph, output)
+            return
 
-            output.write('digraph { \n node [ fontname="DejaVu Sans" ] ; \n ')
+        output.write('digraph { \n node [ fontname="DejaVu Sans" ] ; \n ')
 
-            if format == DotFormat.FULL_LANDSCAPE:
-                output.write('rankdir="LR" \n')
+        if format == DotFormat.FULL_LANDSCAPE:
+            output.write('rankdir="LR" \n')
 
-            self._rdfdot_full(graph, output)
-
-            return output.getvalue()
-        finally:
-            output.close()
+        self._rdfdot_full(graph, output)
 
-    def _rdfdot_full(self, graph: Graph, output: io.TextIOBase) -> None:
+    def _rdfdot_full(self, graph: Graph, output: IO[str]) -> None:
         """Write a full Dot graph representation to output.
 
         Args:
             graph(Graph): RDFLib graph.
-            output(io.TextIOBase): The output stream to write to.
+            output(IO[str]): The output stream to write to.
         """
         types = collections.defaultdict(set)
         fields = collections.defaultdict(set)
@@ -15,12 +15,17 @@
 # limitations under the License.
 """Dataset business logic."""
 
+import base64
+import binascii
+import heapq
+import json
 import os
 import shutil
 import urllib
 from collections import defaultdict
+from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, Generator, Iterable, List, Optional, Tuple, Union, cast
 
 import patoolib
 from pydantic import validate_arguments
@@ -44,6 +49,7 @@ from renku.core.util.datetime8601 import local_now
 from renku.core.util.git import get_git_user
 from renku.core.util.metadata import prompt_for_credentials, read_credentials, store_credentials
 from renku.core.util.os import (
+    compile_path_patterns,
     create_symlink,
     delete_dataset_file,
     delete_path,
@@ -58,7 +64,6 @@ from renku.core.util.os import (
 )
 from renku.core.util.tabulate import tabulate
 from renku.core.util.urls import get_slug
-from renku.core.util.util import parallel_execute
 from renku.domain_model.constant import NO_VALUE, NON_EXISTING_ENTITY_CHECKSUM, NoValueType
 from renku.domain_model.dataset import Dataset, DatasetDetailsJson, DatasetFile, RemoteEntity, is_dataset_name_valid
 from renku.domain_model.entity import Entity
@@ -279,6 +284,9 @@ def list_dataset_files(
     creators: Optional[Union[str, List[str], Tuple[str]]] = None,
     include: Optional[List[str]] = None,
     exclude: Optional[List[str]] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    cursor: Optional[str] = None,
 ):
     """List dataset files.
 
@@ -288,6 +296,10 @@ def list_dataset_files(
         creators(Optional[Union[str, List[str], Tuple[str]]]): Creators to filter by (Default value = None).
         include(Optional[List[str]]): Include filters for file paths (Default value = None).
         exclude(Optional[List[str]]): Exclude filters for file paths (Default value = None).
+        limit(Optional[int]): Maximum number of files to return (Default value = None).
+        offset(int): Number of files to skip (Default value = 0).
+        cursor(Optional[str]): Only list files that come after the file this cursor was created for; see
+            ``get_dataset_file_cursor`` (Default value = None).
 
     Returns:
         List[DynamicProxy]: Filtered dataset files.
@@ -295,7 +307,15 @@ def list_dataset_files(
     from renku.command.format.dataset_files import get_lfs_tracking_and_file_sizes
 
     records = filter_dataset_files(
-        names=datasets, tag=tag, creators=creators, include=include, exclude=exclude, immutable=True
+        names=datasets,
+        tag=tag,
+        creators=creators,
+        include=include,
+        exclude=exclude,
+        immutable=True,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
     )
     for record in records:
         record.title = record.dataset.title
@@ -993,6 +1013,7 @@ def move_files(dataset_gateway: IDatasetGateway, files: Dict[Path, Path], to_dat
 
 def _update_datasets_files_metadata(updated_files: List[DynamicProxy], deleted_files: List[DynamicProxy], delete: bool):
     modified_datasets = {}
+    new_files: Dict[str, List[DatasetFile]] = defaultdict(list)
     checksums = project_context.repository.get_object_hashes([file.entity.path for file in updated_files])
     for file in updated_files:
         new_file = DatasetFile.from_path(
@@ -1001,7 +1022,10 @@ def _update_datasets_files_metadata(updated_files: List[DynamicProxy], deleted_f
         modified_datasets[file.dataset.name] = (
             file.dataset._subject if isinstance(file.dataset, DynamicProxy) else file.dataset
         )
-        file.dataset.add_or_update_files(new_file)
+        new_files[file.dataset.name].append(new_file)
+
+    for name, files in new_files.items():
+        modified_datasets[name].add_or_update_files(files)
 
     if delete:
         for file in deleted_files:
@@ -1053,6 +1077,9 @@ def filter_dataset_files(
     ignore: Optional[List[str]] = None,
     immutable: bool = False,
     check_data_directory: bool = False,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    cursor: Optional[str] = None,
 ) -> List[DynamicProxy]:
     """Filter dataset files by specified filters.
 
@@ -1067,24 +1094,22 @@ def filter_dataset_files(
         immutable(bool): Return immutable copies of dataset objects (Default value = False).
         check_data_directory(bool): Whether to check for new files in dataset's data directory that aren't in the
             dataset yet (Default value = False).
+        limit(Optional[int]): Maximum number of files to return (Default value = None).
+        offset(int): Number of files to skip (Default value = 0).
+        cursor(Optional[str]): Only return files that come after the file this cursor was created for
+            (Default value = None).
     Returns:
         List[DynamicProxy]: List of filtered files sorted by date added.
     """
+    is_included = compile_path_patterns(include) if include else None
+    is_excluded = compile_path_patterns(exclude) if exclude else None
 
-    def should_include(filepath: Path) -> bool:
+    def should_include(filepath: Union[Path, str]) -> bool:
         """Check if file matches one of include filters and not in exclude filter."""
-        if exclude:
-            for pattern in exclude:
-                if filepath.match(pattern):
-                    return False
-
-        if include:
-            for pattern in include:
-                if filepath.match(pattern):
-                    return True
+        if is_excluded and is_excluded(filepath):
             return False
 
-        return True
+        return is_included(filepath) if is_included else True
 
     creators_set = set()
     if isinstance(creators, str):
@@ -1092,111 +1117,179 @@ def filter_dataset_files(
     elif isinstance(creators, list) or isinstance(creators, tuple):
         creators_set = set(creators)
 
-    records = []
     unused_names = set(names) if names is not None else set()
 
     if ignore:
         unused_names = unused_names - set(ignore)
 
-    for dataset in dataset_gateway.get_all_active_datasets():
-        if (names and dataset.name not in names) or (ignore and dataset.name in ignore):
-            continue
-
-        if tag:
-            dataset = get_dataset_by_tag(dataset=dataset, tag=tag)  # type: ignore
-            if not dataset:
+    def get_files() -> Generator[Tuple[Tuple[Any, str, str], DatasetFile, Dataset, bool], None, None]:
+        """Lazily yield sort key, file, its dataset and whether the file is in the dataset for matching files."""
+        for dataset in dataset_gateway.get_all_active_datasets():
+            if (names and dataset.name not in names) or (ignore and dataset.name in ignore):
                 continue
 
-        if not immutable:
-            dataset = dataset.copy()
+            if tag:
+                dataset = get_dataset_by_tag(dataset=dataset, tag=tag)  # type: ignore
+                if not dataset:
+                    continue
 
-        if unused_names:
-            unused_names.remove(dataset.name)
+            if unused_names:
+                unused_names.remove(dataset.name)
 
-        if creators_set:
-            dataset_creators = {creator.name for creator in dataset.creators}
-            if not creators_set.issubset(dataset_creators):
-                continue
+            if creators_set:
+                dataset_creators = {creator.name for creator in dataset.creators}
+                if not creators_set.issubset(dataset_creators):
+                    continue
 
-        for file in dataset.files:
-            if not should_include(Path(file.entity.path)):
-                continue
+            # NOTE: Copy datasets only when they have matching files; all files of a dataset share the same copy
+            copied_dataset: Optional[Dataset] = None
+            copied_files: List[DatasetFile] = []
 
-            record = DynamicProxy(file)
-            record.dataset = DynamicProxy(dataset)
-            records.append(record)
+            for index, file in enumerate(dataset.files):
+                if not should_include(file.entity.path):
+                    continue
 
-        if not check_data_directory:
-            continue
+                if copied_dataset is None:
+                    copied_dataset = dataset if immutable else dataset.copy()
+                    copied_files = copied_dataset.files
+
+                file = copied_files[index]
+                yield (file.date_added, dataset.name, file.entity.path), file, copied_dataset, True
+
+            if not check_data_directory:
+                continue
 
-        for root, _, files in os.walk(project_context.path / dataset.get_datadir()):
-            current_folder = Path(root)
-            for current_file in files:
-                file_path = get_safe_relative_path(current_folder / current_file, project_context.path)
-                if should_include(file_path) and not dataset.find_file(file_path):
-                    # New file in dataset folder
-                    record = DynamicProxy(DatasetFile.from_path(file_path))
-                    record.dataset = dataset
-                    records.append(record)
+            for root, _, files in os.walk(project_context.path / dataset.get_datadir()):
+                current_folder = Path(root)
+                for current_file in files:
+                    file_path = get_safe_relative_path(current_folder / current_file, project_context.path)
+                    if should_include(file_path) and not dataset.find_file(file_path):
+                        if copied_dataset is None:
+                            copied_dataset = dataset if immutable else dataset.copy()
+
+                        # New file in dataset folder
+                        new_file = DatasetFile.from_path(file_path)
+                        # NOTE: Use modification time as date added so that listings and their cursors are stable
+                        modified_at = os.lstat(current_folder / current_file).st_mtime
+                        new_file.date_added = datetime.fromtimestamp(modified_at).astimezone()
+                        yield (new_file.date_added, dataset.name, new_file.entity.path), new_file, copied_dataset, False
+
+    matches: Iterable[Tuple[Tuple[Any, str, str], DatasetFile, Dataset, bool]] = get_files()
+    if cursor:
+        after = _parse_dataset_file_cursor(cursor)
+        matches = (m for m in matches if m[0] > after)
+
+    def sort_key(match):
+        return match[0]
+
+    if limit is not None:
+        # NOTE: Only keep the smallest ``offset + limit`` files in memory
+        selected = heapq.nsmallest(offset + limit, matches, key=sort_key)[offset:]
+    else:
+        selected = sorted(matches, key=sort_key)[offset:]
 
     if unused_names:
         unused_names_str = ", ".join(unused_names)
         raise errors.ParameterError(f"These datasets don't exist: {unused_names_str}")
 
-    return sorted(records, key=lambda r: r.date_added)
+    records = []
+    dataset_proxies: Dict[int, DynamicProxy] = {}
+
+    for _, file, dataset, in_dataset in selected:
+        record = DynamicProxy(file)
+        if in_dataset:
+            if id(dataset) not in dataset_proxies:
+                dataset_proxies[id(dataset)] = DynamicProxy(dataset)
+            record.dataset = dataset_proxies[id(dataset)]
+        else:
+            record.dataset = dataset
+        records.append(record)
+
+    return records
+
+
+def get_dataset_file_cursor(record: DynamicProxy) -> str:
+    """Return a cursor to list the dataset files that come after a file returned by ``filter_dataset_files``."""
+    key = [record.date_added.isoformat(), record.dataset.name, str(record.entity.path)]
+    return base64.urlsafe_b64encode(json.dumps(key).encode("utf-8")).decode("ascii")
+
+
+def _parse_dataset_file_cursor(cursor: str) -> Tuple[datetime, str, str]:
+    try:
+        date_added, name, path = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return datetime.fromisoformat(date_added), name, path
+    except (binascii.Error, TypeError, ValueError):
+        raise errors.ParameterError(f"Invalid cursor: {cursor}")
 
 
-def download_file(file: DatasetFile, storage: "IStorage") -> List[DatasetFile]:
-    """Download a dataset file and retrieve its missing metadata (if any).
+def download_files(files: List[DatasetFile], storage: "IStorage") -> List[DatasetFile]:
+    """Download dataset files in a batch and retrieve their missing metadata (if any).
 
     Args:
-        file(DatasetFile): Dataset file to download.
+        files(List[DatasetFile]): Dataset files to download.
         storage: Dataset's cloud storage (an instance of ``IStorage``).
 
     Returns:
-         List[DatasetFile]: A list with the updated file if its metadata was missing; an empty list otherwise.
+         List[DatasetFile]: A list of updated files whose metadata was missing.
 
     """
-    if not file.based_on:
-        raise errors.DatasetImportError(f"Dataset file doesn't have a URI: {file.entity.path}")
-
-    path = project_context.path / file.entity.path
-    path.resolve().parent.mkdir(parents=True, exist_ok=True)
+    for file in files:
+        if not file.based_on:
+            raise errors.DatasetImportError(f"Dataset file doesn't have a URI: {file.entity.path}")
 
-    # NOTE: Don't check if destination file exists. ``IStorage.copy`` won't copy a file if it exists and is not
-    # modified.
+    uris_and_destinations: List[Tuple[str, Union[Path, str]]] = [
+        (file.based_on.url, project_context.path / file.entity.path) for file in files if file.based_on
+    ]
 
-    communication.start_progress(name=file.entity.path, total=1)
+    # NOTE: Don't check if destination files exist. ``IStorage.download_many`` won't copy a file if it exists and is
+    # not modified.
+    progress_text = "Downloading dataset files"
+    communication.start_progress(name=progress_text, total=len(files))
     try:
-        storage.download(file.based_on.url, path)
-        communication.update_progress(name=file.entity.path, amount=1)
+        storage.download_many(uris_and_destinations)
+        communication.update_progress(name=progress_text, amount=len(files))
     finally:
-        communication.finalize_progress(name=file.entity.path)
+        communication.finalize_progress(name=progress_text)
 
-    # NOTE: File has no missing information
-    if file.has_valid_checksum() and file.has_valid_size():
-        return []
+    files = [f for f in files if f.based_on and (not f.has_valid_checksum() or not f.has_valid_size())]
+    # NOTE: Get metadata of files with missing information from the storage to avoid reading them again when possible
+    remote_files = storage.stat_many([f.based_on.url for f in files if f.based_on]) if files else {}
 
-    if not file.has_valid_checksum():
-        md5_hash = hash_file(path, hash_type="md5") or NON_EXISTING_ENTITY_CHECKSUM
-        entity = Entity(path=file.entity.path, checksum=md5_hash)
-        remote_entity = RemoteEntity(checksum=md5_hash, url=file.based_on.url, path=file.based_on.path)
-    else:
-        entity = file.entity
-        remote_entity = file.based_on
-
-    size = file.size if file.has_valid_size() else get_file_size(path)
-
-    return [
-        DatasetFile(
-            entity=entity,
-            based_on=remote_entity,
-            size=size,
-            date_added=file.date_added,
-            date_removed=file.date_removed,
-            source=file.source,
+    updated_files = []
+
+    for file in files:
+        based_on = cast(RemoteEntity, file.based_on)
+        path = project_context.path / file.entity.path
+        remote_file = remote_files.get(based_on.url)
+
+        if not file.has_valid_checksum():
+            md5_hash = (remote_file and remote_file.hash) or hash_file(path, hash_type="md5")
+            md5_hash = md5_hash or NON_EXISTING_ENTITY_CHECKSUM
+            entity = Entity(path=file.entity.path, checksum=md5_hash)
+            remote_entity = RemoteEntity(checksum=md5_hash, url=based_on.url, path=based_on.path)
+        else:
+            entity = file.entity
+            remote_entity = based_on
+
+        if file.has_valid_size():
+            size = file.size
+        elif remote_file and remote_file.size is not None:
+            size = remote_file.size
+        else:
+            size = get_file_size(path)
+
+        updated_files.append(
+            DatasetFile(
+                entity=entity,
+                based_on=remote_entity,
+                size=size,
+                date_added=file.date_added,
+                date_removed=file.date_removed,
+                source=file.source,
+            )
         )
-    ]
+
+    return updated_files
 
 
 @validate_arguments(config=dict(arbitrary_types_allowed=True))
@@ -1224,7 +1317,7 @@ def pull_cloud_storage(name: str, location: Optional[Path] = None) -> None:
     provider = ProviderFactory.get_pull_provider(uri=dataset.storage)
     storage = provider.get_storage()
 
-    updated_files = parallel_execute(download_file, dataset.files, rate=5, storage=storage)
+    updated_files = download_files(files=dataset.files, storage=storage)
 
     if updated_files:
         dataset.add_or_update_files(updated_files)
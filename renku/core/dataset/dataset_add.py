@@ -33,15 +33,26 @@ from renku.core.dataset.providers.local import LocalProvider
 from renku.core.dataset.providers.models import DatasetAddAction, DatasetAddMetadata
 from renku.core.interface.dataset_gateway import IDatasetGateway
 from renku.core.interface.storage import IStorage
-from renku.core.storage import check_external_storage, track_paths_in_storage
+from renku.core.storage import check_external_storage, format_lfs_pointer, track_paths_in_storage
 from renku.core.util import communication, requests
 from renku.core.util.git import get_git_user
-from renku.core.util.os import get_absolute_path, get_file_size, get_files, get_relative_path, hash_file, is_subpath
+from renku.core.util.os import (
+    FileHashes,
+    copy_and_hash_file,
+    get_absolute_path,
+    get_file_size,
+    get_files,
+    get_relative_path,
+    hash_file,
+    hash_file_all,
+    is_subpath,
+)
 from renku.core.util.urls import check_url, is_uri_subfolder, resolve_uri
-from renku.core.util.util import parallel_execute
+from renku.core.util.util import ExecutionMetrics, ResourceClass, parallel_execute
 from renku.domain_model.constant import NON_EXISTING_ENTITY_CHECKSUM
 from renku.domain_model.dataset import Dataset, DatasetFile, RemoteEntity
 from renku.domain_model.project_context import project_context
+from renku.infrastructure.repository import Repository, has_content_changing_attributes
 
 
 def add_to_dataset(
@@ -408,14 +419,23 @@ def copy_file(file: DatasetAddMetadata, dataset: Dataset, storage: Optional[ISto
             download_storage = file.provider.get_storage()
             download_storage.download(file.url, dst)
             file_to_upload = dst
+            file.hashes = hash_file_all(dst)
         elif file.action == DatasetAddAction.COPY:
-            shutil.copy(file.source, file.destination)
+            file.hashes = copy_and_hash_file(file.source, file.destination)
         elif file.action == DatasetAddAction.MOVE:
+            moved_hashes: List[FileHashes] = []
+
+            def copy_function(source, destination):
+                moved_hashes.append(copy_and_hash_file(source, destination))
+
             # NOTE: Set ``delete_source`` in case move fails due to a dataset's read-only mounted data directory
             delete_source = True
-            shutil.move(file.source, file.destination, copy_function=shutil.copy)  # type: ignore
+            shutil.move(file.source, file.destination, copy_function=copy_function)  # type: ignore
             delete_source = False
             file_to_upload = file.destination
+            # NOTE: Files that are renamed on the same filesystem aren't copied and must be read once unless their
+            # hashes were calculated when they were downloaded/extracted
+            file.hashes = moved_hashes[0] if moved_hashes else file.hashes or hash_file_all(file.destination)
         elif file.action == DatasetAddAction.SYMLINK:
             create_external_file(target=file.source, path=file.destination)
             # NOTE: Don't track symlinks to external files in LFS
@@ -434,7 +454,7 @@ def copy_file(file: DatasetAddMetadata, dataset: Dataset, storage: Optional[ISto
             raise errors.InvalidFileOperation(f"Cannot copy/move '{dst}': {e}")
 
     if file.size is None:
-        file.size = get_file_size(file_to_upload)
+        file.size = file.hashes.size if file.hashes else get_file_size(file_to_upload)
 
     if storage:
         # NOTE: Don't track files in a dataset with cloud storage in LFS
@@ -446,10 +466,13 @@ def copy_file(file: DatasetAddMetadata, dataset: Dataset, storage: Optional[ISto
             md5_hash: Optional[str] = file.based_on.checksum
         else:
             file_uri = get_upload_uri(dataset=dataset, entity_path=file.entity_path)
-            md5_hash = hash_file(file_to_upload, hash_type="md5")
+            md5_hash = file.hashes.md5 if file.hashes else hash_file(file_to_upload, hash_type="md5")
 
-            # NOTE: If dataset has a storage backend, upload the file to the remote storage.
-            storage.upload(source=file_to_upload, uri=file_uri)
+            # NOTE: If dataset has a storage backend, the file is uploaded to the remote storage along with other files
+            # in ``upload_files_to_storage``. Downloaded files are in a temporary location and are deleted afterwards.
+            file.upload_source = Path(file_to_upload)
+            file.delete_upload_source = delete_source or file.action == DatasetAddAction.DOWNLOAD
+            delete_source = False
 
         file.based_on = RemoteEntity(url=file_uri, path=file.entity_path, checksum=md5_hash)
 
@@ -459,6 +482,29 @@ def copy_file(file: DatasetAddMetadata, dataset: Dataset, storage: Optional[ISto
     return [file.destination] if track_in_lfs else []
 
 
+def upload_files_to_storage(files: List[DatasetAddMetadata], storage: IStorage):
+    """Upload files to a dataset's cloud storage in a batch."""
+    uploads: List[Tuple[Union[Path, str], str]] = [
+        (f.upload_source, f.based_on.url) for f in files if f.upload_source and f.based_on
+    ]
+    if not uploads:
+        return
+
+    uploaded = False
+    try:
+        storage.upload_many(uploads)
+        uploaded = True
+    finally:
+        for file in files:
+            # NOTE: Downloaded files are temporary and are always deleted; moved sources are kept if upload fails
+            if (
+                file.upload_source
+                and file.delete_upload_source
+                and (uploaded or file.action == DatasetAddAction.DOWNLOAD)
+            ):
+                file.upload_source.unlink(missing_ok=True)
+
+
 def copy_files_to_dataset(dataset: Dataset, files: List[DatasetAddMetadata]):
     """Copy/Move files into a dataset's directory."""
 
@@ -467,7 +513,16 @@ def copy_files_to_dataset(dataset: Dataset, files: List[DatasetAddMetadata]):
         provider = ProviderFactory.get_storage_provider(uri=dataset.storage)
         dataset_storage = provider.get_storage()
 
-    lfs_files = parallel_execute(copy_file, files, rate=5, dataset=dataset, storage=dataset_storage)
+    # NOTE: Files are uploaded to the remote storage for datasets with a storage backend
+    resource = ResourceClass.HTTP if dataset_storage else ResourceClass.LOCAL_IO
+    metrics = ExecutionMetrics()
+    lfs_files = parallel_execute(
+        copy_file, files, resource=resource, metrics=metrics, dataset=dataset, storage=dataset_storage
+    )
+    metrics.log("Copying dataset files")
+
+    if dataset_storage:
+        upload_files_to_storage(files=files, storage=dataset_storage)
 
     if lfs_files and not dataset.storage:
         track_paths_in_storage(*lfs_files)
@@ -493,18 +548,52 @@ def add_files_to_repository(dataset: Dataset, files: List[DatasetAddMetadata]):
         communication.warn("No new file was added to project")
 
 
+def get_git_checksums(files: List[DatasetAddMetadata]) -> Dict[Union[Path, str], Optional[str]]:
+    """Return Git hashes of added files and reuse hashes that were calculated while copying files if possible.
+
+    Precalculated hashes are used only when Git doesn't transform the file's content or when the transformation is
+    known (i.e. files that are tracked in Git LFS); hashes of other files are calculated by Git.
+    """
+    repository = project_context.repository
+    existing_files = [file for file in files if (project_context.path / file.entity_path).exists()]
+
+    autocrlf = str(repository.get_configuration().get_value("core", "autocrlf", "false")).lower()
+    precalculated_files = [file for file in existing_files if file.hashes] if autocrlf == "false" else []
+    attributes = repository.get_attributes(*[file.entity_path for file in precalculated_files])
+
+    checksums: Dict[Union[Path, str], Optional[str]] = {}
+
+    for file in precalculated_files:
+        hashes = cast(FileHashes, file.hashes)
+        file_attributes = attributes.get(str(file.entity_path), {})
+        is_lfs = file_attributes.get("filter") == "lfs"
+
+        if is_lfs:
+            pointer = format_lfs_pointer(oid=hashes.sha256, size=hashes.size)
+            checksums[file.entity_path] = Repository.hash_string(pointer)
+        elif not has_content_changing_attributes(file_attributes):
+            checksums[file.entity_path] = hashes.git_sha1
+
+    repo_paths: List[Union[Path, str]] = [
+        file.entity_path for file in existing_files if file.entity_path not in checksums
+    ]
+    if repo_paths:
+        checksums.update(repository.get_object_hashes(repo_paths))
+
+    return checksums
+
+
 def update_dataset_metadata(dataset: Dataset, files: List[DatasetAddMetadata], clear_files_before: bool):
     """Add newly-added files to the dataset's metadata."""
+    from renku.core.dataset.providers.web import store_remote_validators
+
     # NOTE: For datasets with cloud storage backend, we use MD5 hash as checksum instead of git hash.
     if dataset.storage:
         checksums: Dict[Union[Path, str], Optional[str]] = {
             f.entity_path: f.based_on.checksum for f in files if f.based_on
         }
     else:
-        repo_paths: List[Union[Path, str]] = [
-            file.entity_path for file in files if (project_context.path / file.entity_path).exists()
-        ]
-        checksums = project_context.repository.get_object_hashes(repo_paths)
+        checksums = get_git_checksums(files=files)
 
     dataset_files = []
 
@@ -518,6 +607,9 @@ def update_dataset_metadata(dataset: Dataset, files: List[DatasetAddMetadata], c
         )
         dataset_files.append(dataset_file)
 
+    # NOTE: Record validators of downloaded files to detect their changes without downloading them when updating
+    store_remote_validators(files=files, checksums=checksums)
+
     if clear_files_before:
         dataset.clear_files()
 
@@ -40,12 +40,12 @@ from renku.core.dataset.providers.dataverse_metadata_templates import (
     KEYWORDS_METADATA_TEMPLATE,
 )
 from renku.core.dataset.providers.doi import DOIProvider
+from renku.core.dataset.providers.export import ExportJournal, upload_files
 from renku.core.dataset.providers.repository import RepositoryImporter, make_request
 from renku.core.util import communication
 from renku.core.util.datetime8601 import fix_datetime
 from renku.core.util.doi import extract_doi, get_doi_url, is_doi
 from renku.core.util.urls import remove_credentials
-from renku.domain_model.project_context import project_context
 
 if TYPE_CHECKING:
     from renku.core.dataset.providers.models import ProviderDataset, ProviderParameter
@@ -367,23 +367,32 @@ class DataverseExporter(ExporterApi):
         """Execute export process."""
         from renku.domain_model.dataset import get_file_path_in_dataset
 
-        deposition = _DataverseDeposition(server_url=self._server_url, access_token=self._access_token)
-        metadata = self._get_dataset_metadata()
-        response = deposition.create_dataset(dataverse_name=self._dataverse_name, metadata=metadata)
-        dataset_pid = response.json()["data"]["persistentId"]
-        repository = project_context.repository
+        journal = ExportJournal(provider="dataverse", dataset=self.dataset, destination=self._server_url)
+        deposition = _DataverseDeposition(
+            server_url=self._server_url, access_token=self._access_token, dataset_pid=journal.deposition
+        )
+
+        if journal.deposition and deposition.is_draft():
+            communication.info(f"Continuing an interrupted export to {journal.deposition}")
+        else:
+            metadata = self._get_dataset_metadata()
+            deposition.create_dataset(dataverse_name=self._dataverse_name, metadata=metadata)
+            journal.start(deposition.dataset_pid)
+
+        def upload(filepath, file):
+            path_in_dataset = get_file_path_in_dataset(dataset=self.dataset, dataset_file=file)
+            deposition.upload_file(full_path=filepath, path_in_dataset=path_in_dataset)
 
-        with communication.progress("Uploading files ...", total=len(self.dataset.files)) as progressbar:
-            for file in self.dataset.files:
-                filepath = repository.copy_content_to_file(path=file.entity.path, checksum=file.entity.checksum)
-                path_in_dataset = get_file_path_in_dataset(dataset=self.dataset, dataset_file=file)
-                deposition.upload_file(full_path=filepath, path_in_dataset=path_in_dataset)
-                progressbar.update()
+        # NOTE: Dataverse locks a dataset while a file is added to it and rejects concurrent additions to the same
+        # dataset, so, files are uploaded one at a time
+        upload_files(files=self.dataset.files, journal=journal, upload=upload, max_workers=1)
 
         if self._publish:
             deposition.publish_dataset()
 
-        return dataset_pid
+        journal.remove()
+
+        return deposition.dataset_pid
 
     def _get_dataset_metadata(self):
         authors, contacts = self._get_creators()
@@ -453,6 +462,7 @@ class _DataverseDeposition:
     DATASET_CREATE_PATH = "dataverses/{dataverseName}/datasets"
     FILE_UPLOAD_PATH = "datasets/:persistentId/add"
     DATASET_PUBLISH_PATH = "datasets/:persistentId/actions/:publish"
+    DATASET_PATH = "datasets/:persistentId/"
 
     def create_dataset(self, dataverse_name, metadata):
         """Create a dataset in a given dataverse."""
@@ -468,6 +478,8 @@ class _DataverseDeposition:
 
     def upload_file(self, full_path, path_in_dataset):
         """Upload a file to a previously-created dataset."""
+        from renku.core.util import requests
+
         if self.dataset_pid is None:
             raise errors.ExportError("Dataset not created.")
 
@@ -476,13 +488,32 @@ class _DataverseDeposition:
         params = {"directoryLabel": str(path_in_dataset.parent)}
         data = dict(jsonData=json.dumps(params))
 
-        files = {"file": (path_in_dataset.name, open(full_path, "rb"))}
-
-        response = self._post(url=url, data=data, files=files)
+        # NOTE: Stream the file from disk rather than loading it in memory
+        with requests.MultipartFileStream(full_path, filename=path_in_dataset.name, fields=data) as body:
+            response = self._post(url=url, data=body, headers={"Content-Type": body.content_type})
         self._check_response(response)
 
         return response
 
+    def is_draft(self) -> bool:
+        """Return if the dataset exists and has an unpublished draft version that files can be added to."""
+        from renku.core.util import requests
+
+        if self.dataset_pid is None:
+            return False
+
+        url = self._make_url(self.DATASET_PATH, persistentId=self.dataset_pid)
+
+        try:
+            response = requests.get(url=url, headers={"X-Dataverse-key": self.access_token})
+        except errors.RequestError:
+            return False
+
+        if response.status_code != 200:
+            return False
+
+        return response.json().get("data", {}).get("latestVersion", {}).get("versionState") == "DRAFT"
+
     def publish_dataset(self):
         """Publish a previously-created dataset."""
         if self.dataset_pid is None:
@@ -504,10 +535,10 @@ class _DataverseDeposition:
         url_parts = url_parts._replace(path=path, query=query_params_str)
         return urllib.parse.urlunparse(url_parts)
 
-    def _post(self, url, json=None, data=None, files=None):
+    def _post(self, url, json=None, data=None, files=None, headers=None):
         from renku.core.util import requests
 
-        headers = {"X-Dataverse-key": self.access_token}
+        headers = {**(headers or {}), "X-Dataverse-key": self.access_token}
         try:
             return requests.post(url=url, json=json, data=data, files=files, headers=headers)
         except errors.RequestError as e:
@@ -545,7 +576,7 @@ def check_dataverse_uri(url):
     url_parts[3:6] = [""] * 3
     version_url = urlparse.urlunparse(url_parts)
 
-    response = requests.get(version_url)
+    response = requests.get_cached(version_url)
 
     if response.status_code != 200:
         return False
@@ -52,7 +52,7 @@ class DOIProvider(ProviderApi, ImportProviderInterface):
             doi = extract_doi(doi)
             url = make_doi_url(doi)
 
-            response = requests.get(url, headers=self.headers)
+            response = requests.get_cached(url, headers=self.headers)
 
             if response.status_code != 200:
                 raise LookupError(f"record not found. Status: {response.status_code}")
@@ -0,0 +1,144 @@
+# Copyright Swiss Data Science Center (SDSC). A partnership between
+# École Polytechnique Fédérale de Lausanne (EPFL) and
+# Eidgenössische Technische Hochschule Zürich (ETHZ).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Resumable export of datasets to data providers."""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from renku.core.constant import CACHE
+from renku.core.util import communication
+from renku.core.util.util import ResourceClass, parallel_execute
+from renku.domain_model.project_context import project_context
+
+if TYPE_CHECKING:
+    from renku.domain_model.dataset import Dataset, DatasetFile
+
+EXPORT_JOURNALS = "exports"
+
+
+class ExportJournal:
+    """A local record of an export's progress that is used to continue the export if it's interrupted.
+
+    The journal is a JSON-lines file in the project's cache. Its first line stores the deposition that files are
+    exported to and each following line records a file that was uploaded to it.
+    """
+
+    def __init__(self, provider: str, dataset: "Dataset", destination: str):
+        # NOTE: A dataset's id changes with each modification, so, a journal is never used for a modified dataset
+        key = json.dumps([provider, dataset.id, destination])
+        name = hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+        self.path: Path = project_context.metadata_path / CACHE / EXPORT_JOURNALS / f"{name}.jsonl"
+        self.deposition: Optional[str] = None
+        self._uploaded: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            lines = self.path.read_text().splitlines()
+        except OSError:
+            return
+
+        entries = []
+        for line in lines:
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                # NOTE: The last line is incomplete if the export was killed while writing it
+                break
+
+        if not entries or not entries[0].get("deposition"):
+            return
+
+        self.deposition = str(entries[0]["deposition"])
+        self._uploaded = {e["path"]: e["checksum"] for e in entries[1:] if "path" in e and "checksum" in e}
+
+    def start(self, deposition: Any) -> None:
+        """Start recording an export to a new deposition."""
+        with self._lock:
+            self.deposition = str(deposition)
+            self._uploaded = {}
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps({"deposition": self.deposition}) + "\n")
+
+    def is_uploaded(self, file: "DatasetFile") -> bool:
+        """Return if a file was uploaded to the deposition."""
+        return self._uploaded.get(str(file.entity.path)) == file.entity.checksum
+
+    def add(self, file: "DatasetFile") -> None:
+        """Record that a file was uploaded to the deposition."""
+        path, checksum = str(file.entity.path), file.entity.checksum
+
+        with self._lock:
+            self._uploaded[path] = checksum
+            with open(self.path, "a") as f:
+                f.write(json.dumps({"path": path, "checksum": checksum}) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    def remove(self) -> None:
+        """Remove the journal once the export is finished."""
+        self.path.unlink(missing_ok=True)
+
+
+def upload_files(
+    files: List["DatasetFile"],
+    journal: ExportJournal,
+    upload: Callable[[str, "DatasetFile"], Any],
+    max_workers: Optional[int] = None,
+) -> None:
+    """Upload dataset files concurrently and record uploaded files in the export's journal.
+
+    Files that the journal records as uploaded are skipped. Each file's content is copied to a temporary file that is
+    removed once the file is uploaded, so, disk usage is bounded by the number of concurrent uploads.
+
+    Args:
+        files(List[DatasetFile]): Dataset files to upload.
+        journal(ExportJournal): The export's journal.
+        upload(Callable[[str, DatasetFile], Any]): A function that receives the path to a file's content and the dataset
+            file and uploads it.
+        max_workers(Optional[int]): Maximum number of concurrent uploads (Default value = None).
+    """
+    remaining_files = [f for f in files if not journal.is_uploaded(f)]
+    if len(remaining_files) < len(files):
+        communication.info(f"Skipping {len(files) - len(remaining_files)} files that were uploaded previously")
+
+    repository = project_context.repository
+    progress_text = "Uploading files"
+
+    def upload_file(file: "DatasetFile") -> List[Any]:
+        path = repository.copy_content_to_file(path=file.entity.path, checksum=file.entity.checksum)
+        try:
+            upload(path, file)
+        finally:
+            os.unlink(path)
+
+        journal.add(file)
+        communication.update_progress(progress_text, amount=1)
+
+        return []
+
+    communication.start_progress(progress_text, total=len(remaining_files))
+    try:
+        parallel_execute(upload_file, remaining_files, resource=ResourceClass.HTTP, max_workers=max_workers)
+    finally:
+        communication.finalize_progress(progress_text)
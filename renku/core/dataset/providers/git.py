@@ -17,7 +17,6 @@
 
 import glob
 import os
-import shutil
 from collections import defaultdict
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Union
@@ -29,7 +28,7 @@ from renku.core.storage import pull_paths_from_storage
 from renku.core.util import communication
 from renku.core.util.git import clone_repository, get_cache_directory_for_repository
 from renku.core.util.metadata import is_linked_file
-from renku.core.util.os import delete_dataset_file, get_files, is_subpath
+from renku.core.util.os import copy_file_fast, delete_dataset_file, get_files, is_subpath
 from renku.core.util.urls import check_url, remove_credentials
 from renku.domain_model.dataset import RemoteEntity
 from renku.domain_model.project_context import project_context
@@ -240,7 +239,7 @@ class GitProvider(ProviderApi, AddProviderInterface):
                             delete_dataset_file(dst, follow_symlinks=True)
                             create_external_file(target=src.resolve(), path=dst)
                         else:
-                            shutil.copy(src, dst)
+                            copy_file_fast(src, dst)
                         file.based_on = RemoteEntity(
                             checksum=checksum, path=based_on.path, url=based_on.url  # type: ignore
                         )
@@ -19,7 +19,7 @@ import dataclasses
 import os
 from enum import Enum, auto
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, List, NamedTuple, Optional, Type
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Type
 
 from humanize import naturalsize
 from marshmallow import EXCLUDE
@@ -30,6 +30,7 @@ from renku.infrastructure.immutable import DynamicProxy
 
 if TYPE_CHECKING:
     from renku.core.dataset.providers.api import StorageProviderInterface
+    from renku.core.util.os import FileHashes
     from renku.domain_model.dataset import DatasetTag, RemoteEntity
 
 
@@ -64,6 +65,10 @@ class DatasetAddMetadata:
     provider: Optional["StorageProviderInterface"] = None
     based_on: Optional["RemoteEntity"] = None
     size: Optional[int] = None
+    hashes: Optional["FileHashes"] = None  # NOTE: Calculated while copying/downloading the file
+    remote_validators: Optional[Dict[str, str]] = None  # NOTE: ETag/Last-Modified/Content-Length of a downloaded file
+    upload_source: Optional[Path] = None  # NOTE: Local file to upload to dataset's cloud storage
+    delete_upload_source: bool = False  # NOTE: Whether to delete ``upload_source`` once it's uploaded
 
     @property
     def has_action(self) -> bool:
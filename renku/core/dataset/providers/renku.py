@@ -23,6 +23,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from renku.core import errors
+from renku.core.constant import RENKU_HOME
 from renku.core.dataset.datasets_provenance import DatasetsProvenance
 from renku.core.dataset.providers.api import ImporterApi, ImportProviderInterface, ProviderApi, ProviderPriority
 from renku.core.login import read_renku_token
@@ -182,7 +183,7 @@ class RenkuProvider(ProviderApi, ImportProviderInterface):
             url = url.replace("/knowledge-graph/", "/api/kg/")
 
         try:
-            response = requests.get(url, headers=self._authorization_header)
+            response = requests.get_cached(url, headers=self._authorization_header)
         except errors.RequestError as e:
             raise errors.OperationError(f"Cannot access knowledge graph: {url}") from e
 
@@ -345,19 +346,14 @@ class RenkuImporter(ImporterApi):
         else:  # NOTE: Renku dataset import with a tag
             content_path_root = make_project_temp_dir(project_context.path)
             content_path_root.mkdir(parents=True, exist_ok=True)
-            filename = 1
+            content_paths = [content_path_root / str(filename) for filename in range(1, len(sources) + 1)]
 
-            for file, checksum in zip(sources, checksums):  # type: ignore
-                content_path = content_path_root / str(filename)
-                filename += 1
-
-                try:
-                    remote_repository.copy_content_to_file(  # type: ignore
-                        path=file, checksum=checksum, output_path=content_path
-                    )
-                except errors.FileNotFound:
-                    raise errors.FileNotFound(f"Cannot find '{file}' with hash '{checksum}' in the remote project")
+            # NOTE: Copy all files at once to avoid running Git/Git LFS commands for each file
+            remote_repository.copy_contents_to_files(  # type: ignore
+                paths=sources, checksums=checksums, output_paths=content_paths
+            )
 
+            for file, checksum, content_path in zip(sources, checksums, content_paths):  # type: ignore
                 add_file(file, content_path=content_path, checksum=checksum)
 
         duplicates = [v for v in new_files.values() if len(v) > 1]
@@ -467,6 +463,9 @@ class RenkuImporter(ImporterApi):
                     depth=None,
                     reuse_existing_repository=True,
                     use_renku_credentials=True,
+                    # NOTE: Fetch file contents on demand and only check out metadata until the dataset is known
+                    clone_filter="blob:none",
+                    sparse_paths=[RENKU_HOME],
                 )
             except errors.GitError:
                 pass
@@ -503,6 +502,12 @@ class RenkuImporter(ImporterApi):
             assert dataset is not None
             provider_dataset = ProviderDataset.from_dataset(dataset)
 
+            remote_repository.add_sparse_checkout_paths(
+                *_get_top_level_directories(
+                    [dataset.get_datadir(), *(Path(f.entity.path).parent for f in dataset.files)]
+                )
+            )
+
             # NOTE: Set the dataset version to the given tag (to reset the version if no tag was provided)
             provider_dataset.version = self._tag
             # NOTE: Store the tag so that it can be checked later to see if a tag was specified for import
@@ -541,3 +546,14 @@ class RenkuImporter(ImporterApi):
             )
         finally:
             communication.enable()
+
+
+def _get_top_level_directories(paths: List[Path]) -> List[str]:
+    """Return directories without their subdirectories and the project's root."""
+    directories: List[Path] = []
+
+    for path in sorted(set(paths) - {Path(".")}, key=lambda p: len(p.parts)):
+        if not any(d in path.parents for d in directories):
+            directories.append(path)
+
+    return [str(d) for d in directories]
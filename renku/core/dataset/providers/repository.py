@@ -34,9 +34,9 @@ class RepositoryImporter(ImporterApi, abc.ABC):
         """Download dataset files from the remote provider."""
         from renku.core.dataset.providers.web import download_files
 
-        urls, names = zip(*[(f.source, f.filename) for f in self.provider_dataset_files])
+        urls, names, checksums = zip(*[(f.source, f.filename, f.checksum) for f in self.provider_dataset_files])
 
-        return download_files(urls=urls, destination=destination, names=names, extract=extract)
+        return download_files(urls=urls, destination=destination, names=names, extract=extract, checksums=checksums)
 
     def tag_dataset(self, name: str) -> None:
         """Create a tag for the dataset ``name`` if the remote dataset has a tag/version."""
@@ -58,7 +58,7 @@ def make_request(url, accept: str = "application/json"):
     """Execute network request."""
     from renku.core.util import requests
 
-    response = requests.get(url, headers={"Accept": accept})
+    response = requests.get_cached(url, headers={"Accept": accept})
     if response.status_code != 200:
         raise LookupError(f"record not found. Status: {response.status_code}")
 
@@ -15,25 +15,30 @@
 # limitations under the License.
 """Web dataset provider."""
 
+import json
+import os
 import urllib
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union
 from urllib.parse import urlparse
 
 from renku.core import errors
 from renku.core.constant import CACHE
-from renku.core.dataset.dataset_add import copy_file
+from renku.core.dataset.dataset_add import copy_file, get_git_checksums
 from renku.core.dataset.providers.api import AddProviderInterface, ProviderApi, ProviderPriority
 from renku.core.util import communication
-from renku.core.util.os import delete_dataset_file
+from renku.core.util.os import FileHashes, delete_dataset_file
 from renku.core.util.urls import check_url, remove_credentials
-from renku.core.util.util import parallel_execute
+from renku.core.util.util import ExecutionMetrics, ResourceClass, parallel_execute
 from renku.domain_model.project_context import project_context
 from renku.infrastructure.immutable import DynamicProxy
 
 if TYPE_CHECKING:
     from renku.core.dataset.providers.models import DatasetAddMetadata, DatasetUpdateMetadata
 
+# NOTE: File in the cache directory that stores ETag/Last-Modified/Content-Length of downloaded files
+REMOTE_VALIDATORS = "remote-validators.json"
+
 
 class WebProvider(ProviderApi, AddProviderInterface):
     """A provider for downloading data from web URLs."""
@@ -91,10 +96,13 @@ class WebProvider(ProviderApi, AddProviderInterface):
         download_cache: Dict[str, DatasetAddMetadata] = {}
         potential_updates: List[Tuple[DatasetAddMetadata, DynamicProxy]] = []
 
+        # NOTE: Only download files whose source changed or that cannot be checked without downloading them
+        unchanged_sources = _get_unchanged_sources(files)
+
         try:
             communication.start_progress(progress_text, len(files))
             for file in files:
-                if not file.source:
+                if not file.source or file.source in unchanged_sources:
                     continue
                 destination = project_context.path / file.dataset.get_datadir()
                 try:
@@ -141,14 +149,111 @@ class WebProvider(ProviderApi, AddProviderInterface):
         hashes = project_context.repository.get_object_hashes(check_paths)
         project_context.repository.remove(*check_paths, index=True)
 
+        updated_files: List[DatasetAddMetadata] = []
+        unchanged_files: List[DatasetAddMetadata] = []
+        checksums: Dict[Union[Path, str], Optional[str]] = {}
+
         for metadata, file in potential_updates:
             if file.entity.checksum != hashes.get(metadata.source):
                 results.append(DatasetUpdateMetadata(entity=file, action=DatasetUpdateAction.UPDATE))
                 if not dry_run:
                     copy_file(metadata, file.dataset, storage=None)
+                    updated_files.append(metadata)
+            else:
+                unchanged_files.append(metadata)
+                checksums[metadata.entity_path] = file.entity.checksum
+
+        checksums.update(get_git_checksums(updated_files))
+        store_remote_validators(files=updated_files + unchanged_files, checksums=checksums)
+
         return results
 
 
+def _get_remote_validators_path() -> Path:
+    return project_context.metadata_path / CACHE / REMOTE_VALIDATORS
+
+
+def read_remote_validators() -> Dict[str, Dict[str, Any]]:
+    """Return recorded validators of downloaded files keyed by their path in the project."""
+    try:
+        return json.loads(_get_remote_validators_path().read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def store_remote_validators(
+    files: List["DatasetAddMetadata"], checksums: Dict[Union[Path, str], Optional[str]]
+) -> None:
+    """Record validators of downloaded files so that updates can be detected without downloading the files again.
+
+    Args:
+        files(List[DatasetAddMetadata]): Downloaded files.
+        checksums(Dict[Union[Path, str], Optional[str]]): Checksum of each file in the project keyed by its entity path.
+    """
+    remote_validators = {}
+    for file in files:
+        checksum = checksums.get(file.entity_path)
+        if file.remote_validators and checksum:
+            remote_validators[str(file.entity_path)] = {
+                "source": file.url,
+                "checksum": checksum,
+                "validators": file.remote_validators,
+            }
+
+    if not remote_validators:
+        return
+
+    all_validators = read_remote_validators()
+    all_validators.update(remote_validators)
+
+    path = _get_remote_validators_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path = path.with_name(f"{path.name}.{os.getpid()}")
+    temporary_path.write_text(json.dumps(all_validators))
+    os.replace(temporary_path, path)
+
+
+def _get_unchanged_sources(files: List[DynamicProxy]) -> Set[str]:
+    """Return sources that didn't change since their files were downloaded by checking recorded validators in parallel.
+
+    A source is checked only if validators of all its files are recorded and the files weren't changed afterwards.
+    """
+    recorded_validators = read_remote_validators()
+    validators: Dict[str, Dict[str, str]] = {}
+    unverifiable_sources: Set[str] = set()
+
+    for file in files:
+        if not file.source:
+            continue
+
+        entry = recorded_validators.get(file.entity.path)
+        if entry and entry.get("source") == file.source and entry.get("checksum") == file.entity.checksum:
+            validators.setdefault(file.source, entry["validators"])
+        else:
+            unverifiable_sources.add(file.source)
+
+    sources = [source for source in validators if source not in unverifiable_sources]
+    if not sources:
+        return set()
+
+    unchanged_sources = parallel_execute(
+        _check_unchanged_source,
+        sources,
+        [validators[source] for source in sources],
+        resource=ResourceClass.HTTP,
+        get_host=lambda url, *_: urlparse(url).netloc,
+    )
+
+    return set(unchanged_sources)
+
+
+def _check_unchanged_source(source: str, validators: Dict[str, str]) -> List[str]:
+    """Return ``source`` in a list if it's not modified."""
+    from renku.core.util import requests
+
+    return [source] if requests.is_modified(source, validators) is False else []
+
+
 def _ensure_dropbox(url):
     """Ensure dropbox url is set for file download."""
     if not isinstance(url, urllib.parse.ParseResult):
@@ -180,6 +285,7 @@ def _provider_check(url):
 def download_file(
     uri: str,
     filename: Optional[str] = None,
+    checksum: Optional[str] = None,
     *,
     project_path: Path,
     destination: Path,
@@ -192,13 +298,22 @@ def download_file(
 
     uri = requests.get_redirect_url(uri)  # TODO: Check that this is not duplicate
     uri = _provider_check(uri)
-
     with project_context.with_path(project_path):
+        hashes: Dict[Path, Optional[FileHashes]] = {}
         try:
-            # NOTE: If execution time was less than the delay, block the request until delay seconds are passed
-            tmp_root, paths = requests.download_file(
-                base_directory=project_context.metadata_path / CACHE, url=uri, filename=filename, extract=extract
-            )
+            if extract:
+                tmp_root, hashes, remote_validators = requests.download_and_extract(
+                    base_directory=project_context.metadata_path / CACHE, url=uri, filename=filename, checksum=checksum
+                )
+                paths = list(hashes)
+            else:
+                tmp_root, paths, remote_validators = requests.download_file(
+                    base_directory=project_context.metadata_path / CACHE,
+                    url=uri,
+                    filename=filename,
+                    extract=False,
+                    checksum=checksum,
+                )
         except errors.RequestError as e:  # pragma nocover
             raise errors.OperationError(f"Cannot download from {uri}") from e
 
@@ -211,7 +326,7 @@ def download_file(
         elif len(paths) == 1:
             tmp_root = paths[0].parent if destination.exists() else paths[0]
 
-        paths = [(src, destination / src.relative_to(tmp_root)) for src in paths if not src.is_dir()]
+        files = [(src, destination / src.relative_to(tmp_root)) for src in paths if not src.is_dir()]
 
         return [
             DatasetAddMetadata(
@@ -220,28 +335,55 @@ def download_file(
                 action=DatasetAddAction.MOVE,
                 source=src,
                 destination=dst,
+                hashes=hashes.get(src),
+                remote_validators=remote_validators or None,
             )
-            for src, dst in paths
+            for src, dst in files
         ]
 
 
 def download_files(
-    urls: Tuple[str, ...], destination: Path, names: Tuple[str, ...], extract: bool
+    urls: Tuple[str, ...],
+    destination: Path,
+    names: Tuple[str, ...],
+    extract: bool,
+    checksums: Optional[Tuple[Optional[str], ...]] = None,
 ) -> List["DatasetAddMetadata"]:
-    """Download multiple files and return their metadata."""
+    """Download multiple files and return their metadata.
+
+    Args:
+        urls(Tuple[str, ...]): URLs to download.
+        destination(Path): Directory to download files into.
+        names(Tuple[str, ...]): Name of each downloaded file.
+        extract(bool): Whether to extract archives.
+        checksums(Optional[Tuple[Optional[str], ...]]): Expected checksum of each file in ``<algorithm>:<value>``
+            form to verify downloads (Default value = None).
+
+    Returns:
+        List[DatasetAddMetadata]: Metadata of downloaded files.
+    """
     assert len(urls) == len(names), f"Number of URL and names don't match {len(urls)} != {len(names)}"
+    checksums = checksums or tuple([None] * len(urls))
 
     if destination.exists() and not destination.is_dir():
         raise errors.ParameterError(f"Destination is not a directory: '{destination}'")
 
     destination.mkdir(parents=True, exist_ok=True)
 
-    return parallel_execute(
+    metrics = ExecutionMetrics()
+    files = parallel_execute(
         download_file,
         urls,
         names,
+        checksums,
+        resource=ResourceClass.HTTP,
+        get_host=lambda url, *_: urlparse(url).netloc,
+        metrics=metrics,
         project_path=project_context.path,
         destination=destination,
         extract=extract,
         multiple=True,
     )
+    metrics.log("Downloading files")
+
+    return files
@@ -31,11 +31,11 @@ from renku.core.dataset.providers.api import (
     ProviderApi,
     ProviderPriority,
 )
+from renku.core.dataset.providers.export import ExportJournal, upload_files
 from renku.core.dataset.providers.repository import RepositoryImporter, make_request
 from renku.core.util import communication
 from renku.core.util.doi import is_doi
 from renku.core.util.urls import remove_credentials
-from renku.domain_model.project_context import project_context
 
 if TYPE_CHECKING:
     from renku.core.dataset.providers.models import ProviderDataset, ProviderParameter
@@ -361,27 +361,35 @@ class ZenodoExporter(ExporterApi):
 
     def export(self, **kwargs):
         """Execute entire export process."""
-        # Step 1. Create new deposition
-        deposition = ZenodoDeposition(exporter=self)
+        journal = ExportJournal(provider="zenodo", dataset=self.dataset, destination=self.zenodo_url)
+
+        # Step 1. Create new deposition or continue an interrupted export
+        deposition = ZenodoDeposition(exporter=self, id=journal.deposition)
+        if str(deposition.id) != journal.deposition:
+            journal.start(deposition.id)
+        else:
+            communication.info(f"Continuing an interrupted export to {deposition.deposit_at}")
 
         # Step 2. Attach metadata to deposition
         deposition.attach_metadata(self.dataset, self._tag)
 
         # Step 3. Upload all files to created deposition
-        with communication.progress("Uploading files ...", total=len(self.dataset.files)) as progressbar:
-            for file in self.dataset.files:
-                filepath = project_context.repository.copy_content_to_file(
-                    path=file.entity.path, checksum=file.entity.checksum
-                )
-                deposition.upload_file(filepath, path_in_repo=file.entity.path)
-                progressbar.update()
+        upload_files(
+            files=self.dataset.files,
+            journal=journal,
+            upload=lambda path, file: deposition.upload_file(path, path_in_repo=file.entity.path),
+        )
 
         # Step 4. Publish newly created deposition
         if self._publish:
             deposition.publish_deposition()
-            return deposition.published_at
+            destination = deposition.published_at
+        else:
+            destination = deposition.deposit_at
+
+        journal.remove()
 
-        return deposition.deposit_at
+        return destination
 
 
 class ZenodoDeposition:
@@ -391,8 +399,13 @@ class ZenodoDeposition:
         self.exporter = exporter
         self.id = id
 
-        response = self.new_deposition()
+        response = self.get_deposition() if id is not None else None
+        # NOTE: Only continue exporting to an existing deposition if it's not published
+        if response is None or response.json().get("submitted", True):
+            response = self.new_deposition()
+
         self.id = response.json()["id"]
+        self.bucket_url: Optional[str] = response.json().get("links", {}).get("bucket")
 
     @property
     def publish_url(self):
@@ -454,15 +467,40 @@ class ZenodoDeposition:
 
         return response
 
+    def get_deposition(self):
+        """Get an existing deposition on Zenodo; return ``None`` if it cannot be accessed."""
+        from renku.core.util import requests
+
+        try:
+            response = requests.get(url=self.attach_metadata_url, params=self.exporter.default_params)
+        except errors.RequestError:
+            return None
+
+        return response if response.status_code == 200 else None
+
     def upload_file(self, filepath, path_in_repo):
         """Upload and attach a file to existing deposition on Zenodo."""
         from renku.core.util import requests
 
-        request_payload = {"filename": Path(path_in_repo).name}
-        file = {"file": (Path(path_in_repo).name, open(str(filepath), "rb"))}
-        response = requests.post(
-            url=self.upload_file_url, params=self.exporter.default_params, data=request_payload, files=file
-        )
+        filename = Path(path_in_repo).name
+
+        # NOTE: Files are streamed from disk rather than being loaded in memory
+        if self.bucket_url:
+            with open(filepath, "rb") as file:
+                response = requests.put(
+                    url=f"{self.bucket_url}/{urllib.parse.quote(filename)}",
+                    params=self.exporter.default_params,
+                    data=file,
+                    headers={"Content-Type": "application/octet-stream"},
+                )
+        else:
+            with requests.MultipartFileStream(filepath, filename=filename, fields={"filename": filename}) as body:
+                response = requests.post(
+                    url=self.upload_file_url,
+                    params=self.exporter.default_params,
+                    data=body,
+                    headers={"Content-Type": body.content_type},
+                )
         self._check_response(response)
 
         return response
@@ -19,7 +19,9 @@
 import abc
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+
+from renku.core import errors
 
 if TYPE_CHECKING:
     from renku.core.dataset.providers.api import CloudStorageProviderType, ProviderCredentials
@@ -95,6 +97,14 @@ class IStorage(abc.ABC):
         """Download data from ``uri`` to ``destination``."""
         raise NotImplementedError
 
+    def download_many(self, uris_and_destinations: List[Tuple[str, Union[Path, str]]]) -> None:
+        """Download data from a list of ``(uri, destination)`` pairs.
+
+        Storage implementations should override this to transfer all files with a single operation.
+        """
+        for uri, destination in uris_and_destinations:
+            self.download(uri, destination)
+
     @abc.abstractmethod
     def exists(self, uri: str) -> bool:
         """Checks if a remote storage URI exists."""
@@ -120,7 +130,37 @@ class IStorage(abc.ABC):
         """Mount the provider's URI to the given path."""
         raise NotImplementedError
 
+    def stat_many(self, uris: List[str], hash_type: str = "md5") -> Dict[str, Optional[FileHash]]:
+        """Get size and hash of files at a list of URIs.
+
+        Storage implementations should override this to get information of all files with a single operation.
+
+        Args:
+            uris(List[str]): URIs of files.
+            hash_type(str): Type of hash to get (Default value = ``md5``).
+
+        Returns:
+            Dict[str, Optional[FileHash]]: A mapping from each URI to its information or ``None`` if it doesn't exist.
+        """
+        result: Dict[str, Optional[FileHash]] = {}
+        for uri in uris:
+            try:
+                hashes = self.get_hashes(uri=uri, hash_type=hash_type)
+            except (errors.StorageObjectNotFound, errors.ParameterError):
+                hashes = []
+            result[uri] = next((h for h in hashes if h.uri == uri), None)
+
+        return result
+
     @abc.abstractmethod
     def upload(self, source: Union[Path, str], uri: str) -> None:
         """Upload data from ``source`` to ``uri``."""
         raise NotImplementedError
+
+    def upload_many(self, sources_and_uris: List[Tuple[Union[Path, str], str]]) -> None:
+        """Upload data from a list of ``(source, uri)`` pairs.
+
+        Storage implementations should override this to transfer all files with a single operation.
+        """
+        for source, uri in sources_and_uris:
+            self.upload(source, uri)
@@ -16,6 +16,7 @@
 """Logic for handling a data storage."""
 
 import functools
+import hashlib
 import itertools
 import os
 import re
@@ -23,9 +24,9 @@ import shlex
 import tempfile
 from collections import defaultdict
 from pathlib import Path
-from shutil import move, which
+from shutil import which
 from subprocess import PIPE, STDOUT, check_output, run
-from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, List, Optional, Set, Tuple, Union
 
 import pathspec
 
@@ -47,8 +48,6 @@ _CMD_STORAGE_TRACK = ["git", "lfs", "track", "--"]
 
 _CMD_STORAGE_UNTRACK = ["git", "lfs", "untrack", "--"]
 
-_CMD_STORAGE_CLEAN = ["git", "lfs", "clean"]
-
 _CMD_STORAGE_CHECKOUT = ["git", "lfs", "checkout"]
 
 _CMD_STORAGE_PULL = ["git", "lfs", "pull", "-I"]
@@ -63,6 +62,8 @@ _CMD_STORAGE_STATUS = ["git", "lfs", "status"]
 
 _LFS_HEADER = "version https://git-lfs.github.com/spec/"
 
+_LFS_HASH_BLOCK_SIZE = 1024 * 1024
+
 
 class RenkuGitWildMatchPattern(pathspec.patterns.GitWildMatchPattern):
     """Custom GitWildMatchPattern matcher."""
@@ -306,17 +307,73 @@ def pull_paths_from_storage(repository: "Repository", *paths: Union[Path, str]):
             raise errors.GitLFSError(f"Cannot pull LFS objects from server:\n {result.stdout}")
 
 
+def get_lfs_pointer(path: Union[Path, str]) -> Tuple[str, int]:
+    """Compute the LFS object id and size of a file in-process without running ``git lfs clean``.
+
+    Args:
+        path(Union[Path, str]): Path of the file.
+
+    Returns:
+        Tuple[str, int]: The sha256 object id and the size of the file.
+    """
+    hash_value = hashlib.sha256()
+    size = 0
+
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(_LFS_HASH_BLOCK_SIZE), b""):
+            hash_value.update(block)
+            size += len(block)
+
+    return hash_value.hexdigest(), size
+
+
+def format_lfs_pointer(oid: str, size: int) -> str:
+    """Return content of an LFS pointer file."""
+    return f"{_LFS_HEADER}v1\noid sha256:{oid}\nsize {size}\n"
+
+
+def _parse_lfs_pointer_oid(content: Optional[bytes]) -> Optional[str]:
+    """Return the object id from an LFS pointer file's content or None if content isn't an LFS pointer."""
+    if not content or not content.startswith(_LFS_HEADER.encode("utf-8")):
+        return None
+
+    for line in content.decode("utf-8", errors="replace").splitlines():
+        if line.startswith("oid sha256:"):
+            return line.split(":", 1)[1].strip()
+
+    return None
+
+
+def _get_lfs_object_path(oid: str) -> Path:
+    """Return path of an object in the local LFS cache."""
+    return project_context.path / ".git" / "lfs" / "objects" / oid[:2] / oid[2:4] / oid
+
+
 @check_external_storage_wrapper
-def clean_storage_cache(*check_paths: Union[Path, str]) -> Tuple[List[str], List[str]]:
-    """Remove paths from lfs cache."""
-    project_dict = defaultdict(list)
-    repositories: Dict[Path, "Repository"] = {}
-    tracked_paths: Dict[Path, List[Path]] = {}
-    unpushed_paths: Dict[Path, List[Path]] = {}
+def clean_storage_cache(
+    *check_paths: Union[Path, str], target_size: Optional[int] = None
+) -> Tuple[List[str], List[str], int]:
+    """Remove paths from lfs cache.
+
+    LFS pointers are computed in-process and committed pointers are read in a single batch, so no subprocess is spawned
+    per file.
+
+    Args:
+        check_paths(Union[Path, str]): Paths to clean.
+        target_size(Optional[int]): If set, only clean least recently accessed files until at least this many bytes are
+            reclaimed (Default value = None).
+
+    Returns:
+        Tuple[List[str], List[str], int]: Paths not tracked in LFS, paths that are only available locally, and number of
+            reclaimed bytes.
+    """
+    repository = project_context.repository
+
+    tracked_paths: Optional[Set[Path]] = None
+    unpushed_paths: Optional[Set[Path]] = None
     untracked_paths: List[str] = []
     local_only_paths: List[str] = []
-
-    repository = project_context.repository
+    candidates: List[str] = []
 
     for path in expand_directories(check_paths):
         current_repository, _, path = get_in_submodules(repository=repository, commit=repository.head.commit, path=path)
@@ -326,61 +383,74 @@ def clean_storage_cache(*check_paths: Union[Path, str]) -> Tuple[List[str], List
         except ValueError:  # An external file
             continue
 
-        if project_context.path not in tracked_paths:
-            tracked_paths[project_context.path] = list_tracked_paths()
+        if tracked_paths is None:
+            tracked_paths = set(list_tracked_paths())
 
-        if project_context.path not in unpushed_paths:
-            u_paths = list_unpushed_lfs_paths(current_repository)
-            unpushed_paths[project_context.path] = u_paths
+        if unpushed_paths is None:
+            unpushed_paths = set(list_unpushed_lfs_paths(current_repository))
 
-        if absolute_path in unpushed_paths[project_context.path]:
+        if absolute_path in unpushed_paths:
             local_only_paths.append(str(relative_path))
-        elif absolute_path not in tracked_paths[project_context.path]:
+        elif absolute_path not in tracked_paths:
             untracked_paths.append(str(relative_path))
         else:
-            project_dict[project_context.path].append(str(relative_path))
-            repositories[project_context.path] = current_repository
-
-    for project_path, paths in project_dict.items():
-        current_repository = repositories[project_path]
-
-        for path in paths:
-            with open(path) as tracked_file:
-                try:
-                    header = tracked_file.read(len(_LFS_HEADER))
-                    if header == _LFS_HEADER:
-                        # file is not pulled
-                        continue
-                except UnicodeDecodeError:
-                    # likely a binary file, not lfs pointer file
-                    pass
-            with tempfile.NamedTemporaryFile(mode="w+t", encoding="utf-8", delete=False) as tmp, open(
-                path, "r+t"
-            ) as input_file:
-                result = run(_CMD_STORAGE_CLEAN, cwd=project_path, stdin=input_file, stdout=tmp, text=True)
-
-                if result.returncode != 0:
-                    raise errors.GitLFSError(f"Error executing 'git lfs clean: \n {result.stdout}")
-
-                tmp_path = tmp.name
-            move(tmp_path, path)
-
-            # get lfs sha hash
-            old_pointer = current_repository.get_raw_content(path=path, revision="HEAD")
-            old_pointer = old_pointer.splitlines()[1]
-            old_pointer = old_pointer.split(" ")[1].split(":")[1]
-
-            prefix1 = old_pointer[:2]
-            prefix2 = old_pointer[2:4]
-
-            # remove from lfs cache
-            object_path = project_context.path / ".git" / "lfs" / "objects" / prefix1 / prefix2 / old_pointer
+            candidates.append(str(relative_path))
+
+    if not candidates:
+        return untracked_paths, local_only_paths, 0
+
+    committed_pointers = repository.get_raw_contents(paths=candidates, revision="HEAD")
+
+    files: List[Tuple[str, os.stat_result]] = []
+    for path in candidates:
+        absolute_path = project_context.path / path
+        with open(absolute_path, "rb") as tracked_file:
+            if tracked_file.read(len(_LFS_HEADER)) == _LFS_HEADER.encode("utf-8"):
+                # NOTE: File is not pulled
+                continue
+        files.append((path, absolute_path.stat()))
+
+    if target_size is not None:
+        # NOTE: Evict least recently accessed files first
+        files.sort(key=lambda f: f[1].st_atime)
+
+    cleaned_paths: List[str] = []
+    reclaimed_size = 0
+
+    for path, stat in files:
+        if target_size is not None and reclaimed_size >= target_size:
+            break
+
+        absolute_path = project_context.path / path
+        oid, size = get_lfs_pointer(absolute_path)
+
+        if oid != _parse_lfs_pointer_oid(committed_pointers.get(path)):
+            # NOTE: File was modified after the last commit, so its content is only available locally
+            local_only_paths.append(path)
+            continue
+
+        pointer = format_lfs_pointer(oid=oid, size=size)
+        with tempfile.NamedTemporaryFile(mode="w+t", encoding="utf-8", dir=absolute_path.parent, delete=False) as tmp:
+            tmp.write(pointer)
+        os.chmod(tmp.name, stat.st_mode & 0o777)
+        os.replace(tmp.name, absolute_path)
+
+        reclaimed_size += size - len(pointer)
+
+        object_path = _get_lfs_object_path(oid)
+        try:
+            reclaimed_size += object_path.stat().st_size
             object_path.unlink()
+        except FileNotFoundError:
+            pass
+
+        cleaned_paths.append(path)
 
-        # add paths so they don't show as modified
-        current_repository.add(*paths)
+    if cleaned_paths:
+        # NOTE: Add paths so they don't show as modified
+        repository.add(*cleaned_paths)
 
-    return untracked_paths, local_only_paths
+    return untracked_paths, local_only_paths, reclaimed_size
 
 
 @check_external_storage_wrapper
@@ -0,0 +1,163 @@
+# Copyright Swiss Data Science Center (SDSC). A partnership between
+# École Polytechnique Fédérale de Lausanne (EPFL) and
+# Eidgenössische Technische Hochschule Zürich (ETHZ).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Extract archives and calculate hashes of their members while extracting."""
+
+import tarfile
+import zipfile
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional, Union, cast
+
+from renku.core import errors
+from renku.core.util.os import FileHashes, copy_file_fast, is_subpath, write_and_hash_file
+
+TAR_EXTENSIONS = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz", ".tbz2", ".tar.xz", ".txz")
+
+ZIP_EXTENSIONS = (".zip",)
+
+
+def get_archive_type(filename: Optional[str]) -> Optional[str]:
+    """Return ``tar`` or ``zip`` if a file can be extracted by this module based on its name."""
+    if not filename:
+        return None
+
+    filename = filename.lower()
+
+    if filename.endswith(TAR_EXTENSIONS):
+        return "tar"
+    elif filename.endswith(ZIP_EXTENSIONS):
+        return "zip"
+
+    return None
+
+
+def _get_member_path(destination: Path, name: str) -> Path:
+    """Return the path of an archive's member and make sure that it's inside ``destination``."""
+    path = (destination / name).resolve()
+
+    if not is_subpath(path, destination) or path == destination:
+        raise errors.OperationError(f"Archive member '{name}' is outside of the extraction directory")
+
+    return path
+
+
+def extract_tar_stream(fileobj: BinaryIO, destination: Union[Path, str]) -> Dict[Path, FileHashes]:
+    """Extract a (compressed) tar archive from a non-seekable stream.
+
+    Members are read sequentially so that the archive is extracted while it's being read and it's never stored on disk.
+    Hard and symbolic links to files in the archive are extracted as copies of their targets; other links and special
+    files are skipped.
+
+    Args:
+        fileobj(BinaryIO): Stream to read the archive from.
+        destination(Union[Path, str]): Directory to extract the archive into.
+
+    Returns:
+        Dict[Path, FileHashes]: Extracted files and their hashes.
+    """
+    destination = Path(destination).resolve()
+    hashes: Dict[Path, FileHashes] = {}
+    links: List[tarfile.TarInfo] = []
+
+    with tarfile.open(fileobj=fileobj, mode="r|*") as archive:
+        for member in archive:
+            if member.islnk() or member.issym():
+                # NOTE: A link's target might come later in the stream, so links are extracted after all files
+                links.append(member)
+                continue
+            elif not member.isfile() and not member.isdir():
+                continue
+
+            path = _get_member_path(destination, member.name)
+
+            if member.isdir():
+                path.mkdir(parents=True, exist_ok=True)
+                continue
+
+            path.parent.mkdir(parents=True, exist_ok=True)
+            source = archive.extractfile(member)
+            assert source is not None, f"Cannot read archive member '{member.name}'"
+            hashes[path] = write_and_hash_file(cast(BinaryIO, source), path, size=member.size)
+
+            if member.mode & 0o111:
+                path.chmod(path.stat().st_mode | 0o111)
+
+    _extract_tar_links(links, destination, hashes)
+
+    return hashes
+
+
+def _extract_tar_links(links: List[tarfile.TarInfo], destination: Path, hashes: Dict[Path, FileHashes]) -> None:
+    """Copy the targets of links in a tar archive to the links' paths and add them to ``hashes``.
+
+    Only links to files that were extracted from the archive are resolved; this keeps their targets inside
+    ``destination``. Links that point to other links are resolved once their target is extracted.
+    """
+    from renku.core.util import communication
+
+    pending = links
+    while pending:
+        unresolved = []
+
+        for member in pending:
+            path = _get_member_path(destination, member.name)
+            # NOTE: Hard links are relative to the archive's root and symbolic links to their own directory
+            target = (destination / member.linkname if member.islnk() else path.parent / member.linkname).resolve()
+
+            if target not in hashes or path.is_dir():
+                unresolved.append(member)
+                continue
+
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # NOTE: Hard links in the archive are extracted as hard links if the filesystem supports them
+            copy_file_fast(target, path, allow_hardlink=member.islnk())
+            hashes[path] = hashes[target]
+
+        if len(unresolved) == len(pending):
+            names = ", ".join(f"'{m.name}' -> '{m.linkname}'" for m in unresolved)
+            communication.warn(f"Skipped archive links that don't point to a file in the archive: {names}")
+            break
+
+        pending = unresolved
+
+
+def extract_zip(path: Union[Path, str], destination: Union[Path, str]) -> Dict[Path, FileHashes]:
+    """Extract a zip archive.
+
+    Zip archives keep their index at the end of the file and cannot be extracted from a stream.
+
+    Args:
+        path(Union[Path, str]): Path of the archive.
+        destination(Union[Path, str]): Directory to extract the archive into.
+
+    Returns:
+        Dict[Path, FileHashes]: Extracted files and their hashes.
+    """
+    destination = Path(destination).resolve()
+    hashes: Dict[Path, FileHashes] = {}
+
+    with zipfile.ZipFile(path) as archive:
+        for info in archive.infolist():
+            member_path = _get_member_path(destination, info.filename)
+
+            if info.is_dir():
+                member_path.mkdir(parents=True, exist_ok=True)
+                continue
+
+            member_path.parent.mkdir(parents=True, exist_ok=True)
+            with archive.open(info) as source:
+                hashes[member_path] = write_and_hash_file(cast(BinaryIO, source), member_path, size=info.file_size)
+
+    return hashes
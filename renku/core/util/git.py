@@ -632,6 +632,9 @@ def clone_renku_repository(
     checkout_revision=None,
     use_renku_credentials: bool = False,
     reuse_existing_repository: bool = False,
+    clone_filter: Optional[str] = None,
+    sparse_paths: Optional[List[Union[Path, str]]] = None,
+    reference: Optional[Union[Path, str]] = None,
 ) -> "Repository":
     """Clone a Renku Repository.
 
@@ -651,6 +654,12 @@ def clone_renku_repository(
         checkout_revision: The revision to check out after clone (Default value = None).
         use_renku_credentials(bool, optional): Whether to use Renku provided credentials (Default value = False).
         reuse_existing_repository(bool, optional): Whether to clone over an existing repository (Default value = False).
+        clone_filter(Optional[str], optional): Create a partial clone using this object filter, e.g. ``blob:none``
+            (Default value = None).
+        sparse_paths(Optional[List[Union[Path, str]]], optional): Only check out top-level files and these directories
+            (Default value = None).
+        reference(Optional[Union[Path, str]], optional): A local repository to borrow objects from, if it exists
+            (Default value = None).
 
     Returns:
         The cloned repository.
@@ -693,6 +702,9 @@ def clone_renku_repository(
         raise_git_except=raise_git_except,
         checkout_revision=checkout_revision,
         clone_options=clone_options,
+        clone_filter=clone_filter,
+        sparse_paths=sparse_paths,
+        reference=reference,
     )
 
     if create_backup:
@@ -719,6 +731,9 @@ def clone_repository(
     no_checkout: bool = False,
     clean: bool = False,
     clone_options: Optional[List[str]] = None,
+    clone_filter: Optional[str] = None,
+    sparse_paths: Optional[List[Union[Path, str]]] = None,
+    reference: Optional[Union[Path, str]] = None,
 ) -> "Repository":
     """Clone a Git repository and install Git hooks and LFS.
 
@@ -737,6 +752,12 @@ def clone_repository(
         no_checkout(bool, optional): Whether to perform a checkout (Default value = False).
         clean(bool, optional): Whether to require the target folder to be clean (Default value = False).
         clone_options(List[str], optional): Additional clone options (Default value = None).
+        clone_filter(Optional[str], optional): Create a partial clone using this object filter, e.g. ``blob:none``;
+            missing objects are fetched on demand (Default value = None).
+        sparse_paths(Optional[List[Union[Path, str]]], optional): Only check out top-level files and these directories
+            (Default value = None).
+        reference(Optional[Union[Path, str]], optional): A local repository to borrow objects from using Git
+            alternates; only objects missing from it are fetched. Ignored if it doesn't exist (Default value = None).
 
     Returns:
         The cloned repository.
@@ -779,6 +800,11 @@ def clone_repository(
             remote = get_remote(repository, name="origin") or get_remote(repository)
 
             if remote and have_same_remote(remote.url, url):
+                if is_repository_up_to_date(repository, remote=remote.name, checkout_revision=checkout_revision):
+                    # NOTE: Reuse the clone (including local changes like migrations) when remote hasn't changed
+                    repository.add_sparse_checkout_paths(*(sparse_paths or []))
+                    return repository
+
                 repository.reset(hard=True)
                 repository.fetch(all=True, tags=True)
                 # NOTE: By default we check out remote repository's HEAD since the local HEAD might not point to
@@ -789,6 +815,7 @@ def clone_repository(
                     repository.pull()
                 except errors.GitCommandError:  # NOTE: When ref is not a branch, an error is thrown
                     pass
+                repository.add_sparse_checkout_paths(*(sparse_paths or []))
             else:
                 # NOTE: not same remote, so don't reuse
                 clean_directory()
@@ -803,6 +830,14 @@ def clone_repository(
     def clone(branch, depth):
         os.environ["GIT_LFS_SKIP_SMUDGE"] = "1" if skip_smudge else "0"
 
+        options = list(clone_options or [])
+        if clone_filter:
+            options.append(f"--filter={clone_filter}")
+        if sparse_paths is not None:
+            options.append("--sparse")
+        if reference:
+            options.append(f"--reference-if-able={reference}")
+
         return Repository.clone_from(
             url,
             cast(Path, path),
@@ -811,7 +846,7 @@ def clone_repository(
             depth=depth,
             no_checkout=no_checkout,
             progress=progress,
-            clone_options=clone_options,
+            clone_options=options or None,
         )
 
     assert config is None or isinstance(config, dict), f"Config should be a dict not '{type(config)}'"
@@ -835,6 +870,8 @@ def clone_repository(
             handle_git_exception()
             raise
 
+    repository.add_sparse_checkout_paths(*(sparse_paths or []))
+
     if checkout_revision is not None and not no_checkout:
         try:
             repository.checkout(checkout_revision)
@@ -862,6 +899,33 @@ def clone_repository(
     return repository
 
 
+def is_repository_up_to_date(repository: "Repository", remote: str, checkout_revision: Optional[str] = None) -> bool:
+    """Check if a clone contains the remote's latest commit without fetching from the remote.
+
+    Args:
+        repository(Repository): The cloned repository.
+        remote(str): Name of the remote to check.
+        checkout_revision(Optional[str]): The revision that should be checked out; only the remote's default branch is
+            checked (Default value = None).
+
+    Returns:
+        bool: True if the remote's HEAD didn't change since the last fetch and it's an ancestor of the local HEAD.
+    """
+    if checkout_revision is not None or repository.is_dirty(untracked_files=False):
+        return False
+
+    try:
+        remote_head = repository.run_git_command("ls-remote", remote, "HEAD").split()
+        local_remote_head = repository.run_git_command("rev-parse", "--verify", f"{remote}/HEAD")
+        if not remote_head or remote_head[0] != local_remote_head:
+            return False
+        repository.run_git_command("merge-base", "--is-ancestor", local_remote_head, "HEAD")
+    except errors.GitCommandError:
+        return False
+
+    return True
+
+
 def get_git_progress_instance():
     """Return a GitProgress object."""
     from git.remote import RemoteProgress
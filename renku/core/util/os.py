@@ -23,13 +23,21 @@ import os
 import re
 import shutil
 import subprocess
+import uuid
 from pathlib import Path
-from typing import Any, BinaryIO, Dict, Generator, List, Optional, Sequence, Union
+from typing import Any, BinaryIO, Callable, Dict, Generator, List, NamedTuple, Optional, Pattern, Sequence, Tuple, Union
 
 from renku.core import errors
 
 BLOCK_SIZE = 4096
 
+COPY_CHUNK_SIZE = 64 * 1024 * 1024
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# NOTE: ``ioctl`` request to clone a file on Linux (``_IOW(0x94, 9, int)``)
+FICLONE = 0x40049409
+
 
 def get_relative_path_to_cwd(path: Union[Path, str]) -> str:
     """Get a relative path to current working directory."""
@@ -221,6 +229,193 @@ def get_file_size(path: Union[Path, str], follow_symlinks: bool = True) -> Optio
         return None
 
 
+def _reflink(source: Union[Path, str], destination: Union[Path, str]) -> bool:
+    """Create a copy-on-write clone of a file; return False if the filesystem doesn't support it."""
+    try:
+        import fcntl
+    except ImportError:  # NOTE: Not available on Windows
+        return False
+
+    with open(source, "rb") as src, open(destination, "wb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        except OSError:
+            return False
+
+    return True
+
+
+def _hardlink(source: Union[Path, str], destination: Union[Path, str]) -> bool:
+    """Hardlink a file to a destination; return False if the filesystem doesn't support it."""
+    # NOTE: Link to a temporary name and rename it so that an existing destination is replaced atomically
+    temporary = os.path.join(os.path.dirname(os.path.abspath(destination)), f".{uuid.uuid4().hex}.link")
+    try:
+        os.link(source, temporary)
+    except OSError:
+        return False
+
+    try:
+        os.replace(temporary, destination)
+    except OSError:
+        os.unlink(temporary)
+        raise
+
+    return True
+
+
+def _check_not_same_file(source: Union[Path, str], destination: Union[Path, str]) -> None:
+    """Raise ``shutil.SameFileError`` if ``destination`` is ``source`` since opening it for writing truncates both."""
+    if os.path.exists(destination) and os.path.samefile(source, destination):
+        raise shutil.SameFileError(f"'{source}' and '{destination}' are the same file")
+
+
+def _copy_file_range(source: Union[Path, str], destination: Union[Path, str]) -> bool:
+    """Copy a file in the kernel using ``copy_file_range``; return False if it's not supported."""
+    if not hasattr(os, "copy_file_range"):
+        return False
+
+    with open(source, "rb") as src, open(destination, "wb") as dst:
+        size = os.fstat(src.fileno()).st_size
+        offset = 0
+        try:
+            while offset < size:
+                copied = os.copy_file_range(src.fileno(), dst.fileno(), COPY_CHUNK_SIZE)  # type: ignore[attr-defined]
+                if copied == 0:
+                    break
+                offset += copied
+        except OSError:
+            if offset > 0:
+                raise
+            return False
+
+    return True
+
+
+def copy_file_fast(source: Union[Path, str], destination: Union[Path, str], allow_hardlink: bool = False) -> str:
+    """Copy a file's content and permissions using the cheapest method that the filesystem supports.
+
+    Methods are tried in this order: reflink (copy-on-write clone), hardlink (only if ``allow_hardlink`` is set since
+    source and destination share data afterwards), in-kernel ``copy_file_range``, and a chunked copy.
+
+    Args:
+        source(Union[Path, str]): File to copy.
+        destination(Union[Path, str]): Destination file path; an existing file is overwritten.
+        allow_hardlink(bool): Whether to hardlink ``destination`` to ``source`` if reflinks aren't supported
+            (Default value = False).
+
+    Raises:
+        shutil.SameFileError: If ``destination`` is ``source`` and ``allow_hardlink`` isn't set.
+
+    Returns:
+        str: Name of the method used: ``reflink``, ``hardlink``, ``copy_file_range`` or ``copy``.
+    """
+    if os.path.isdir(destination):
+        destination = os.path.join(destination, os.path.basename(source))
+
+    if allow_hardlink and os.path.exists(destination) and os.path.samefile(source, destination):
+        return "hardlink"
+
+    _check_not_same_file(source, destination)
+
+    if _reflink(source, destination):
+        method = "reflink"
+    elif allow_hardlink and _hardlink(source, destination):
+        return "hardlink"
+    elif _copy_file_range(source, destination):
+        method = "copy_file_range"
+    else:
+        shutil.copyfile(source, destination)
+        method = "copy"
+
+    shutil.copymode(source, destination)
+
+    return method
+
+
+class FileHashes(NamedTuple):
+    """Hashes of a file's content that are calculated in a single pass."""
+
+    git_sha1: str  # NOTE: Git blob hash of the raw content without applying any Git filter
+    md5: str
+    sha256: str
+    size: int
+
+
+class _FileHasher:
+    """Incrementally calculate all hashes in ``FileHashes``."""
+
+    def __init__(self, size: int):
+        # NOTE: Git's blob header needs the size in advance
+        self._git_sha1 = hashlib.sha1(f"blob {size}\0".encode())  # nosec
+        self._md5 = hashlib.md5()  # nosec
+        self._sha256 = hashlib.sha256()
+        self._size = 0
+
+    def update(self, data: bytes) -> None:
+        self._git_sha1.update(data)
+        self._md5.update(data)
+        self._sha256.update(data)
+        self._size += len(data)
+
+    def get_hashes(self) -> FileHashes:
+        return FileHashes(
+            git_sha1=self._git_sha1.hexdigest(),
+            md5=self._md5.hexdigest(),
+            sha256=self._sha256.hexdigest(),
+            size=self._size,
+        )
+
+
+def hash_file_all(path: Union[Path, str]) -> FileHashes:
+    """Calculate Git blob SHA-1, MD5, SHA-256 and size of a file by reading it once."""
+    with open(path, "rb") as f:
+        hasher = _FileHasher(size=os.fstat(f.fileno()).st_size)
+        for block in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            hasher.update(block)
+
+    return hasher.get_hashes()
+
+
+def copy_and_hash_file(source: Union[Path, str], destination: Union[Path, str]) -> FileHashes:
+    """Copy a file and calculate its hashes while copying so that data is read only once.
+
+    If the filesystem supports reflinks, the file is cloned without copying data and the clone is hashed.
+
+    Raises:
+        shutil.SameFileError: If ``destination`` is ``source``.
+    """
+    if os.path.isdir(destination):
+        destination = os.path.join(destination, os.path.basename(source))
+
+    _check_not_same_file(source, destination)
+
+    if _reflink(source, destination):
+        shutil.copymode(source, destination)
+        return hash_file_all(destination)
+
+    with open(source, "rb") as src, open(destination, "wb") as dst:
+        hasher = _FileHasher(size=os.fstat(src.fileno()).st_size)
+        for block in iter(lambda: src.read(HASH_CHUNK_SIZE), b""):
+            hasher.update(block)
+            dst.write(block)
+
+    shutil.copymode(source, destination)
+
+    return hasher.get_hashes()
+
+
+def write_and_hash_file(source: BinaryIO, destination: Union[Path, str], size: int) -> FileHashes:
+    """Write a stream of ``size`` bytes to a file and calculate its hashes while writing."""
+    hasher = _FileHasher(size=size)
+
+    with open(destination, "wb") as dst:
+        for block in iter(lambda: source.read(HASH_CHUNK_SIZE), b""):
+            hasher.update(block)
+            dst.write(block)
+
+    return hasher.get_hashes()
+
+
 def normalize_to_ascii(input_string, sep="-"):
     """Convert a string to only contain ASCII characters, with non-ASCII substring replaced with ``sep``."""
     replace_all = [sep, "_", "."]
@@ -324,6 +519,39 @@ def matches(path: Union[Path, str], pattern: str) -> bool:
     return False
 
 
+def compile_path_patterns(patterns: Sequence[str]) -> Callable[[Union[Path, str]], bool]:
+    """Compile glob patterns to a function that checks if a path matches any of them.
+
+    Paths are matched like ``PurePath.match``: Relative patterns are matched from the right and absolute patterns must
+    match the whole path. Patterns are compiled once rather than each time a path is checked.
+
+    Args:
+        patterns(Sequence[str]): Glob patterns.
+
+    Returns:
+        Callable[[Union[Path, str]], bool]: A function that returns True if a path matches any of the patterns.
+    """
+    compiled: List[Tuple[bool, List[Pattern[str]]]] = []
+    for pattern in patterns:
+        pattern_path = Path(pattern)
+        if not pattern_path.parts:
+            raise ValueError("empty pattern")
+        is_anchored = bool(pattern_path.drive or pattern_path.root)
+        compiled.append((is_anchored, [re.compile(fnmatch.translate(part)) for part in pattern_path.parts]))
+
+    def match(path: Union[Path, str]) -> bool:
+        parts = Path(path).parts
+        for is_anchored, regexes in compiled:
+            if len(parts) < len(regexes) or (is_anchored and len(parts) != len(regexes)):
+                continue
+            if all(regex.match(part) for regex, part in zip(regexes, parts[-len(regexes) :])):
+                return True
+
+        return False
+
+    return match
+
+
 def expand_directories(paths):
     """Expand directory with all files it contains."""
     processed_paths = set()
@@ -19,22 +19,52 @@ This module provides some wrapper functions around ``requests`` library. It sets
 whenever needed. Use this module instead of ``requests``.
 """
 
+import base64
+import contextlib
+import hashlib
+import io
+import json
 import os
+import shutil
+import tarfile
 import tempfile
+import threading
+import time
 import urllib
-from contextlib import contextmanager
+import uuid
+import zipfile
 from pathlib import Path
-from typing import Union
+from typing import Any, BinaryIO, Dict, Generator, List, Optional, Tuple, Union, cast
 
 import patoolib
 import requests
 from requests.adapters import HTTPAdapter, TimeoutSauce  # type: ignore
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
 from urllib3.util.retry import Retry
 
 from renku.core import errors
+from renku.core.util.archive import extract_tar_stream, extract_zip, get_archive_type
+from renku.core.util.os import FileHashes
 
 _RENKU_REQUESTS_TIMEOUT_SECONDS = float(os.getenv("RENKU_REQUESTS_TIMEOUT_SECONDS", 1200))
 
+_RENKU_REQUESTS_POOL_MAXSIZE = int(os.getenv("RENKU_REQUESTS_POOL_MAXSIZE", 16))
+
+_RENKU_REQUESTS_MAX_RETRIES = int(os.getenv("RENKU_REQUESTS_MAX_RETRIES", 5))
+
+_MIN_CHUNK_SIZE = 64 * 1024
+
+_MAX_CHUNK_SIZE = 8 * 1024 * 1024
+
+# NOTE: Chunk size is increased while reading a chunk takes less than this many seconds
+_TARGET_CHUNK_TIME = 0.1
+
+# NOTE: Response headers that identify a version of a remote file
+_VALIDATOR_HEADERS = ("etag", "last-modified", "content-length")
+
+# NOTE: Seconds that cached metadata is used without revalidating it with the remote server
+_RENKU_METADATA_CACHE_TTL = float(os.getenv("RENKU_METADATA_CACHE_TTL", 600))
+
 
 class _CustomTimeout(TimeoutSauce):
     """CustomTimeout for all HTTP requests."""
@@ -80,20 +110,113 @@ def put(url, *, data=None, files=None, headers=None, params=None):
 
 def _request(verb: str, url: str, *, allow_redirects=True, data=None, files=None, headers=None, json=None, params=None):
     try:
-        with _retry() as session:
-            return getattr(session, verb)(
-                url=url,
-                allow_redirects=allow_redirects,
-                data=data,
-                files=files,
-                headers=headers,
-                json=json,
-                params=params,
-            )
+        return getattr(get_session(url), verb)(
+            url=url,
+            allow_redirects=allow_redirects,
+            data=data,
+            files=files,
+            headers=headers,
+            json=json,
+            params=params,
+        )
     except (ConnectionError, requests.RequestException, urllib.error.HTTPError) as e:
         raise errors.RequestError(f"{verb.upper()} request failed for {url}") from e
 
 
+def get_cached(url: str, headers: Optional[Dict[str, str]] = None, ttl: Optional[float] = None) -> requests.Response:
+    """Send a GET request for remote metadata and cache successful responses on disk.
+
+    Cached responses that are younger than ``ttl`` are returned without a request. Older ones are revalidated with a
+    conditional request if the server sent an ``ETag`` or ``Last-Modified`` header. The cache is in user's Renku
+    directory (or in ``RENKU_METADATA_CACHE_DIR``) and is shared between CLI and service workers; entries are keyed by
+    URL and request headers, so, responses for different credentials are never shared.
+
+    Args:
+        url(str): URL to get.
+        headers(Optional[Dict[str, str]]): Request headers (Default value = None).
+        ttl(Optional[float]): Seconds that a cached response is used without revalidation; defaults to
+            ``RENKU_METADATA_CACHE_TTL`` (Default value = None).
+
+    Returns:
+        requests.Response: The cached or the received response.
+    """
+    ttl = _RENKU_METADATA_CACHE_TTL if ttl is None else ttl
+    path = _get_metadata_cache_path(url=url, headers=headers)
+    entry = _read_metadata_cache_entry(path)
+
+    request_headers = dict(headers or {})
+    if entry:
+        if time.time() - entry["stored_at"] < ttl:
+            return _create_cached_response(url=url, entry=entry)
+
+        if entry["headers"].get("etag"):
+            request_headers["If-None-Match"] = entry["headers"]["etag"]
+        if entry["headers"].get("last-modified"):
+            request_headers["If-Modified-Since"] = entry["headers"]["last-modified"]
+
+    response = get(url, headers=request_headers)
+
+    if response.status_code == 304 and entry:
+        entry["stored_at"] = time.time()
+        _write_metadata_cache_entry(path, entry)
+        return _create_cached_response(url=url, entry=entry)
+    elif response.status_code == 200 and "no-store" not in response.headers.get("Cache-Control", "").lower():
+        entry = {
+            "stored_at": time.time(),
+            "headers": {key.lower(): value for key, value in response.headers.items()},
+            "content": base64.b64encode(response.content).decode("ascii"),
+        }
+        _write_metadata_cache_entry(path, entry)
+
+    return response
+
+
+def _get_metadata_cache_path(url: str, headers: Optional[Dict[str, str]]) -> Path:
+    """Return path of the cache entry of a request."""
+    directory = os.getenv("RENKU_METADATA_CACHE_DIR")
+    if not directory:
+        from renku.domain_model.project_context import project_context
+
+        directory = os.path.join(project_context.global_config_dir, "cache", "metadata")
+
+    key = json.dumps([url, sorted((name.lower(), value) for name, value in (headers or {}).items())])
+    name = hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    return Path(directory) / name[:2] / f"{name}.json"
+
+
+def _read_metadata_cache_entry(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        entry = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+    return entry if isinstance(entry, dict) and {"stored_at", "headers", "content"} <= entry.keys() else None
+
+
+def _write_metadata_cache_entry(path: Path, entry: Dict[str, Any]) -> None:
+    # NOTE: Write to a temporary file and rename it so that concurrent processes never read a partial entry
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}")
+        temporary_path.write_text(json.dumps(entry))
+        os.replace(temporary_path, path)
+    except OSError:
+        # NOTE: Caching is best-effort
+        pass
+
+
+def _create_cached_response(url: str, entry: Dict[str, Any]) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response.headers = requests.structures.CaseInsensitiveDict(entry["headers"])
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response._content = base64.b64decode(entry["content"])
+
+    return response
+
+
 def get_redirect_url(url) -> str:
     """Return redirect URL if any; otherwise, return the original URL."""
     try:
@@ -103,6 +226,44 @@ def get_redirect_url(url) -> str:
         return url
 
 
+def is_modified(url: str, validators: Dict[str, str]) -> Optional[bool]:
+    """Check if a remote file changed since its ``validators`` were recorded without downloading it.
+
+    Args:
+        url(str): URL of the file.
+        validators(Dict[str, str]): Validators that were returned when the file was downloaded.
+
+    Returns:
+        Optional[bool]: Whether the file was modified or None if it cannot be determined.
+    """
+    headers = {}
+    if "etag" in validators:
+        headers["If-None-Match"] = validators["etag"]
+    if "last-modified" in validators:
+        headers["If-Modified-Since"] = validators["last-modified"]
+
+    try:
+        response = head(url, allow_redirects=True, headers=headers)
+    except errors.RequestError:
+        return None
+
+    if response.status_code == 304:
+        return False
+    elif response.status_code != 200:
+        return None
+
+    # NOTE: Servers that don't support conditional requests return 200; so, compare validators as well
+    current = {name: response.headers[name] for name in _VALIDATOR_HEADERS if name in response.headers}
+    common = [name for name in _VALIDATOR_HEADERS if name in current and name in validators]
+
+    if any(current[name] != validators[name] for name in common):
+        return True
+    elif any(name in common for name in ("etag", "last-modified")):
+        return False
+
+    return None
+
+
 def check_response(response):
     """Check for expected response status code."""
     if response.status_code in [200, 201, 202]:
@@ -115,58 +276,471 @@ def check_response(response):
         raise errors.RequestError(message)
 
 
-def download_file(base_directory: Union[Path, str], url: str, filename, extract, chunk_size=16384):
-    """Download a URL to a given location."""
-    from renku.core.util import communication
+def download_file(
+    base_directory: Union[Path, str],
+    url: str,
+    filename,
+    extract,
+    chunk_size: Optional[int] = None,
+    checksum: Optional[str] = None,
+):
+    """Download a URL to a given location.
+
+    Partially-downloaded files are kept in ``base_directory`` and are resumed using HTTP range requests when the server
+    supports them, both after a dropped connection and in a later call.
+
+    Args:
+        base_directory(Union[Path, str]): Directory to download the file into.
+        url(str): URL to download.
+        filename: Name of the downloaded file; it's inferred from the response or the URL if not passed.
+        extract: Whether to extract the downloaded file if it is an archive.
+        chunk_size(Optional[int]): Use a fixed chunk size instead of adapting it to the throughput
+            (Default value = None).
+        checksum(Optional[str]): Expected checksum of the file in ``<algorithm>:<value>`` form, e.g. ``md5:1234``; the
+            download fails if it doesn't match (Default value = None).
+
+    Returns:
+        Tuple[Path, List[Path], Dict[str, str]]: The directory containing the downloaded files, the list of files, and
+            ``ETag``, ``Last-Modified`` and ``Content-Length`` headers that identify the downloaded version of the file.
+    """
+    if extract:
+        extracted_root, hashes, validators = download_and_extract(
+            base_directory=base_directory, url=url, filename=filename, checksum=checksum
+        )
+        return extracted_root, list(hashes), validators
 
-    def extract_dataset(filepath):
-        """Extract downloaded file."""
-        try:
-            tmp = tempfile.mkdtemp()
-            patoolib.extract_archive(str(filepath), outdir=tmp, verbosity=-1)
-        except patoolib.util.PatoolError:
-            return filepath.parent, [filepath]
-        else:
-            filepath.unlink()
-            return Path(tmp), [p for p in Path(tmp).rglob("*")]
+    tmp_root = Path(base_directory)
+    tmp_root.mkdir(parents=True, exist_ok=True)
+
+    hash_type, expected_hash = _parse_checksum(checksum)
+
+    with _get_partial_path(tmp_root, url) as partial_path:
+        filename, file_hash, validators = _download_with_resume(
+            url=url, filename=filename, partial_path=partial_path, chunk_size=chunk_size, hash_type=hash_type
+        )
 
+        if expected_hash and file_hash != expected_hash:
+            partial_path.unlink(missing_ok=True)
+            raise errors.RequestError(
+                f"Checksum mismatch for {url}: expected {checksum} but got {hash_type}:{file_hash}"
+            )
+
+        tmp = tempfile.mkdtemp(dir=tmp_root)
+        download_to = Path(tmp) / filename
+        os.replace(partial_path, download_to)
+        _get_validator_path(partial_path).unlink(missing_ok=True)
+
+    return download_to.parent, [download_to], validators
+
+
+def download_and_extract(
+    base_directory: Union[Path, str], url: str, filename: Optional[str] = None, checksum: Optional[str] = None
+) -> Tuple[Path, Dict[Path, Optional[FileHashes]], Dict[str, str]]:
+    """Download an archive and extract it.
+
+    Tar archives are extracted while they are being downloaded, so they are never stored on disk. If streaming fails,
+    the archive is downloaded (with resumption support) and extracted afterwards. Zip archives must be downloaded first
+    since their index is at the end of the file. Other formats are extracted using ``patool``. Files that aren't
+    archives are returned as they are.
+
+    Args:
+        base_directory(Union[Path, str]): Directory to download and extract the archive into.
+        url(str): URL to download.
+        filename(Optional[str]): Name of the archive; it's inferred from the response or the URL if not passed
+            (Default value = None).
+        checksum(Optional[str]): Expected checksum of the archive in ``<algorithm>:<value>`` form
+            (Default value = None).
+
+    Returns:
+        Tuple[Path, Dict[Path, Optional[FileHashes]], Dict[str, str]]: The directory containing the extracted files,
+            the extracted files with their hashes if they were calculated while extracting, and validators of the
+            downloaded archive.
+    """
     tmp_root = Path(base_directory)
     tmp_root.mkdir(parents=True, exist_ok=True)
-    tmp = tempfile.mkdtemp(dir=tmp_root)
+
+    name = filename or Path(urllib.parse.urlparse(url).path).name
+
+    if get_archive_type(name) == "tar":
+        destination = Path(tempfile.mkdtemp(dir=tmp_root))
+        try:
+            extracted_hashes, validators = _stream_extract_tar(
+                url=url, name=name, destination=destination, checksum=checksum
+            )
+            hashes: Dict[Path, Optional[FileHashes]] = {}
+            hashes.update(extracted_hashes)
+            return destination, hashes, validators
+        except (tarfile.TarError, requests.exceptions.RequestException, ProtocolError, ReadTimeoutError):
+            # NOTE: Streams cannot be resumed; download the file with resumption support and extract it from disk
+            shutil.rmtree(destination, ignore_errors=True)
+
+    _, paths, validators = download_file(
+        base_directory=tmp_root, url=url, filename=filename, extract=False, checksum=checksum
+    )
+
+    extracted_root, hashes = _extract_archive(paths[0], base_directory=tmp_root)
+
+    return extracted_root, hashes, validators
+
+
+class _ResponseReader:
+    """File-like reader of a streamed response that hashes the content and reports progress while it's read."""
+
+    def __init__(self, response: requests.Response, name: str, hasher=None):
+        self._response = response
+        self._name = name
+        self._hasher = hasher
+
+    def read(self, size: int = -1) -> bytes:
+        from renku.core.util import communication
+
+        data = self._response.raw.read(size if size >= 0 else None, decode_content=True)
+
+        if self._hasher:
+            self._hasher.update(data)
+        communication.update_progress(name=self._name, amount=len(data))
+
+        return data
+
+
+class MultipartFileStream:
+    """File-like ``multipart/form-data`` body with a single file that is streamed from disk when a request is sent.
+
+    Passing files in ``files=`` makes ``requests`` build the whole body in memory; pass an instance of this class as
+    ``data=`` and its ``content_type`` as the ``Content-Type`` header instead.
+    """
+
+    def __init__(
+        self, path: Union[Path, str], filename: str, fields: Optional[Dict[str, str]] = None, field_name: str = "file"
+    ):
+        boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+
+        def quote(value: str) -> str:
+            return value.replace("\\", "\\\\").replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+
+        head = ""
+        for name, value in (fields or {}).items():
+            head += f'--{boundary}\r\nContent-Disposition: form-data; name="{quote(name)}"\r\n\r\n{value}\r\n'
+        head += (
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{quote(field_name)}"; filename="{quote(filename)}"'
+            "\r\nContent-Type: application/octet-stream\r\n\r\n"
+        )
+
+        self._file = open(path, "rb")
+        self._parts: List[BinaryIO] = [
+            io.BytesIO(head.encode("utf-8")),
+            self._file,
+            io.BytesIO(f"\r\n--{boundary}--\r\n".encode("utf-8")),
+        ]
+        self._sizes = [len(head.encode("utf-8")), os.fstat(self._file.fileno()).st_size, len(boundary) + 8]
+        self._position = 0
+
+    def __len__(self) -> int:
+        return sum(self._sizes)
+
+    def __enter__(self) -> "MultipartFileStream":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying file."""
+        self._file.close()
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to ``size`` bytes of the body."""
+        if size is None or size < 0:
+            size = len(self) - self._position
+
+        data = b""
+        offset = 0
+        for part, part_size in zip(self._parts, self._sizes):
+            if len(data) >= size:
+                break
+            if self._position < offset + part_size:
+                part.seek(self._position - offset)
+                chunk = part.read(size - len(data))
+                data += chunk
+                self._position += len(chunk)
+            offset += part_size
+
+        return data
+
+    def seek(self, position: int, whence: int = os.SEEK_SET) -> int:
+        """Change the read position; used by ``urllib3`` to rewind the body when retrying a request."""
+        if whence == os.SEEK_CUR:
+            position += self._position
+        elif whence == os.SEEK_END:
+            position += len(self)
+        self._position = min(max(position, 0), len(self))
+        return self._position
+
+    def tell(self) -> int:
+        """Return the current read position."""
+        return self._position
+
+
+def _stream_extract_tar(
+    url: str, name: str, destination: Path, checksum: Optional[str]
+) -> Tuple[Dict[Path, FileHashes], Dict[str, str]]:
+    """Extract a tar archive while downloading it.
+
+    Returns:
+        Tuple[Dict[Path, FileHashes], Dict[str, str]]: Hashes of the extracted files and validators of the archive.
+    """
+    from renku.core.util import communication
+
+    hash_type, expected_hash = _parse_checksum(checksum)
+    hasher = hashlib.new(hash_type) if hash_type else None
+
+    with get_session(url).get(url, stream=True, allow_redirects=True) as response:
+        response.raise_for_status()
+        validators = _get_response_validators(response)
+
+        communication.start_progress(name=name, total=int(response.headers.get("content-length", 0)))
+        try:
+            reader = _ResponseReader(response, name=name, hasher=hasher)
+            hashes = extract_tar_stream(cast(BinaryIO, reader), destination)
+            # NOTE: Read the archive's trailing padding so that the whole file is hashed
+            for _ in iter(lambda: reader.read(_MIN_CHUNK_SIZE), b""):
+                pass
+        finally:
+            communication.finalize_progress(name=name)
+
+    if hasher and hasher.hexdigest() != expected_hash:
+        shutil.rmtree(destination, ignore_errors=True)
+        raise errors.RequestError(
+            f"Checksum mismatch for {url}: expected {checksum} but got {hash_type}:{hasher.hexdigest()}"
+        )
+
+    return hashes, validators
+
+
+def _extract_archive(filepath: Path, base_directory: Path) -> Tuple[Path, Dict[Path, Optional[FileHashes]]]:
+    """Extract a downloaded archive into a new directory in ``base_directory`` and delete the archive."""
+    tmp = Path(tempfile.mkdtemp(dir=base_directory))
+    archive_type = get_archive_type(filepath.name)
+    hashes: Dict[Path, Optional[FileHashes]] = {}
 
     try:
-        with requests.get(url, stream=True, allow_redirects=True) as response:
-            response.raise_for_status()
+        if archive_type == "tar":
+            with open(filepath, "rb") as archive:
+                hashes.update(extract_tar_stream(archive, tmp))
+        elif archive_type == "zip":
+            hashes.update(extract_zip(filepath, tmp))
+        else:
+            patoolib.extract_archive(str(filepath), outdir=str(tmp), verbosity=-1)
+            hashes.update({path: None for path in tmp.rglob("*") if not path.is_dir()})
+    except (tarfile.TarError, zipfile.BadZipFile, patoolib.util.PatoolError):
+        shutil.rmtree(tmp, ignore_errors=True)
+        return filepath.parent, {filepath: None}
 
-            if not filename:
-                filename = get_filename_from_headers(response)
+    filepath.unlink()
 
-            if not filename:
-                u = urllib.parse.urlparse(url)
-                filename = Path(u.path).name
-                if not filename:
-                    raise errors.ParameterError(f"URL Cannot find a file to download from {url}")
+    return tmp, hashes
+
+
+def _parse_checksum(checksum: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    """Return hash algorithm and value from a provider's checksum if it's verifiable."""
+    if not checksum or ":" not in checksum:
+        return None, None
+
+    hash_type, value = checksum.split(":", 1)
+    hash_type = hash_type.strip().lower()
+    if hash_type not in ("md5", "sha1", "sha256", "sha512"):
+        return None, None
+
+    return hash_type, value.strip().lower()
+
+
+@contextlib.contextmanager
+def _get_partial_path(base_directory: Path, url: str) -> Generator[Path, None, None]:
+    """Return path of the file that a URL is downloaded into and lock it for the duration of the download.
+
+    The path only depends on the URL so that a later download resumes it. If another process is downloading the same
+    URL, a separate file is used that is removed afterwards.
+    """
+    from renku.core.util.contexts import Lock
+
+    name = hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    with contextlib.ExitStack() as stack:
+        lock_path = base_directory / f"{name}.lock"
+        try:
+            stack.enter_context(Lock(lock_path, mode="exclusive"))
+        except errors.LockError:
+            partial_path = base_directory / f"{name}-{uuid.uuid4().hex}.part"
+            stack.callback(_get_validator_path(partial_path).unlink, missing_ok=True)
+            stack.callback(partial_path.unlink, missing_ok=True)
+        else:
+            partial_path = base_directory / f"{name}.part"
+            # NOTE: Remove the lock file while it's still locked; a later download creates a new one
+            stack.callback(lock_path.unlink, missing_ok=True)
+
+        yield partial_path
+
+
+def _get_response_validators(response: requests.Response) -> Dict[str, str]:
+    """Return validators of the remote file that a (partial) response belongs to."""
+    validators = {name: response.headers[name] for name in ("etag", "last-modified") if name in response.headers}
+
+    # NOTE: Partial responses have the size of the whole file in their ``Content-Range`` header
+    content_range = response.headers.get("content-range")
+    size = content_range.rsplit("/", 1)[-1] if content_range else response.headers.get("content-length")
+    if size and size.isdigit():
+        validators["content-length"] = size
+
+    return validators
+
+
+def _get_validator_path(partial_path: Path) -> Path:
+    """Return path of the file that stores ETag/Last-Modified of a partial download."""
+    return partial_path.with_suffix(".validator")
+
+
+def _download_with_resume(
+    url: str,
+    filename: Optional[str],
+    partial_path: Path,
+    chunk_size: Optional[int],
+    hash_type: Optional[str],
+    max_attempts: int = _RENKU_REQUESTS_MAX_RETRIES,
+) -> Tuple[str, Optional[str], Dict[str, str]]:
+    """Download a URL into ``partial_path`` and resume the download if the connection drops.
+
+    Returns:
+        Tuple[str, Optional[str], Dict[str, str]]: Filename of the downloaded file, its hash if ``hash_type`` is passed,
+            and its validators.
+    """
+    from renku.core.util import communication
+
+    validator_path = _get_validator_path(partial_path)
+    attempt = 0
+    progress_started = False
+    hasher = None
+    validators: Dict[str, str] = {}
+
+    while True:
+        attempt += 1
+        offset = partial_path.stat().st_size if partial_path.exists() else 0
+        validator = validator_path.read_text() if validator_path.exists() else None
+
+        headers = {}
+        if offset and validator:
+            # NOTE: ``If-Range`` makes the server send the whole file if it changed since the partial download
+            headers = {"Range": f"bytes={offset}-", "If-Range": validator}
+
+        try:
+            with get_session(url).get(url, stream=True, allow_redirects=True, headers=headers) as response:
+                complete = False
+                if response.status_code == 416 and headers:
+                    # NOTE: The range is not satisfiable if the partial file is already complete or if it's larger
+                    # than the remote file; restart the download in the latter case.
+                    if response.headers.get("content-range", "").rsplit("/", 1)[-1] == str(offset):
+                        complete = True
+                    else:
+                        partial_path.unlink(missing_ok=True)
+                        validator_path.unlink(missing_ok=True)
+                        continue
+                else:
+                    response.raise_for_status()
+
+                if response.status_code == 206 and not _is_resumed_at(response, offset):
+                    # NOTE: The partial file cannot be continued with this response; download the whole file instead
+                    partial_path.unlink(missing_ok=True)
+                    validator_path.unlink(missing_ok=True)
+                    continue
+
+                validators = _get_response_validators(response)
 
-            download_to = Path(tmp) / filename
-            with open(str(download_to), "wb") as file_:
-                total_size = int(response.headers.get("content-length", 0))
+                if not filename:
+                    filename = get_filename_from_headers(response)
 
-                communication.start_progress(name=filename, total=total_size)
-                try:
-                    for chunk in response.iter_content(chunk_size=chunk_size):
-                        if chunk:  # ignore keep-alive chunks
+                if not filename:
+                    u = urllib.parse.urlparse(url)
+                    filename = Path(u.path).name
+                    if not filename:
+                        raise errors.ParameterError(f"URL Cannot find a file to download from {url}")
+
+                if response.status_code != 206 and not complete:
+                    offset = 0
+                    new_validator = response.headers.get("etag") or response.headers.get("last-modified")
+                    # NOTE: Content is decoded while it's saved; ranges of an encoded file cannot be appended to it
+                    if new_validator and not response.headers.get("content-encoding"):
+                        validator_path.write_text(new_validator)
+                    else:
+                        validator_path.unlink(missing_ok=True)
+
+                if not progress_started:
+                    total_size = offset if complete else offset + int(response.headers.get("content-length", 0))
+                    communication.start_progress(name=filename, total=total_size)
+                    communication.update_progress(name=filename, amount=offset)
+                    progress_started = True
+
+                hasher = hashlib.new(hash_type) if hash_type else None
+                if hasher and offset:
+                    # NOTE: Hash the previously-downloaded part so that the whole file is hashed while downloading
+                    with open(partial_path, "rb") as previous_part:
+                        for block in iter(lambda: previous_part.read(_MAX_CHUNK_SIZE), b""):
+                            hasher.update(block)
+
+                if not complete:
+                    with open(partial_path, "ab" if offset else "wb") as file_:
+                        for chunk in _iterate_content(response, chunk_size):
                             file_.write(chunk)
+                            if hasher:
+                                hasher.update(chunk)
                             communication.update_progress(name=filename, amount=len(chunk))
-                finally:
+        except (
+            requests.exceptions.ChunkedEncodingError,
+            requests.exceptions.ConnectionError,
+            ProtocolError,
+            ReadTimeoutError,
+        ) as e:
+            if attempt >= max_attempts:
+                if progress_started:
                     communication.finalize_progress(name=filename)
+                raise errors.RequestError(f"Cannot download from {url}") from e
+            continue
+        except (requests.exceptions.HTTPError, urllib.error.HTTPError) as e:  # pragma nocover
+            if progress_started:
+                communication.finalize_progress(name=filename)
+            raise errors.RequestError(f"Cannot download from {url}") from e
+        else:
+            communication.finalize_progress(name=filename)
+            break
 
-    except (requests.exceptions.HTTPError, urllib.error.HTTPError) as e:  # pragma nocover
-        raise errors.RequestError(f"Cannot download from {url}") from e
+    return filename, hasher.hexdigest() if hasher else None, validators
+
+
+def _is_resumed_at(response: requests.Response, offset: int) -> bool:
+    """Whether a partial response continues a partial download of ``offset`` bytes and can be appended to it."""
+    if response.headers.get("content-encoding"):
+        return False
+
+    # NOTE: The header has the form ``bytes <start>-<end>/<size>``
+    content_range = response.headers.get("content-range", "")
+    start = content_range.partition(" ")[2].partition("-")[0]
+
+    return start.isdigit() and int(start) == offset
 
-    if extract:
-        return extract_dataset(download_to)
 
-    return download_to.parent, [download_to]
+def _iterate_content(response: requests.Response, chunk_size: Optional[int]) -> Generator[bytes, None, None]:
+    """Read a response's content in chunks and grow chunks while data arrives faster than ``_TARGET_CHUNK_TIME``."""
+    size = chunk_size or _MIN_CHUNK_SIZE
+
+    while True:
+        start = time.monotonic()
+        chunk = response.raw.read(size, decode_content=True)
+        if not chunk:
+            return
+
+        yield chunk
+
+        if chunk_size is None and len(chunk) == size and time.monotonic() - start < _TARGET_CHUNK_TIME:
+            size = min(size * 2, _MAX_CHUNK_SIZE)
 
 
 def get_filename_from_headers(response):
@@ -196,17 +770,84 @@ def get_filename_from_headers(response):
     return filename
 
 
-@contextmanager
-def _retry(total_requests=5, backoff_factor=0.2, statuses=(500, 502, 503, 504, 429)):
-    """Default HTTP session for requests."""
-    _session = requests.Session()
+class _RequestScopedCookieJar(requests.cookies.RequestsCookieJar):
+    """Cookie jar of a pooled session that doesn't keep cookies of responses.
+
+    Each request has its own copy of the session's jar which keeps cookies that are set while the request follows
+    redirects, so they are sent along the redirect chain but never with other requests.
+    """
+
+    def extract_cookies(self, response, request):
+        """Ignore cookies of a response."""
+
+
+class _SessionManager:
+    """Process-wide pool of HTTP sessions with one keep-alive session per host.
+
+    Sessions are shared by all callers in a process, e.g. requests of different users in the service, so cookies only
+    live for the duration of a single request.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pid: int = os.getpid()
+        self._sessions: Dict[str, requests.Session] = {}
+
+    def get_session(self, url: str) -> requests.Session:
+        """Return the session for a URL's host and create it if needed."""
+        parsed_url = urllib.parse.urlparse(url)
+        key = f"{parsed_url.scheme}://{parsed_url.netloc}".lower()
+
+        with self._lock:
+            # NOTE: Don't share connections with a forked parent process
+            if self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._sessions = {}
+
+            session = self._sessions.get(key)
+            if session is None:
+                session = _create_session()
+                self._sessions[key] = session
+
+            return session
+
+    def close(self) -> None:
+        """Close all sessions and their connections."""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+
+            self._sessions = {}
+
+
+def _create_session(
+    pool_maxsize: int = _RENKU_REQUESTS_POOL_MAXSIZE,
+    total_requests: int = _RENKU_REQUESTS_MAX_RETRIES,
+    backoff_factor: float = 0.2,
+    statuses=(500, 502, 503, 504, 429),
+) -> requests.Session:
+    """Create an HTTP session with connection pooling and retries."""
+    session = requests.Session()
+    # NOTE: Don't keep cookies in the session so that no state leaks between requests that share it
+    session.cookies = _RequestScopedCookieJar()
 
     retries = Retry(total=total_requests, backoff_factor=backoff_factor, status_forcelist=list(statuses))
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=retries)
 
-    _session.mount("http://", HTTPAdapter(max_retries=retries))
-    _session.mount("https://", HTTPAdapter(max_retries=retries))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
 
-    try:
-        yield _session
-    except requests.RequestException as e:
-        raise errors.RequestError("renku operation failed due to network connection failure") from e
+    return session
+
+
+_session_manager = _SessionManager()
+
+
+def get_session(url: str) -> requests.Session:
+    """Return a pooled session for sending requests to a URL's host."""
+    return _session_manager.get_session(url)
+
+
+def close_sessions() -> None:
+    """Close all pooled sessions."""
+    _session_manager.close()
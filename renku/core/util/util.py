@@ -15,15 +15,22 @@
 # limitations under the License.
 """General utility functions."""
 
+import collections
 import concurrent.futures
+import dataclasses
+import logging
 import os
+import threading
+import time
 import uuid
+from enum import Enum, auto
 from pathlib import Path
-from typing import Any, Callable, List, Optional, Tuple, Union
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
 
-import deal
 from packaging.version import Version
 
+logger = logging.getLogger(__name__)
+
 
 def to_string(value: Optional[Any], strip: bool = False) -> str:
     """Return a string representation of value and return an empty string for None."""
@@ -51,35 +58,106 @@ def is_uuid(value):
     return str(uuid_obj) == value
 
 
-@deal.pre(lambda _: _.rate > 0, message="Rate must be positive")
+class ResourceClass(Enum):
+    """Resources that tasks executed by ``parallel_execute`` are bound to."""
+
+    LOCAL_IO = auto()
+    HTTP = auto()
+
+
+# NOTE: Maximum number of concurrent tasks for each host when executing HTTP tasks
+MAX_TASKS_PER_HOST = 4
+
+
+def get_max_workers(resource: ResourceClass) -> int:
+    """Return the maximum number of concurrent tasks for a resource class."""
+    n_cpus = os.cpu_count() or 1
+
+    if resource == ResourceClass.HTTP:
+        return 16
+
+    return min(32, n_cpus + 4)
+
+
+@dataclasses.dataclass
+class ExecutionMetrics:
+    """Timing metrics of tasks executed by ``parallel_execute``."""
+
+    tasks: int = 0
+    queue_wait: float = 0.0
+    run_time: float = 0.0
+    _lock: threading.Lock = dataclasses.field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def add(self, queue_wait: float, run_time: float) -> None:
+        """Record timing of a finished task."""
+        with self._lock:
+            self.tasks += 1
+            self.queue_wait += queue_wait
+            self.run_time += run_time
+
+    @property
+    def mean_queue_wait(self) -> float:
+        """Average seconds that a task waited before it started."""
+        return self.queue_wait / self.tasks if self.tasks else 0.0
+
+    @property
+    def mean_run_time(self) -> float:
+        """Average seconds that a task took to run."""
+        return self.run_time / self.tasks if self.tasks else 0.0
+
+    def log(self, name: str) -> None:
+        """Log the metrics of a batch of tasks."""
+        logger.debug(
+            f"{name}: {self.tasks} tasks, mean queue wait {self.mean_queue_wait:.3f}s, "
+            f"mean run time {self.mean_run_time:.3f}s"
+        )
+
+
 def parallel_execute(
-    function: Callable[..., List[Any]], *data: Union[Tuple[Any, ...], List[Any]], rate: float = 1, **kwargs
+    function: Callable[..., List[Any]],
+    *data: Union[Tuple[Any, ...], List[Any]],
+    resource: ResourceClass = ResourceClass.LOCAL_IO,
+    get_host: Optional[Callable[..., Optional[str]]] = None,
+    max_workers: Optional[int] = None,
+    metrics: Optional[ExecutionMetrics] = None,
+    **kwargs,
 ) -> List[Any]:
     """Execute the function using multiple threads.
 
     Args:
         function(Callable[..., Any]): Function to parallelize. Must accept at least one parameter and returns a list.
         data(Union[Tuple[Any], List[Any]]): List of data where each of its elements is passed to a function's execution.
-        rate(float): Number of executions per thread per second.
+        resource(ResourceClass): Resource that executions are bound to; it defines number of concurrent executions
+            (Default value = ResourceClass.LOCAL_IO).
+        get_host(Optional[Callable[..., Optional[str]]]): A function that receives each execution's data and returns
+            the host it connects to. Concurrency limits of ``HTTP`` executions are applied per host; executions
+            without a host only share the overall limit (Default value = None).
+        max_workers(Optional[int]): Override maximum number of concurrent executions (Default value = None).
+        metrics(Optional[ExecutionMetrics]): An object to collect queue wait and run time of executions
+            (Default value = None).
 
     Returns:
         List[Any]: A list of return results of all executions.
 
     """
     from renku.core.util import communication
-    from renku.core.util.contexts import wait_for
     from renku.domain_model.project_context import project_context
 
     listeners = communication.get_listeners()
 
-    def subscribe_communication_listeners(delay: float, path: Path, function, *data, **kwargs):
+    def subscribe_communication_listeners(submit_time: float, path: Path, function, *data, **kwargs):
         try:
             for communicator in listeners:
                 communication.subscribe(communicator)
             if not project_context.has_context(path):
                 project_context.push_path(path)
-            with wait_for(delay):
+
+            start_time = time.monotonic()
+            try:
                 return function(*data, **kwargs)
+            finally:
+                if metrics is not None:
+                    metrics.add(queue_wait=start_time - submit_time, run_time=time.monotonic() - start_time)
         finally:
             for communicator in listeners:
                 communication.unsubscribe(communicator)
@@ -87,21 +165,45 @@ def parallel_execute(
     # NOTE: Disable parallelization during tests for easier debugging
     if is_test_session_running():
         max_workers = 1
-        delay = 0.0
-    else:
-        n_cpus = os.cpu_count() or 1
-        max_workers = min(n_cpus + 4, 8)
-        delay = max_workers / rate if len(data[0]) > max_workers else 0
+    elif max_workers is None:
+        max_workers = get_max_workers(resource)
+
+    # NOTE: HTTP executions are queued per host and only submitted while their host has a free slot, so that a busy
+    # host doesn't occupy worker threads that executions for other hosts could use
+    pending: Dict[Optional[str], Deque[Tuple[Any, ...]]] = collections.defaultdict(collections.deque)
+    for d in zip(*data):
+        host = get_host(*d) if get_host else None
+        pending[host].append(d)
+
+    running: Dict[Optional[str], int] = collections.defaultdict(int)
 
     files = []
     with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
-        futures = {
-            executor.submit(subscribe_communication_listeners, delay, project_context.path, function, *d, **kwargs)
-            for d in zip(*data)
-        }
-
-        for future in concurrent.futures.as_completed(futures):
-            files.extend(future.result())
+        futures: Dict[concurrent.futures.Future, Optional[str]] = {}
+
+        def submit_ready():
+            for host, queue in pending.items():
+                limited = resource == ResourceClass.HTTP and host is not None
+                while queue and (not limited or running[host] < MAX_TASKS_PER_HOST):
+                    future = executor.submit(
+                        subscribe_communication_listeners,
+                        time.monotonic(),
+                        project_context.path,
+                        function,
+                        *queue.popleft(),
+                        **kwargs,
+                    )
+                    futures[future] = host
+                    running[host] += 1
+
+        submit_ready()
+        while futures:
+            done, _ = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                running[futures.pop(future)] -= 1
+                files.extend(future.result())
+
+            submit_ready()
 
     return files
 
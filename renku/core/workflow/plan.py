@@ -873,7 +873,7 @@ def _check_workflow_touches_existing_files(
     if isinstance(workflow, Plan):
         for activity in activity_map.get(workflow.id, []):
             for output in activity.generations:
-                if (project_context.path / output.entity.path).exists():
+                if _path_exists(output.entity.path):
                     return cache.setdefault(workflow.id, True)
     else:
         for child in workflow.plans:
@@ -883,6 +883,15 @@ def _check_workflow_touches_existing_files(
     return cache.setdefault(workflow.id, False)
 
 
+def _path_exists(path: str) -> bool:
+    """Check if a path exists in the project; paths outside a sparse checkout are looked up in the HEAD commit."""
+    if (project_context.path / path).exists():
+        return True
+
+    repository = project_context.repository
+    return repository.is_sparse and any(repository.get_existing_paths_in_revision([path], revision="HEAD"))
+
+
 def _get_plan_duration(
     workflow: Union[Plan, CompositePlan],
     cache: Dict[str, Optional[timedelta]],
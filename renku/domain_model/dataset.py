@@ -456,8 +456,17 @@ class Dataset(Persistent):
 
     def __setstate__(self, state):
         super().__setstate__(state)
+        # NOTE: Volatile attributes aren't persisted; the files index is rebuilt on its first use
+        self._v_files_index = None
         self.correct_linked_files()
 
+    def __setattr__(self, key, value):
+        if key == "dataset_files":
+            # NOTE: Invalidate the files index whenever the list of files is replaced
+            super().__setattr__("_v_files_index", None)
+
+        super().__setattr__(key, value)
+
     def correct_linked_files(self):
         """Fix linked dataset files."""
         for file in self.dataset_files:
@@ -595,14 +604,31 @@ class Dataset(Persistent):
         """Return true if dataset is removed."""
         return self.date_removed is not None
 
+    def _get_files_index(self) -> Dict[str, DatasetFile]:
+        """Return a mapping from path to not-removed files and build it if needed."""
+        files_index = getattr(self, "_v_files_index", None)
+
+        if files_index is None:
+            files_index = {}
+            for file in self.dataset_files:
+                if not file.is_removed():
+                    files_index.setdefault(str(file.entity.path), file)
+
+            self._v_files_index = files_index
+
+        return files_index
+
     def find_file(self, path: Union[Path, str]) -> Optional[DatasetFile]:
         """Find a file in the dataset using its relative path."""
         path = str(path)
-        for file in self.dataset_files:
-            if str(file.entity.path) == path and not file.is_removed():
-                return file
+        file = self._get_files_index().get(path)
+
+        if file is not None and file.is_removed():
+            # NOTE: File was removed without updating the index
+            self._v_files_index = None
+            file = self._get_files_index().get(path)
 
-        return None
+        return file
 
     def update_files_from(self, current_dataset: "Dataset", date: Optional[datetime] = None):
         """Check `current_files` to reuse existing entries and mark removed files."""
@@ -681,6 +707,7 @@ class Dataset(Persistent):
             return None
 
         file.remove()
+        self._get_files_index().pop(str(path), None)
 
         return file
 
@@ -697,20 +724,31 @@ class Dataset(Persistent):
         if isinstance(files, DatasetFile):
             files = [files]
 
-        new_files = []
+        new_files: Dict[str, DatasetFile] = {}
+        replaced_files = set()
 
         for file in cast(List[DatasetFile], files):
-            existing_file = self.find_file(file.entity.path)
+            path = str(file.entity.path)
+            existing_file = new_files.get(path) or self.find_file(path)
             if not existing_file:
-                new_files.append(file)
+                new_files[path] = file
             elif file.entity.checksum != existing_file.entity.checksum or file.date_added != existing_file.date_added:
-                self.dataset_files.remove(existing_file)
-                new_files.append(file)
+                replaced_files.add(id(existing_file))
+                new_files[path] = file
 
         if not new_files:
             return
 
-        self.dataset_files += new_files
+        files_index = self._get_files_index()
+
+        if replaced_files:
+            self.dataset_files = [f for f in self.dataset_files if id(f) not in replaced_files]
+
+        # NOTE: Extend the list in-place to avoid copying it for each call
+        self.dataset_files.extend(new_files.values())
+
+        files_index.update(new_files)
+        self._v_files_index = files_index
         self._p_changed = True
 
     def clear_files(self):
@@ -22,6 +22,7 @@ import math
 import os
 import subprocess
 import tempfile
+import threading
 from collections import defaultdict
 from datetime import datetime
 from enum import Enum
@@ -57,6 +58,15 @@ _MARKER = object()
 GIT_IGNORE = ".gitignore"
 
 
+# NOTE: Git attributes that make a file's content differ from its committed content
+CONTENT_CHANGING_ATTRIBUTES = ("filter", "text", "eol", "crlf", "ident", "working-tree-encoding")
+
+
+def has_content_changing_attributes(attributes: Dict[str, str]) -> bool:
+    """Return True if any of the attributes changes a file's content when it's checked out."""
+    return any(attributes.get(a, "unspecified") not in ("unset", "unspecified") for a in CONTENT_CHANGING_ATTRIBUTES)
+
+
 def git_unicode_unescape(s: Optional[str], encoding: str = "utf-8") -> str:
     """Undoes git/GitPython unicode encoding."""
     if s is None:
@@ -67,6 +77,17 @@ def git_unicode_unescape(s: Optional[str], encoding: str = "utf-8") -> str:
     return s
 
 
+def parse_cat_file_header(header: bytes) -> Optional[Tuple[bytes, int]]:
+    """Return type and size of an object from a ``git cat-file --batch`` header or ``None`` if it doesn't exist."""
+    # NOTE: Missing objects are reported as "<object> missing" where "<object>" may contain whitespace
+    header = header.rstrip(b"\n")
+    if header.endswith((b" missing", b" ambiguous")):
+        return None
+
+    _, object_type, size = header.rsplit(b" ", 2)
+    return object_type, int(size)
+
+
 def split_paths(*paths):
     """Return a generator with split list of paths."""
     argument_batch_size = 100
@@ -204,6 +225,16 @@ class BaseRepository:
         """Return absolute paths of all files in the index and untracked files."""
         return [os.path.join(self.path, path) for path in itertools.chain(self.files, self.untracked_files)]
 
+    @property
+    def is_sparse(self) -> bool:
+        """Return True if only a subset of files are checked out."""
+        return self._get_config_value("core.sparseCheckout") == "true"
+
+    @property
+    def is_partial_clone(self) -> bool:
+        """Return True if the repository is a partial (e.g. blob-less) clone and fetches missing objects on demand."""
+        return self._get_promisor_remote() is not None
+
     @property
     def lfs(self) -> "LFS":
         """Return a Git LFS manager."""
@@ -275,6 +306,45 @@ class BaseRepository:
 
         self.run_git_command("checkout", reference)
 
+    def add_sparse_checkout_paths(self, *paths: Union[Path, str]) -> None:
+        """Check out directories in a sparse checkout; it's a no-op if the repository isn't sparse."""
+        if not paths or not self.is_sparse:
+            return
+
+        self.run_git_command("sparse-checkout", "add", *[str(p) for p in paths])
+
+    def fetch_missing_objects(self, checksums: Sequence[str]) -> None:
+        """Fetch objects of a partial clone in a single request instead of fetching them one by one on demand."""
+        if not checksums or not self.is_partial_clone:
+            return
+
+        remote = self._get_promisor_remote()
+
+        try:
+            # NOTE: This is how Git fetches missing objects of a partial clone
+            subprocess.run(
+                [
+                    "git",
+                    "-c",
+                    "fetch.negotiationAlgorithm=noop",
+                    "fetch",
+                    str(remote),
+                    "--no-tags",
+                    "--no-write-fetch-head",
+                    "--recurse-submodules=no",
+                    "--filter=blob:none",
+                    "--stdin",
+                ],
+                check=True,
+                input="".join(f"{checksum}\n" for checksum in checksums).encode("utf-8"),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                cwd=self.path,
+            )
+        except subprocess.CalledProcessError:
+            # NOTE: Objects that aren't fetched are fetched on demand when they are read
+            pass
+
     def clean(self, paths: Optional[Sequence[Union[Path, str]]] = None):
         """Remove untracked files."""
         self.run_git_command("clean", "-xdff", paths)
@@ -401,6 +471,31 @@ class BaseRepository:
             raise errors.ParameterError("Repository not set.")
         return self._repository.is_dirty(untracked_files=untracked_files, submodules=False)
 
+    def _get_config_value(self, name: str) -> Optional[str]:
+        """Return value of a Git configuration or None if it's not set."""
+        try:
+            return self.run_git_command("config", "--get", name)
+        except errors.GitCommandError:
+            return None
+
+    def _get_promisor_remote(self) -> Optional[str]:
+        """Return name of the remote that a partial clone fetches missing objects from."""
+        remote = self._get_config_value("extensions.partialClone")
+        if remote:
+            return remote
+
+        try:
+            promisors = self.run_git_command("config", "--get-regexp", r"^remote\..*\.promisor$")
+        except errors.GitCommandError:
+            return None
+
+        for line in promisors.splitlines():
+            key, _, value = line.rpartition(" ")
+            if value == "true":
+                return key[len("remote.") : -len(".promisor")]
+
+        return None
+
     def run_git_command(self, command: str, *args, **kwargs) -> str:
         """Run a git command in this repository."""
         if self._repository is None:
@@ -593,6 +688,62 @@ class BaseRepository:
 
         return Path(output).read_text()
 
+    def get_raw_contents(
+        self, *, paths: Sequence[Union[Path, str]], revision: str = "HEAD"
+    ) -> Dict[Union[Path, str], Optional[bytes]]:
+        """Get raw content of multiple files in a given revision using a single ``git cat-file --batch`` process.
+
+        NOTE: Content is read in memory; use it only for small objects like LFS pointer files.
+
+        Args:
+            paths(Sequence[Union[Path, str]]): Relative or absolute paths of files to read.
+            revision(str): A commit/branch/tag to get files from (Default value = "HEAD").
+
+        Returns:
+            Dict[Union[Path, str], Optional[bytes]]: A mapping from each input path to its raw content or ``None`` if
+                the path does not exist in ``revision``.
+        """
+        if not paths:
+            return {}
+
+        relative_paths = [os.path.relpath(get_absolute_path(p, self.path), self.path) for p in paths]
+        request = "".join(f"{revision}:{p}\n" for p in relative_paths)
+
+        try:
+            result = subprocess.run(
+                ["git", "cat-file", "--batch"],
+                check=True,
+                input=request.encode("utf-8"),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                cwd=self.path,
+            )
+        except subprocess.CalledProcessError as e:
+            raise errors.GitCommandError(message="Cannot read objects using 'git cat-file --batch'.") from e
+
+        contents: Dict[Union[Path, str], Optional[bytes]] = {}
+        output = result.stdout
+        position = 0
+
+        for path in paths:
+            end_of_header = output.index(b"\n", position)
+            header = parse_cat_file_header(output[position:end_of_header])
+            position = end_of_header + 1
+
+            if header is None or header[0] != b"blob":
+                # NOTE: Object is missing, ambiguous, or not a file
+                contents[path] = None
+                if header is not None:
+                    position += header[1] + 1
+                continue
+
+            size = header[1]
+            contents[path] = output[position : position + size]
+            # NOTE: Each object's content is followed by a newline
+            position += size + 1
+
+        return contents
+
     def copy_content_to_file(
         self,
         path: Union[Path, str],
@@ -689,6 +840,115 @@ class BaseRepository:
 
         raise errors.FileNotFound(path, checksum=checksum, revision=revision)
 
+    def copy_contents_to_files(
+        self,
+        *,
+        paths: Sequence[Union[Path, str]],
+        checksums: Sequence[str],
+        output_paths: Sequence[Union[Path, str]],
+    ) -> None:
+        """Write content of multiple objects to files; this is a batched version of ``copy_content_to_file``.
+
+        All objects are streamed through a single ``git cat-file --batch`` process and LFS objects that aren't available
+        locally are fetched with a single ``git lfs fetch``. Objects that need other Git filters or that cannot be found
+        are copied using ``copy_content_to_file``.
+
+        Args:
+            paths(Sequence[Union[Path, str]]): Relative or absolute paths of the files in the repository.
+            checksums(Sequence[str]): Git hash of each file.
+            output_paths(Sequence[Union[Path, str]]): Path to copy each file's content to.
+        """
+        from renku.core.util.os import COPY_CHUNK_SIZE, copy_file_fast
+
+        assert len(paths) == len(checksums) == len(output_paths), "Each path must have a checksum and an output path"
+
+        if not paths:
+            return
+
+        relative_paths = [os.path.relpath(get_absolute_path(p, self.path), self.path) for p in paths]
+        attributes = self.get_attributes(*relative_paths)
+        self.fetch_missing_objects(checksums=checksums)
+        pointers: List[Tuple[int, str]] = []
+        fallbacks: List[int] = []
+
+        process = subprocess.Popen(
+            ["git", "cat-file", "--batch"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=self.path,
+        )
+        assert process.stdin is not None and process.stdout is not None
+
+        def write_requests(stdin):
+            # NOTE: Write requests in a separate thread so that a full stdout pipe cannot block the process
+            try:
+                for checksum in checksums:
+                    stdin.write(f"{checksum}\n".encode("utf-8"))
+                stdin.close()
+            except BrokenPipeError:
+                pass
+
+        writer = threading.Thread(target=write_requests, args=(process.stdin,), daemon=True)
+        writer.start()
+
+        try:
+            for index, output_path in enumerate(output_paths):
+                header = parse_cat_file_header(process.stdout.readline())
+                if header is None:  # NOTE: Object is missing or ambiguous
+                    fallbacks.append(index)
+                    continue
+
+                object_type, remaining = header
+                if object_type != b"blob":
+                    fallbacks.append(index)
+                    process.stdout.read(remaining + 1)
+                    continue
+
+                if remaining <= LFS.POINTER_MAX_SIZE:
+                    content = process.stdout.read(remaining + 1)[:-1]
+                    oid = LFS.get_pointer_oid(content)
+                    if oid:
+                        pointers.append((index, oid))
+                    elif has_content_changing_attributes(attributes.get(relative_paths[index], {})):
+                        fallbacks.append(index)
+                    else:
+                        Path(output_path).write_bytes(content)
+                    continue
+
+                if has_content_changing_attributes(attributes.get(relative_paths[index], {})):
+                    fallbacks.append(index)
+                    output_path = os.devnull
+
+                with open(output_path, "wb") as output_file:
+                    while remaining > 0:
+                        chunk = process.stdout.read(min(remaining, COPY_CHUNK_SIZE))
+                        if not chunk:
+                            raise errors.GitCommandError(message="Unexpected end of 'git cat-file --batch' output.")
+                        output_file.write(chunk)
+                        remaining -= len(chunk)
+                # NOTE: Each object's content is followed by a newline
+                process.stdout.read(1)
+        finally:
+            process.stdout.close()
+            process.kill()
+            process.wait()
+            writer.join()
+
+        missing_objects = [(i, oid) for i, oid in pointers if not self.lfs.get_object_path(oid).exists()]
+        if missing_objects:
+            self.lfs.fetch_objects(checksums=[checksums[i] for i, _ in missing_objects])
+
+        for index, oid in pointers:
+            object_path = self.lfs.get_object_path(oid)
+            if object_path.exists():
+                copy_file_fast(object_path, output_paths[index])
+            else:
+                fallbacks.append(index)
+
+        for index in fallbacks:
+            self.copy_content_to_file(path=paths[index], checksum=checksums[index], output_path=output_paths[index])
+
     def get_object_hashes(
         self, paths: List[Union[Path, str]], revision: Optional[str] = None
     ) -> Dict[Union[Path, str], Optional[str]]:
@@ -1030,6 +1290,27 @@ class Repository(BaseRepository):
         else:
             return cls(path=path, repository=repository)
 
+    @staticmethod
+    def list_remote_references(url: Union[Path, str], *patterns: str) -> Dict[str, str]:
+        """Return a map from references of a remote repository to their commit SHA without cloning it."""
+        try:
+            output = git.cmd.Git().ls_remote(str(url), *patterns)
+        except git.GitCommandError as e:
+            raise errors.GitCommandError(
+                message=f"Git command failed: {str(e)}",
+                command=e.command,
+                stdout=e.stdout,
+                stderr=e.stderr,
+                status=e.status,
+            ) from e
+
+        references = {}
+        for line in output.splitlines():
+            sha, _, reference = line.partition("\t")
+            references[reference] = sha
+
+        return references
+
     @classmethod
     def initialize(cls, path: Union[Path, str], *, bare: bool = False, branch: Optional[str] = None) -> "Repository":
         """Initialize a git repository."""
@@ -1053,9 +1334,73 @@ class Repository(BaseRepository):
 class LFS:
     """Git LFS manager."""
 
+    # NOTE: Git LFS doesn't consider blobs larger than this as pointer files
+    POINTER_MAX_SIZE = 1024
+
+    POINTER_HEADER = b"version https://git-lfs.github.com/spec/"
+
     def __init__(self, repository: BaseRepository):
         self._repository: BaseRepository = repository
 
+    @staticmethod
+    def get_pointer_oid(content: bytes) -> Optional[str]:
+        """Return the object id of an LFS pointer's content or None if content isn't an LFS pointer."""
+        if len(content) > LFS.POINTER_MAX_SIZE or not content.startswith(LFS.POINTER_HEADER):
+            return None
+
+        for line in content.decode("utf-8", errors="replace").splitlines():
+            if line.startswith("oid sha256:"):
+                return line.split(":", 1)[1].strip()
+
+        return None
+
+    def get_object_path(self, oid: str) -> Path:
+        """Return path of an object in the local LFS storage."""
+        return self._repository.path / ".git" / "lfs" / "objects" / oid[:2] / oid[2:4] / oid
+
+    def fetch_objects(self, checksums: Sequence[str]) -> None:
+        """Fetch LFS objects of multiple pointer blobs from the remote using a single ``git lfs fetch``.
+
+        ``git lfs fetch`` only accepts refs; so, a commit that contains all pointer blobs is created and its LFS objects
+        are fetched. The commit isn't referenced by any branch and is removed by Git's garbage collection.
+
+        Args:
+            checksums(Sequence[str]): Git hash of LFS pointer blobs.
+        """
+        remotes = [remote.name for remote in self._repository.remotes]
+        if not checksums or not remotes:
+            return
+
+        remote = "origin" if "origin" in remotes else remotes[0]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            env = {
+                **os.environ,
+                "GIT_INDEX_FILE": os.path.join(tmp, "index"),
+                "GIT_AUTHOR_NAME": "renku",
+                "GIT_AUTHOR_EMAIL": "renku@renkulab.io",
+                "GIT_COMMITTER_NAME": "renku",
+                "GIT_COMMITTER_EMAIL": "renku@renkulab.io",
+            }
+            index_info = "".join(f"100644 blob {checksum}\t{index}\0" for index, checksum in enumerate(checksums))
+
+            try:
+                subprocess.run(
+                    ["git", "update-index", "-z", "--index-info"],
+                    check=True,
+                    input=index_info.encode("utf-8"),
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    cwd=self._repository.path,
+                    env=env,
+                )
+                tree = self._repository.run_git_command("write-tree", env=env)
+                commit = self._repository.run_git_command("commit-tree", tree, "-m", "Fetch LFS objects", env=env)
+                self._repository.run_git_command("lfs", "fetch", remote, commit)
+            except (subprocess.CalledProcessError, errors.GitCommandError):
+                # NOTE: Objects that aren't fetched are retrieved one by one by the caller
+                pass
+
     def install(self, skip_smudge: bool = True):
         """Force install Git LFS in the repository."""
         os.environ["GIT_LFS_SKIP_SMUDGE"] = "1" if skip_smudge else "0"
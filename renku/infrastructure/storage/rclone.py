@@ -19,12 +19,16 @@
 import json
 import os
 import posixpath
+import shutil
 import subprocess
+import tempfile
+from collections import defaultdict
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from renku.core import errors
 from renku.core.interface.storage import FileHash, IStorage
+from renku.core.util.util import ResourceClass, get_max_workers
 from renku.domain_model.constant import NO_VALUE
 
 
@@ -35,6 +39,30 @@ class RCloneStorage(IStorage):
         """Download data from ``uri`` to ``destination``."""
         self.run_command_with_uri("copyto", uri, destination)
 
+    def download_many(self, uris_and_destinations: List[Tuple[str, Union[Path, str]]]) -> None:
+        """Download data from a list of ``(uri, destination)`` pairs with one RClone command per storage root."""
+        uris = [self.provider.convert_to_storage_uri(uri) for uri, _ in uris_and_destinations]
+
+        for root, items in group_by_common_root(uris).items():
+            paths = [path for _, path in items]
+            destinations = [Path(uris_and_destinations[index][1]) for index, _ in items]
+            directory = get_common_destination(paths=paths, destinations=destinations)
+
+            if directory:
+                self.run_command_with_files("copy", root, directory, paths=paths)
+            else:
+                # NOTE: Destinations don't have the same layout as the storage; download to a temporary directory first
+                with tempfile.TemporaryDirectory() as staging:
+                    self.run_command_with_files("copy", root, staging, paths=paths)
+                    for path, destination in zip(paths, destinations):
+                        if os.path.exists(os.path.join(staging, path)):
+                            destination.parent.mkdir(parents=True, exist_ok=True)
+                            shutil.move(os.path.join(staging, path), destination)
+
+            missing = [str(d) for d in destinations if not d.exists()]
+            if missing:
+                raise errors.StorageObjectNotFound(f"Cannot download these files from '{root}': {', '.join(missing)}")
+
     def exists(self, uri: str) -> bool:
         """Checks if a remote storage URI exists."""
         try:
@@ -126,6 +154,42 @@ class RCloneStorage(IStorage):
 
         return configurations
 
+    def stat_many(self, uris: List[str], hash_type: str = "md5") -> Dict[str, Optional[FileHash]]:
+        """Get size and hash of files at a list of URIs with one RClone command per storage root."""
+        storage_uris = [self.provider.convert_to_storage_uri(uri) for uri in uris]
+        result: Dict[str, Optional[FileHash]] = {uri: None for uri in uris}
+
+        for root, items in group_by_common_root(storage_uris).items():
+            try:
+                output = self.run_command_with_files(
+                    "lsjson",
+                    root,
+                    paths=[path for _, path in items],
+                    recursive=True,
+                    files_only=True,
+                    no_mimetype=True,
+                    hash=True,
+                    hash_type=hash_type,
+                )
+                entries = json.loads(output)
+            except errors.StorageObjectNotFound:
+                continue
+            except json.JSONDecodeError as e:
+                raise errors.RCloneException(f"Cannot parse command output: {e}")
+
+            entries_by_path = {entry["Path"]: entry for entry in entries}
+            for index, path in items:
+                entry = entries_by_path.get(path)
+                if entry is not None:
+                    result[uris[index]] = FileHash(
+                        uri=uris[index],
+                        path=entry["Name"],
+                        size=entry.get("Size"),
+                        hash=entry.get("Hashes", {}).get(hash_type),
+                    )
+
+        return result
+
     def list_files(self, uri: str, *args, **kwargs) -> List[Dict[str, Any]]:
         """List a URI and return results in JSON format."""
         hashes_raw = self.run_command_with_uri("lsjson", uri, *args, **kwargs)
@@ -148,12 +212,51 @@ class RCloneStorage(IStorage):
         """Run a RClone command with storage-specific configuration."""
         return run_rclone_command(command, *args, **kwargs, env=self.get_configurations())
 
+    def run_command_with_files(self, command: str, *args, paths: List[str], **kwargs) -> Any:
+        """Run a RClone command that transfers/lists only the given ``paths`` in parallel.
+
+        Args:
+            command(str): RClone command.
+            paths(List[str]): Paths relative to the source of the command.
+
+        Returns:
+            Output of the command.
+        """
+        fd, files_from = tempfile.mkstemp(suffix=".txt")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.writelines(f"{path}\n" for path in paths)
+
+            workers = get_max_workers(ResourceClass.HTTP)
+
+            # NOTE: ``--files-from-raw`` doesn't treat lines starting with ``#`` or ``;`` as comments
+            return self.run_command(
+                command, *args, files_from_raw=files_from, transfers=workers, checkers=workers, **kwargs
+            )
+        finally:
+            os.unlink(files_from)
+
     def upload(self, source: Union[Path, str], uri: str) -> None:
         """Upload data from ``source`` to ``uri``."""
         uri = self.provider.convert_to_storage_uri(uri)
 
         self.run_command("copyto", source, uri)
 
+    def upload_many(self, sources_and_uris: List[Tuple[Union[Path, str], str]]) -> None:
+        """Upload data from a list of ``(source, uri)`` pairs with one RClone command per storage root."""
+        uris = [self.provider.convert_to_storage_uri(uri) for _, uri in sources_and_uris]
+
+        for root, items in group_by_common_root(uris).items():
+            # NOTE: Sources can be anywhere; link them in a temporary directory with the same layout as the storage
+            with tempfile.TemporaryDirectory() as staging:
+                for index, path in items:
+                    link = Path(staging) / path
+                    link.parent.mkdir(parents=True, exist_ok=True)
+                    link.unlink(missing_ok=True)
+                    link.symlink_to(Path(sources_and_uris[index][0]).resolve())
+
+                self.run_command_with_files("copy", staging, root, paths=[path for _, path in items], copy_links=True)
+
 
 def run_rclone_command(command: str, *args: Any, env=None, **kwargs) -> str:
     """Execute an RClone command."""
@@ -211,6 +314,58 @@ def transform_kwargs(**kwargs) -> List[str]:
     return all_args
 
 
+def group_by_common_root(uris: List[str]) -> Dict[str, List[Tuple[int, str]]]:
+    """Group URIs by their longest common directory.
+
+    URIs from different buckets/containers are never put in the same group.
+
+    Args:
+        uris(List[str]): List of URIs.
+
+    Returns:
+        Dict[str, List[Tuple[int, str]]]: A mapping from a common directory to a list of index and path relative to the
+            directory of the URIs that are in the group.
+    """
+    buckets: Dict[str, List[Tuple[int, List[str]]]] = defaultdict(list)
+    for index, uri in enumerate(uris):
+        parts = uri.split("/")
+        bucket = "/".join(parts[:3]) if "://" in uri else ""
+        buckets[bucket].append((index, parts))
+
+    groups: Dict[str, List[Tuple[int, str]]] = {}
+    for items in buckets.values():
+        common = items[0][1][:-1]
+        for _, parts in items[1:]:
+            length = 0
+            for common_part, part in zip(common, parts[:-1]):
+                if common_part != part:
+                    break
+                length += 1
+            common = common[:length]
+
+        root = "/".join(common)
+        groups[root] = [(index, "/".join(parts[len(common) :])) for index, parts in items]
+
+    return groups
+
+
+def get_common_destination(paths: List[str], destinations: List[Path]) -> Optional[Path]:
+    """Return a directory that has all ``destinations`` at their corresponding relative ``paths`` (if any)."""
+    directory: Optional[Path] = None
+    for path, destination in zip(paths, destinations):
+        destination_parts = destination.parts
+        path_parts = tuple(path.split("/"))
+        if destination_parts[-len(path_parts) :] != path_parts:
+            return None
+        parent = Path(*destination_parts[: -len(path_parts)])
+        if directory is None:
+            directory = parent
+        elif directory != parent:
+            return None
+
+    return directory
+
+
 def get_rclone_env_var_name(provider_name, name) -> str:
     """Get name of an RClone env var config."""
     # See https://rclone.org/docs/#config-file
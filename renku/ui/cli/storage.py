@@ -63,6 +63,13 @@ to free up space locally, you can run:
 
 This removes any data cached locally for files tracked in in git LFS.
 
+To only free a certain amount of space, pass ``--free`` with the size to
+reclaim. Files that were least recently accessed are cleaned first:
+
+.. code-block:: console
+
+    $ renku storage clean --free 10GB data/
+
 Migrate large files to git LFS
 ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
@@ -115,13 +122,31 @@ def pull(paths):
 
 @storage.command()
 @click.argument("paths", type=click.Path(exists=True, dir_okay=True), nargs=-1, required=True)
-def clean(paths):
+@click.option(
+    "--free",
+    "target_size",
+    default=None,
+    help="Only free this much space (e.g. '10GB') by cleaning least recently accessed files first.",
+)
+def clean(paths, target_size):
     """Remove files from lfs cache/turn them back into pointer files."""
+    from humanize import naturalsize  # Slow import
+
     from renku.command.storage import clean_command
+    from renku.core.util.os import parse_file_size
+
+    if target_size is not None:
+        try:
+            target_size = parse_file_size(target_size)
+        except ValueError as e:
+            raise click.BadParameter(str(e), param_hint="--free")
 
     communicator = ClickCallback()
-    clean_command().with_communicator(communicator).build().execute(paths=paths)
+    reclaimed_size = (
+        clean_command().with_communicator(communicator).build().execute(paths=paths, target_size=target_size).output
+    )
 
+    click.echo(f"Reclaimed {naturalsize(reclaimed_size or 0)}")
     click.secho("OK", fg=color.GREEN)
 
 
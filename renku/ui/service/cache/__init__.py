@@ -17,11 +17,14 @@
 from renku.ui.service.cache.files import FileManagementCache
 from renku.ui.service.cache.jobs import JobManagementCache
 from renku.ui.service.cache.projects import ProjectManagementCache
+from renku.ui.service.cache.responses import ResponseManagementCache
 from renku.ui.service.cache.users import UserManagementCache
 from renku.ui.service.config import CACHE_PROJECTS_PATH, CACHE_UPLOADS_PATH
 
 
-class ServiceCache(FileManagementCache, ProjectManagementCache, JobManagementCache, UserManagementCache):
+class ServiceCache(
+    FileManagementCache, ProjectManagementCache, JobManagementCache, UserManagementCache, ResponseManagementCache
+):
     """Service cache manager."""
 
     pass
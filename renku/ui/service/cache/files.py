@@ -15,9 +15,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Renku service files cache management."""
+from typing import Optional
+
 from renku.ui.service.cache.base import BaseCache
 from renku.ui.service.cache.models.file import File, FileChunk
-from renku.ui.service.cache.models.user import User
 from renku.ui.service.cache.serializers.file import FileChunkSchema, FileSchema
 
 
@@ -52,33 +53,54 @@ class FileManagementCache(BaseCache):
     @staticmethod
     def get_file(user, file_id):
         """Get user file."""
-        try:
-            record = File.get((File.file_id == file_id) & (File.user_id == user.user_id))
-        except ValueError:
-            return
-
-        return record
+        return File.find(file_id, user_id=user.user_id)
 
     @staticmethod
     def get_files(user):
         """Get all user cached files."""
-        return File.query(File.user_id == user.user_id)
+        return File.iterate(File.user_id, user.user_id)
 
     @staticmethod
     def get_chunks(user, chunked_id=None):
         """Get all user chunks for a file."""
         if chunked_id is not None:
-            return FileChunk.query(FileChunk.user_id == user.user_id and FileChunk.chunked_id == chunked_id)
-        return FileChunk.query(FileChunk.user_id == user.user_id)
+            return (
+                chunk for chunk in FileChunk.iterate(FileChunk.chunked_id, chunked_id) if chunk.user_id == user.user_id
+            )
+        return FileChunk.iterate(FileChunk.user_id, user.user_id)
 
-    @staticmethod
-    def invalidate_chunks(user, chunked_id):
-        """Remove all user chunks for a file."""
-        chunks = FileChunk.query(FileChunk.user_id == user.user_id and FileChunk.chunked_id == chunked_id)
+    def _received_chunks_key(self, user, chunked_id) -> str:
+        """Name of the set of chunk indices received for a chunked upload."""
+        return f"{self.namespace}.chunks.{user.user_id}.{chunked_id}"
+
+    def add_received_chunk(self, user, chunked_id, chunk_index) -> Optional[int]:
+        """Record that a chunk of a chunked upload was received.
+
+        Args:
+            user: The user uploading the file.
+            chunked_id: Id of the chunked upload.
+            chunk_index: Index of the received chunk.
+
+        Returns:
+            Optional[int]: Number of distinct chunks received so far or ``None`` if the chunk was received before.
+        """
+        key = self._received_chunks_key(user, chunked_id)
 
-        for chunk in chunks:
+        with self.cache.pipeline() as pipeline:
+            pipeline.sadd(key, chunk_index)
+            pipeline.scard(key)
+            pipeline.expire(key, FileChunk.default_ttl())
+            added, received, _ = pipeline.execute()
+
+        return received if added else None
+
+    def invalidate_chunks(self, user, chunked_id):
+        """Remove all user chunks for a file."""
+        for chunk in list(self.get_chunks(user, chunked_id)):
             chunk.delete()
 
+        self.cache.delete(self._received_chunks_key(user, chunked_id))
+
     @staticmethod
     def invalidate_file(user, file_id):
         """Remove users file records."""
@@ -89,12 +111,14 @@ class FileManagementCache(BaseCache):
 
         return file_obj
 
-    def user_files(self):
-        """Iterate through all cached files."""
-        for user in User.all():
-            yield user, self.get_files(user)
+    @staticmethod
+    def expired_files():
+        """Iterate through cached files older than their time to live, oldest first."""
+        File.rebuild_age_index()
+        return File.iterate_by_age(max_age=File.default_ttl())
 
-    def user_chunks(self):
-        """Iterate through all cached files."""
-        for user in User.all():
-            yield user, self.get_chunks(user)
+    @staticmethod
+    def expired_chunks():
+        """Iterate through cached file chunks older than their time to live, oldest first."""
+        FileChunk.rebuild_age_index()
+        return FileChunk.iterate_by_age(max_age=FileChunk.default_ttl())
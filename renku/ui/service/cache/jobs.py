@@ -16,7 +16,7 @@
 # limitations under the License.
 """Renku service jobs management."""
 from renku.ui.service.cache.base import BaseCache
-from renku.ui.service.cache.models.job import Job
+from renku.ui.service.cache.models.job import USER_JOB_STATE_ENQUEUED, USER_JOB_STATE_IN_PROGRESS, Job
 from renku.ui.service.cache.models.project import Project
 from renku.ui.service.cache.serializers.job import JobSchema
 
@@ -49,17 +49,12 @@ class JobManagementCache(BaseCache):
     @staticmethod
     def get_job(user, job_id):
         """Get user job."""
-        try:
-            job_obj = Job.get((Job.job_id == job_id) & (Job.user_id == user.user_id))
-        except ValueError:
-            return
-
-        return job_obj
+        return Job.find(job_id, user_id=user.user_id)
 
     @staticmethod
     def get_jobs(user):
         """Get all user jobs."""
-        return Job.query(Job.user_id == user.user_id)
+        return Job.iterate(Job.user_id, user.user_id)
 
     @staticmethod
     def invalidate_job(user, job_id):
@@ -70,3 +65,8 @@ class JobManagementCache(BaseCache):
             job_obj.delete()
 
         return job_obj
+
+    @staticmethod
+    def get_active_jobs():
+        """Get all enqueued or running jobs of all users."""
+        return (job for job in Job.iterate() if job.state in [USER_JOB_STATE_ENQUEUED, USER_JOB_STATE_IN_PROGRESS])
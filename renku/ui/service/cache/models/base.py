@@ -0,0 +1,204 @@
+#
+# Copyright 2020 - Swiss Data Science Center (SDSC)
+# A partnership between École Polytechnique Fédérale de Lausanne (EPFL) and
+# Eidgenössische Technische Hochschule Zürich (ETHZ).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Renku service cache bulk model queries."""
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from walrus.models import _ContainerField
+from walrus.query import OP_EQ
+
+SCAN_BATCH_SIZE = 500
+
+
+class BulkQueryMixin:
+    """Bulk loading and cursor-based iteration of walrus models.
+
+    ``Model.query`` and ``Model.all`` load every record with two round trips each and ``query`` materializes
+    the whole index before returning. These helpers scan index sets with ``SSCAN`` and load records in
+    pipelined batches instead.
+
+    Models that set ``_age_field`` are also kept in a sorted set scored by the timestamp of that field, so that
+    cleanup only visits records older than a time to live and can evict records in least recently used order.
+    """
+
+    # NOTE: Provided by ``walrus.Model``
+    __database__: Any
+    _query: Any
+    _fields: Dict[str, Any]
+
+    _age_field: Optional[str] = None
+
+    @classmethod
+    def age_index_key(cls) -> str:
+        """Return the key of the sorted set of records by age."""
+        return cls._query.make_key("age")
+
+    def _age_score(self) -> float:
+        """Timestamp of a record's age field; records without one sort as the oldest."""
+        value = getattr(self, self._age_field) if self._age_field else None
+        # NOTE: Cache models store naive datetimes aligned to UTC.
+        return value.replace(tzinfo=timezone.utc).timestamp() if value else 0
+
+    def save(self, _is_create=False):
+        """Save the record and update its age."""
+        super().save(_is_create=_is_create)  # type: ignore
+        if self._age_field:
+            self.__database__.zadd(self.age_index_key(), {self.get_hash_id(): self._age_score()})  # type: ignore
+
+    def delete(self, for_update=False):
+        """Delete the record and its age."""
+        super().delete(for_update=for_update)  # type: ignore
+        if self._age_field and not for_update:
+            self.__database__.zrem(self.age_index_key(), self.get_hash_id())  # type: ignore
+
+    @classmethod
+    def rebuild_age_index(cls):
+        """Add records that are missing from the sorted set by age, e.g. ones stored by an older version.
+
+        This runs only once: A marker key is set afterwards since the sorted set already exists as soon as any
+        record is saved by this version, even if older records are still missing from it.
+        """
+        marker_key = cls._query.make_key("age", "indexed")
+        if not cls._age_field or cls.__database__.exists(marker_key):
+            return
+
+        with cls.__database__.pipeline(transaction=False) as pipeline:
+            for record in cls.iterate():
+                # NOTE: Keep the age of records that were saved in the meantime
+                pipeline.zadd(cls.age_index_key(), {record.get_hash_id(): record._age_score()}, nx=True)
+            pipeline.set(marker_key, 1)
+            pipeline.execute()
+
+    @classmethod
+    def iterate_by_age(cls, max_age: Optional[float] = None, batch_size: int = SCAN_BATCH_SIZE) -> Iterator[Any]:
+        """Iterate over records from the oldest to the newest.
+
+        Records may be deleted while iterating.
+
+        Args:
+            max_age(Optional[float]): Only return records older than this many seconds.
+            batch_size(int): Number of records loaded per round trip.
+
+        Returns:
+            Iterator over records.
+        """
+        key = cls.age_index_key()
+        max_score = "+inf" if max_age is None else datetime.now(timezone.utc).timestamp() - max_age
+
+        offset = 0
+        while True:
+            hash_ids = cls.__database__.zrangebyscore(key, "-inf", max_score, start=offset, num=batch_size)
+            if not hash_ids:
+                return
+
+            records = cls.load_many(hash_ids)
+            yield from records
+
+            # NOTE: Drop entries of records that no longer exist and skip past records that were kept
+            existing = {record.get_hash_id() for record in records}
+            missing = [hash_id for hash_id in hash_ids if hash_id.decode("utf-8") not in existing]
+            with cls.__database__.pipeline(transaction=False) as pipeline:
+                if missing:
+                    pipeline.zrem(key, *missing)
+                for hash_id in hash_ids:
+                    pipeline.zscore(key, hash_id)
+                scores = pipeline.execute()[1 if missing else 0 :]
+
+            offset += sum(score is not None for score in scores)
+
+    @classmethod
+    def find(cls, primary_key, **fields) -> Optional[Any]:
+        """Load a record by primary key if it exists and matches all ``fields``.
+
+        Args:
+            primary_key: Primary key of the record.
+            fields: Field values the record must have.
+
+        Returns:
+            The record or ``None``.
+        """
+        records = cls.load_many([cls._query.get_primary_hash_key(primary_key)])
+        if not records or any(getattr(records[0], name) != value for name, value in fields.items()):
+            return None
+
+        return records[0]
+
+    @classmethod
+    def load_many(cls, hash_ids: Iterable) -> List[Any]:
+        """Load records by their hash ids using a single pipelined round trip.
+
+        Args:
+            hash_ids: Hash ids (keys) of records.
+
+        Returns:
+            List of existing records in the order of ``hash_ids``.
+        """
+        with cls.__database__.pipeline(transaction=False) as pipeline:
+            for hash_id in hash_ids:
+                pipeline.hgetall(hash_id)
+            results = pipeline.execute()
+
+        records = []
+        for raw_data in results:
+            # NOTE: Records removed since their id was read from an index come back as empty hashes.
+            if not raw_data:
+                continue
+
+            raw_data = {key.decode("utf-8") if isinstance(key, bytes) else key: v for key, v in raw_data.items()}
+            data = {}
+            for name, field in cls._fields.items():
+                if isinstance(field, _ContainerField):
+                    continue
+                data[name] = field.python_value(raw_data[name]) if name in raw_data else None
+
+            records.append(cls(**data))
+
+        return records
+
+    @classmethod
+    def index_key(cls, field, value) -> str:
+        """Return the key of the equality index set of a field value."""
+        return field.get_index(OP_EQ).get_key(field.db_value(value)).key
+
+    @classmethod
+    def iterate(cls, field=None, value=None, batch_size: int = SCAN_BATCH_SIZE) -> Iterator[Any]:
+        """Iterate over records with a cursor, optionally only those where ``field`` equals ``value``.
+
+        Args:
+            field: Indexed field to filter by.
+            value: Value of ``field`` to filter by.
+            batch_size: Number of records loaded per round trip.
+
+        Returns:
+            Iterator over matching records.
+        """
+        key = cls._query.all_index().key if field is None else cls.index_key(field, value)
+
+        batch = []
+        seen = set()
+        for hash_id in cls.__database__.sscan_iter(key, count=batch_size):
+            # NOTE: SSCAN can return an element more than once if the set is resized while scanning.
+            if hash_id in seen:
+                continue
+            seen.add(hash_id)
+            batch.append(hash_id)
+            if len(batch) >= batch_size:
+                yield from cls.load_many(batch)
+                batch = []
+
+        if batch:
+            yield from cls.load_many(batch)
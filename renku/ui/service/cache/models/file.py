@@ -22,14 +22,16 @@ from datetime import datetime
 from walrus import BooleanField, DateTimeField, IntegerField, Model, TextField
 
 from renku.ui.service.cache.base import BaseCache
+from renku.ui.service.cache.models.base import BulkQueryMixin
 from renku.ui.service.config import CACHE_UPLOADS_PATH
 
 
-class File(Model):
+class File(BulkQueryMixin, Model):
     """User file object."""
 
     __database__ = BaseCache.model_db
     __namespace__ = BaseCache.namespace
+    _age_field = "created_at"
 
     created_at = DateTimeField()
 
@@ -51,6 +53,11 @@ class File(Model):
         """Full path of cached file."""
         return CACHE_UPLOADS_PATH / self.user_id / self.relative_path
 
+    @staticmethod
+    def default_ttl() -> int:
+        """Time to live of files in seconds."""
+        return int(os.getenv("RENKU_SVC_CLEANUP_TTL_FILES", 1800))
+
     @property
     def age(self):
         """Returns file's age in seconds."""
@@ -74,7 +81,7 @@ class File(Model):
             # we should mark it for deletion.
             return True
 
-        ttl = ttl or int(os.getenv("RENKU_SVC_CLEANUP_TTL_FILES", 1800))
+        ttl = ttl or self.default_ttl()
         return self.age >= ttl
 
     def purge(self):
@@ -92,11 +99,12 @@ class File(Model):
         return bool(next((job for job in jobs if self.file_id in job.locked), False))
 
 
-class FileChunk(Model):
+class FileChunk(BulkQueryMixin, Model):
     """User file chunk object."""
 
     __database__ = BaseCache.model_db
     __namespace__ = BaseCache.namespace
+    _age_field = "created_at"
 
     created_at = DateTimeField()
 
@@ -112,6 +120,11 @@ class FileChunk(Model):
         """Full path of cached file."""
         return CACHE_UPLOADS_PATH / self.user_id / self.chunked_id / self.relative_path
 
+    @staticmethod
+    def default_ttl() -> int:
+        """Time to live of files in seconds."""
+        return int(os.getenv("RENKU_SVC_CLEANUP_TTL_FILES", 1800))
+
     @property
     def age(self):
         """Returns file's age in seconds."""
@@ -134,7 +147,7 @@ class FileChunk(Model):
             # we should mark it for deletion.
             return True
 
-        ttl = ttl or int(os.getenv("RENKU_SVC_CLEANUP_TTL_FILES", 1800))
+        ttl = ttl or self.default_ttl()
         return self.age >= ttl
 
     def purge(self):
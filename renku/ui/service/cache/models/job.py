@@ -18,6 +18,7 @@
 from walrus import DateTimeField, JSONField, Model, SetField, TextField
 
 from renku.ui.service.cache.base import BaseCache
+from renku.ui.service.cache.models.base import BulkQueryMixin
 
 # User job states
 USER_JOB_STATE_ENQUEUED = "ENQUEUED"
@@ -26,7 +27,7 @@ USER_JOB_STATE_COMPLETED = "COMPLETED"
 USER_JOB_STATE_FAILED = "FAILED"
 
 
-class Job(Model):
+class Job(BulkQueryMixin, Model):
     """Job cache model."""
 
     __database__ = BaseCache.model_db
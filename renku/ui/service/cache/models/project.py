@@ -15,6 +15,8 @@
 # limitations under the License.
 """Renku service cache project related models."""
 
+import hashlib
+import json
 import os
 import shutil
 from datetime import datetime
@@ -25,6 +27,8 @@ import portalocker
 from walrus import BooleanField, DateTimeField, IntegerField, Model, TextField
 
 from renku.ui.service.cache.base import BaseCache
+from renku.ui.service.cache.models.base import BulkQueryMixin
+from renku.ui.service.cache.write_queue import ProjectWriteQueue
 from renku.ui.service.config import CACHE_PROJECTS_PATH
 from renku.ui.service.utils import normalize_git_url
 
@@ -33,11 +37,12 @@ LOCK_TIMEOUT = 15
 NO_BRANCH_FOLDER = "__default_branch__"
 
 
-class Project(Model):
+class Project(BulkQueryMixin, Model):
     """User project object."""
 
     __database__ = BaseCache.model_db
     __namespace__ = BaseCache.namespace
+    _age_field = "accessed_at"
 
     created_at = DateTimeField()
     accessed_at = DateTimeField(default=datetime.utcnow)
@@ -56,6 +61,67 @@ class Project(Model):
     owner = TextField()
     initialized = BooleanField()
 
+    @classmethod
+    def _lookup_key(cls) -> str:
+        """Key of the hash mapping a user, remote and branch to a project id."""
+        return cls._query.make_key("lookup")
+
+    @staticmethod
+    def _lookup_field(user_id: str, git_url: str, branch: Optional[str]) -> str:
+        """Field of a project in the lookup hash."""
+        return json.dumps([user_id, normalize_git_url(git_url), branch or ""])
+
+    @classmethod
+    def find_by_remote(cls, user_id: str, git_url: str, branch: Optional[str]) -> Optional["Project"]:
+        """Find the cached project of a user for a remote and branch.
+
+        Args:
+            user_id(str): Id of the user.
+            git_url(str): The remote's Git URL.
+            branch(Optional[str]): Branch of the project.
+
+        Returns:
+            Optional[Project]: The project if it is cached.
+        """
+        field = cls._lookup_field(user_id, git_url, branch)
+        project_id = cls.__database__.hget(cls._lookup_key(), field)
+        if project_id is not None:
+            return cls.find(project_id.decode("utf-8"), user_id=user_id)
+
+        # NOTE: Projects cached by an older version have no lookup entry; find them through the user's projects and
+        # add the entry, so that they aren't cloned again into the same directory.
+        git_url = normalize_git_url(git_url)
+        projects = [
+            project
+            for project in cls.iterate(cls.user_id, user_id)
+            if normalize_git_url(project.git_url) == git_url and (project.branch or "") == (branch or "")
+        ]
+        if not projects:
+            return None
+
+        project = max(projects, key=lambda p: p.accessed_at or datetime.min)
+        cls.__database__.hsetnx(cls._lookup_key(), field, project.project_id)
+
+        return project
+
+    def save(self, _is_create=False):
+        """Save the project and its lookup entry."""
+        super().save(_is_create=_is_create)
+        self.__database__.hset(
+            self._lookup_key(), self._lookup_field(self.user_id, self.git_url, self.branch), self.project_id
+        )
+
+    def delete(self, for_update=False):
+        """Delete the project and its lookup entry."""
+        super().delete(for_update=for_update)
+        if for_update:
+            return
+
+        # NOTE: Only remove the entry if it wasn't overwritten by a newer project in the meantime.
+        field = self._lookup_field(self.user_id, self.git_url, self.branch)
+        if self.__database__.hget(self._lookup_key(), field) == self.project_id.encode("utf-8"):
+            self.__database__.hdel(self._lookup_key(), field)
+
     @property
     def abs_path(self) -> Path:
         """Full path of cached project."""
@@ -75,6 +141,27 @@ class Project(Model):
         """Exclusive write lock on the project."""
         return portalocker.Lock(f"{self.abs_path}.lock", flags=portalocker.LOCK_EX, timeout=LOCK_TIMEOUT)
 
+    @classmethod
+    def get_write_queue(cls, user_id: str, git_url: str, branch: Optional[str]) -> ProjectWriteQueue:
+        """Queue of write operations on the project of a user for a remote and branch.
+
+        The queue doesn't depend on the project id, so operations can be queued before the project is cloned.
+
+        Args:
+            user_id(str): Id of the user.
+            git_url(str): The remote's Git URL.
+            branch(Optional[str]): Branch of the project.
+
+        Returns:
+            ProjectWriteQueue: The project's write queue.
+        """
+        name = hashlib.sha256(cls._lookup_field(user_id, git_url, branch).encode("utf-8")).hexdigest()
+        return ProjectWriteQueue(name)
+
+    def write_queue(self) -> ProjectWriteQueue:
+        """Queue of write operations on the project."""
+        return self.get_write_queue(self.user_id, self.git_url, self.branch)
+
     def concurrency_lock(self):
         """Lock to limit concurrent operations on a project.
 
@@ -114,6 +201,11 @@ class Project(Model):
         """Ensure a project exists on file system."""
         return self.abs_path.exists()
 
+    @staticmethod
+    def default_ttl() -> int:
+        """Time to live of projects since their last access in seconds."""
+        return int(os.getenv("RENKU_SVC_CLEANUP_TTL_PROJECTS", 1800))
+
     def ttl_expired(self, ttl=None):
         """Check if project time to live has expired."""
         if not self.time_since_access:
@@ -123,7 +215,7 @@ class Project(Model):
             return True
 
         # NOTE: time to live measured in seconds
-        ttl = ttl or int(os.getenv("RENKU_SVC_CLEANUP_TTL_PROJECTS", 1800))
+        ttl = ttl or self.default_ttl()
         return self.time_since_access >= ttl
 
     def purge(self):
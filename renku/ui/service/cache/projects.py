@@ -45,10 +45,9 @@ class ProjectManagementCache(BaseCache):
     @staticmethod
     def get_project(user, project_id):
         """Get user cached project."""
-        try:
-            record = Project.get((Project.project_id == project_id) & (Project.user_id == user.user_id))
-        except ValueError as e:
-            raise IntermittentProjectIdError(e)
+        record = Project.find(project_id, user_id=user.user_id)
+        if record is None:
+            raise IntermittentProjectIdError()
 
         if not record.abs_path.exists():
             record.delete()
@@ -59,7 +58,7 @@ class ProjectManagementCache(BaseCache):
     @staticmethod
     def get_projects(user):
         """Get all user cache projects."""
-        return Project.query(Project.user_id == user.user_id)
+        return Project.iterate(Project.user_id, user.user_id)
 
     @staticmethod
     def invalidate_project(user, project_id):
@@ -0,0 +1,90 @@
+#
+# Copyright 2020 - Swiss Data Science Center (SDSC)
+# A partnership between École Polytechnique Fédérale de Lausanne (EPFL) and
+# Eidgenössische Technische Hochschule Zürich (ETHZ).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Renku service response cache management."""
+import hashlib
+import json
+import os
+from typing import Any, Dict, Optional
+
+from redis import RedisError
+
+from renku.ui.service.cache.base import BaseCache
+from renku.ui.service.utils import normalize_git_url
+
+RESPONSE_CACHE_TTL = int(os.getenv("RENKU_SVC_RESPONSE_CACHE_TTL", 3600))
+
+
+class ResponseManagementCache(BaseCache):
+    """Cache of serialized responses of read-only endpoints."""
+
+    def _project_responses_key(self, git_url: str) -> str:
+        """Name of the set of all cached responses of a project."""
+        digest = hashlib.sha256(normalize_git_url(git_url).encode("utf-8")).hexdigest()
+        return f"{self.namespace}.responses.project.{digest}"
+
+    def get_response_key(self, endpoint: str, params: Dict[str, Any], commit_sha: str, version: str) -> str:
+        """Return the cache key of an endpoint's response for a project commit."""
+        data = json.dumps([endpoint, params, commit_sha, version], sort_keys=True, default=str)
+        return f"{self.namespace}.responses.{hashlib.sha256(data.encode('utf-8')).hexdigest()}"
+
+    def get_response(self, endpoint: str, key: str) -> Optional[bytes]:
+        """Return a cached response and record a hit or miss for the endpoint."""
+        try:
+            response = self.cache.get(key)
+            self.cache.hincrby(f"{self.namespace}.responses.metrics", f"{endpoint}.{'hits' if response else 'misses'}")
+        except RedisError:
+            return None
+
+        return response
+
+    def set_response(self, git_url: str, key: str, response: bytes, ttl: Optional[int] = None):
+        """Cache a response of a project."""
+        ttl = ttl or RESPONSE_CACHE_TTL
+        project_key = self._project_responses_key(git_url)
+
+        try:
+            with self.cache.pipeline() as pipeline:
+                pipeline.set(key, response, ex=ttl)
+                pipeline.sadd(project_key, key)
+                pipeline.expire(project_key, ttl)
+                pipeline.execute()
+        except RedisError:
+            pass
+
+    def invalidate_responses(self, git_url: str):
+        """Remove all cached responses of a project."""
+        project_key = self._project_responses_key(git_url)
+
+        try:
+            keys = self.cache.smembers(project_key)
+            self.cache.delete(project_key, *keys)
+        except RedisError:
+            pass
+
+    def get_response_metrics(self) -> Dict[str, Dict[str, float]]:
+        """Return number of hits and misses and the hit rate of the response cache per endpoint."""
+        metrics: Dict[str, Dict[str, float]] = {}
+
+        for field, value in self.hash_table(f"{self.namespace}.responses.metrics").items():
+            endpoint, _, name = field.decode("utf-8").rpartition(".")
+            metrics.setdefault(endpoint, {"hits": 0, "misses": 0})[name] = int(value)
+
+        for values in metrics.values():
+            total = values["hits"] + values["misses"]
+            values["hit_rate"] = values["hits"] / total if total else 0.0
+
+        return metrics
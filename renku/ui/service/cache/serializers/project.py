@@ -33,6 +33,7 @@ class ProjectSchema(CreationSchema, AccessSchema, MandatoryUserSchema):
 
     clone_depth = fields.Integer()
     git_url = fields.String()
+    branch = fields.String(load_default=None)
 
     name = fields.String(required=True)
     slug = fields.String(required=True)
@@ -0,0 +1,168 @@
+# Copyright Swiss Data Science Center (SDSC). A partnership between
+# École Polytechnique Fédérale de Lausanne (EPFL) and
+# Eidgenössische Technische Hochschule Zürich (ETHZ).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Renku service queue of write operations on a project."""
+import threading
+import time
+import uuid
+from typing import Optional
+
+from redis import RedisError
+
+from renku.ui.service.cache.base import BaseCache
+from renku.ui.service.config import WRITE_QUEUE_MAX_LENGTH, WRITE_QUEUE_TIMEOUT
+from renku.ui.service.errors import IntermittentLockError, IntermittentProjectBusyError
+from renku.ui.service.logger import service_log
+
+HEARTBEAT_INTERVAL = 2
+HEARTBEAT_TTL = 5 * HEARTBEAT_INTERVAL
+POLL_INTERVAL = 0.1
+MAX_POLL_INTERVAL = 1
+
+
+class ProjectWriteQueue(BaseCache):
+    """First-in, first-out queue of write operations on a project.
+
+    Operations take a ticket when they are enqueued and only run once their ticket is at the head of the queue, so
+    writes run one at a time and in the order they arrived instead of racing for the project's lock. The queue is
+    stored in Redis and shared by the service and its workers. Waiting and running operations keep a heartbeat key
+    alive and tickets whose heartbeat expired, e.g. because their process died, are dropped.
+
+    Waiting operations block the thread that runs them and poll the queue with an increasing interval of up to
+    ``MAX_POLL_INTERVAL`` seconds. They give up after ``timeout`` seconds, so at most ``max_length`` threads per project
+    are tied up for that long; operations beyond that are rejected right away.
+    """
+
+    def __init__(self, name: str, max_length: Optional[int] = None, timeout: Optional[float] = None):
+        """Create a queue.
+
+        Args:
+            name(str): Unique name of the queue.
+            max_length(Optional[int]): Number of queued operations after which further ones are rejected.
+            timeout(Optional[float]): Seconds to wait for an operation's turn.
+        """
+        self.key = f"{self.namespace}.write_queue.{name}"
+        self.max_length = max_length or WRITE_QUEUE_MAX_LENGTH
+        self.timeout = timeout if timeout is not None else WRITE_QUEUE_TIMEOUT
+
+        self.ticket: Optional[str] = None
+        self._stop_heartbeat = threading.Event()
+        self._heartbeat: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        """Number of waiting and running operations."""
+        self._remove_stale()
+        return self.cache.zcard(self.key)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+    def _heartbeat_key(self, ticket: str) -> str:
+        """Key that exists while the operation holding a ticket is alive."""
+        return f"{self.key}.{ticket}"
+
+    def _touch(self, ticket: str):
+        """Renew the heartbeat of a ticket."""
+        with self.cache.pipeline() as pipeline:
+            pipeline.set(self._heartbeat_key(ticket), 1, ex=HEARTBEAT_TTL)
+            # NOTE: The queue is removed once no operation renews it anymore
+            pipeline.expire(self.key, HEARTBEAT_TTL)
+            pipeline.expire(f"{self.key}.sequence", HEARTBEAT_TTL)
+            pipeline.execute()
+
+    def _keep_alive(self, ticket: str):
+        """Renew the heartbeat of a ticket until it's released."""
+        while not self._stop_heartbeat.wait(HEARTBEAT_INTERVAL):
+            try:
+                self._touch(ticket)
+            except RedisError as e:
+                service_log.warning(f"cannot renew heartbeat of {self.key}", exc_info=e)
+
+    def _remove_stale(self):
+        """Drop tickets of operations that are no longer alive."""
+        tickets = [ticket.decode("utf-8") for ticket in self.cache.zrange(self.key, 0, -1)]
+        if not tickets:
+            return
+
+        with self.cache.pipeline(transaction=False) as pipeline:
+            for ticket in tickets:
+                pipeline.exists(self._heartbeat_key(ticket))
+            alive = pipeline.execute()
+
+        stale = [ticket for ticket, exists in zip(tickets, alive) if not exists]
+        if stale:
+            service_log.warning(f"dropping stale operations {stale} from {self.key}")
+            self.cache.zrem(self.key, *stale)
+
+    def _enqueue(self, pipeline):
+        """Add the ticket to the queue with the next number of the sequence."""
+        sequence = int(pipeline.get(f"{self.key}.sequence") or 0) + 1
+        pipeline.multi()
+        pipeline.set(f"{self.key}.sequence", sequence, ex=HEARTBEAT_TTL)
+        pipeline.zadd(self.key, {self.ticket: sequence})
+
+    def acquire(self):
+        """Enqueue an operation and wait until it's its turn."""
+        self.ticket = ticket = uuid.uuid4().hex
+
+        self._touch(ticket)
+        self._stop_heartbeat.clear()
+        self._heartbeat = threading.Thread(target=self._keep_alive, args=(ticket,), daemon=True)
+        self._heartbeat.start()
+
+        try:
+            self._remove_stale()
+
+            # NOTE: Take a number and enqueue with it atomically, otherwise a later ticket could briefly be at the head
+            self.cache.transaction(self._enqueue, f"{self.key}.sequence")
+
+            position = self.cache.zrank(self.key, ticket)
+            if position is not None and position >= self.max_length:
+                raise IntermittentProjectBusyError()
+
+            deadline = time.monotonic() + self.timeout
+            interval = POLL_INTERVAL
+            while position != 0:
+                if position is None or time.monotonic() > deadline:
+                    raise IntermittentLockError()
+
+                time.sleep(interval)
+                interval = min(2 * interval, MAX_POLL_INTERVAL)
+                self._remove_stale()
+                position = self.cache.zrank(self.key, ticket)
+        except BaseException:
+            self.release()
+            raise
+
+    def release(self):
+        """Remove the operation from the queue."""
+        if self.ticket is None:
+            return
+
+        self._stop_heartbeat.set()
+        if self._heartbeat is not None:
+            self._heartbeat.join()
+            self._heartbeat = None
+
+        with self.cache.pipeline() as pipeline:
+            pipeline.zrem(self.key, self.ticket)
+            pipeline.delete(self._heartbeat_key(self.ticket))
+            pipeline.execute()
+
+        self.ticket = None
@@ -37,6 +37,12 @@ SERVICE_NAME = "Renku Service"
 OPENAPI_VERSION = "3.0.3"
 API_VERSION = "v1"
 
+# NOTE: Read-only requests use cached projects that are at most this old (in seconds) and refresh them in the background
+PROJECT_MAX_STALENESS = int(os.getenv("PROJECT_MAX_STALENESS", 300))
+
+# NOTE: Secret token that push webhooks must send to refresh cached projects
+WEBHOOK_SECRET = os.getenv("RENKU_SVC_WEBHOOK_SECRET")
+
 PROJECT_CLONE_NO_DEPTH = -1
 PROJECT_CLONE_DEPTH_DEFAULT = int(os.getenv("PROJECT_CLONE_DEPTH_DEFAULT", 1))
 TEMPLATE_CLONE_DEPTH_DEFAULT = int(os.getenv("TEMPLATE_CLONE_DEPTH_DEFAULT", 0))
@@ -51,6 +57,25 @@ CACHE_UPLOADS_PATH.mkdir(parents=True, exist_ok=True)
 CACHE_PROJECTS_PATH = Path(CACHE_DIR) / Path("projects")
 CACHE_PROJECTS_PATH.mkdir(parents=True, exist_ok=True)
 
+CACHE_MIRRORS_PATH = Path(CACHE_DIR) / Path("mirrors")
+CACHE_MIRRORS_PATH.mkdir(parents=True, exist_ok=True)
+
+CACHE_METADATA_PATH = Path(CACHE_DIR) / Path("metadata")
+CACHE_METADATA_PATH.mkdir(parents=True, exist_ok=True)
+
+CACHE_GRAPHS_PATH = Path(CACHE_DIR) / Path("graphs")
+CACHE_GRAPHS_PATH.mkdir(parents=True, exist_ok=True)
+
+# NOTE: Least recently used projects are evicted while the cache volume uses more bytes than this, 0 disables it. The
+# usage of the whole filesystem that contains ``CACHE_DIR`` is measured, so the cache should be on a dedicated volume.
+CACHE_QUOTA = int(os.getenv("RENKU_SVC_CACHE_QUOTA", 0))
+
+# NOTE: Write operations on a project run one at a time in the order they arrived; further operations are rejected
+# while this many are queued and queued operations give up after waiting for this many seconds. Queued operations keep
+# their request thread busy while they wait, so the timeout bounds how long a project's writes can tie up threads.
+WRITE_QUEUE_MAX_LENGTH = int(os.getenv("RENKU_SVC_WRITE_QUEUE_MAX_LENGTH", 10))
+WRITE_QUEUE_TIMEOUT = int(os.getenv("RENKU_SVC_WRITE_QUEUE_TIMEOUT", 120))
+
 TAR_ARCHIVE_CONTENT_TYPE = "application/x-tar"
 ZIP_ARCHIVE_CONTENT_TYPE = "application/zip"
 GZ_ARCHIVE_CONTENT_TYPE = "application/x-gzip"
@@ -81,3 +106,6 @@ SENTRY_SAMPLERATE = float(os.getenv("SENTRY_SAMPLE_RATE", 0.2))
 
 # List of all available metadata versions
 METADATA_VERSIONS_LIST = os.getenv("METADATA_VERSIONS_LIST", "/svc/config/metadata-versions/metadata-versions.json")
+
+# NOTE: Import renku modules once in the worker process so that forked work horses don't import them for every job
+WORKER_PRELOAD = os.getenv("RENKU_SVC_WORKER_PRELOAD", "false").lower() == "true"
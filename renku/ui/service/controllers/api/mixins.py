@@ -18,18 +18,20 @@ import contextlib
 from abc import ABCMeta, abstractmethod
 from functools import wraps
 from pathlib import Path
-from typing import Optional, Union
+from typing import ContextManager, Optional, Union
 
 import portalocker
+from flask import current_app
 
 from renku.core.constant import RENKU_HOME
-from renku.core.errors import LockError, RenkuException, UninitializedProject
+from renku.core.errors import GitError, LockError, RenkuException, UninitializedProject
 from renku.core.util.contexts import renku_project_context
 from renku.infrastructure.repository import Repository
 from renku.ui.service.cache.config import REDIS_NAMESPACE
 from renku.ui.service.cache.models.job import Job
 from renku.ui.service.cache.models.project import Project
 from renku.ui.service.cache.models.user import User
+from renku.ui.service.cache.write_queue import ProjectWriteQueue
 from renku.ui.service.config import PROJECT_CLONE_DEPTH_DEFAULT
 from renku.ui.service.controllers.utils.remote_project import RemoteProject
 from renku.ui.service.errors import (
@@ -41,6 +43,7 @@ from renku.ui.service.errors import (
 from renku.ui.service.gateways.repository_cache import LocalRepositoryCache
 from renku.ui.service.jobs.contexts import enqueue_retry
 from renku.ui.service.jobs.delayed_ctrl import delayed_ctrl_job
+from renku.ui.service.logger import service_log
 from renku.ui.service.serializers.common import DelayedResponseRPC
 from renku.ui.service.utils import normalize_git_url
 
@@ -61,6 +64,38 @@ def local_identity(method):
     return _impl
 
 
+def cached_response(method):
+    """Serve responses of read-only operations from cache while the project's commit doesn't change."""
+
+    @wraps(method)
+    def _impl(self, *method_args, **method_kwargs):
+        """Implementation of method wrapper."""
+        key = self.get_response_cache_key()
+        if key is None:
+            return method(self, *method_args, **method_kwargs)
+
+        cached = self.cache.get_response(self.__class__.__name__, key)
+        if cached:
+            return current_app.response_class(cached, mimetype="application/json")
+
+        response = method(self, *method_args, **method_kwargs)
+
+        # NOTE: Only cache responses computed at the commit used in the key, a cached clone might be older
+        if response.status_code == 200 and self.project_path is not None:
+            try:
+                with Repository(self.project_path) as repository:
+                    is_same_commit = repository.head.commit.hexsha == self.commit_sha
+            except (GitError, ValueError):
+                is_same_commit = False
+
+            if is_same_commit:
+                self.cache.set_response(self.context["git_url"], key, response.get_data())
+
+        return response
+
+    return _impl
+
+
 class RenkuOperationMixin(metaclass=ABCMeta):
     """Renku operation execution mixin.
 
@@ -70,6 +105,9 @@ class RenkuOperationMixin(metaclass=ABCMeta):
 
     JOB_RESPONSE_SERIALIZER = DelayedResponseRPC()
 
+    # NOTE: Read-only operations that only need a project's metadata can run against a metadata view instead of a clone
+    METADATA_ONLY = False
+
     def __init__(
         self,
         cache,
@@ -101,6 +139,12 @@ class RenkuOperationMixin(metaclass=ABCMeta):
         # so it's safe to use it in controller operations. Its type will always be `pathlib.Path`.
         self._project_path = None
 
+        # NOTE: Latest commit of the remote project; it's only resolved for cached responses
+        self.commit_sha: Optional[str] = None
+
+        # NOTE: Write queue of the project that is held by the caller, e.g. while an operation is executed and synced
+        self._write_queue: Optional[ProjectWriteQueue] = None
+
     @property
     @abstractmethod
     def context(self):
@@ -138,7 +182,7 @@ class RenkuOperationMixin(metaclass=ABCMeta):
             "git_url": project.git_url,
             "skip_docker_update": True,
             "skip_template_update": True,
-            "branch": project.branch,
+            "branch": project.branch or None,
         }
         migration_response = MigrateProjectCtrl(
             self.cache, self.user_data, migrate_context, skip_lock=True
@@ -146,6 +190,34 @@ class RenkuOperationMixin(metaclass=ABCMeta):
 
         return migration_response
 
+    def use_metadata_view(self) -> bool:
+        """Whether the operation can run against a read-only metadata view of the project."""
+        return self.METADATA_ONLY and not self.is_write and not self.migrate_project
+
+    def get_response_cache_key(self) -> Optional[str]:
+        """Key of the operation's response in the response cache or None if it shouldn't be cached."""
+        from renku.version import __version__
+
+        if self.cache is None or getattr(self, "user", None) is None or self.is_write or self.migrate_project:
+            return None
+        if "git_url" not in self.context or self.context.get("is_delayed") or self.context.get("callback_url"):
+            return None
+
+        try:
+            self.commit_sha = LocalRepositoryCache().get_commit_sha(
+                self.context["git_url"], self.context.get("branch"), self.user
+            )
+        except GitError as e:
+            service_log.info(f"cannot resolve project's commit, response won't be cached: {e}", exc_info=e)
+            return None
+
+        return self.cache.get_response_key(
+            endpoint=self.__class__.__name__,
+            params=dict(self.context),
+            commit_sha=self.commit_sha,
+            version=__version__,
+        )
+
     def execute_op(self):
         """Execute renku operation which controller implements."""
         ctrl_cls = {
@@ -182,36 +254,67 @@ class RenkuOperationMixin(metaclass=ABCMeta):
             error = Exception("local execution is disabled")
             raise ProgramRenkuError(error)
 
-        project = LocalRepositoryCache().get(
-            self.cache,
-            self.request_data["git_url"],
-            self.request_data.get("branch"),
-            self.user,
-            self.clone_depth is not None,
-        )
-
-        self.context["project_id"] = project.project_id
-
-        if self.skip_lock:
-            lock = contextlib.suppress()
-        elif self.is_write or self.migrate_project:
-            lock = project.write_lock()
-        else:
-            lock = project.read_lock()
-        try:
-            with project.concurrency_lock():
-                with lock:
-                    # NOTE: Get up-to-date version of object
-                    current_project = Project.load(project.project_id)
-                    if self.migrate_project:
-                        self.ensure_migrated(current_project)
-
-                    self.project_path = current_project.abs_path
+        if self.use_metadata_view():
+            with contextlib.ExitStack() as stack:
+                try:
+                    path = stack.enter_context(
+                        LocalRepositoryCache().get_metadata(
+                            self.request_data["git_url"], self.request_data.get("branch"), self.user, self.commit_sha
+                        )
+                    )
+                except (GitError, OSError, portalocker.LockException, portalocker.AlreadyLocked) as e:
+                    service_log.info(f"metadata view isn't available, using a clone: {e}", exc_info=e)
+                else:
+                    self.project_path = path
 
                     with renku_project_context(self.project_path):
                         return self.renku_op()
-        except (portalocker.LockException, portalocker.AlreadyLocked, LockError) as e:
-            raise IntermittentLockError() from e
+
+        is_write = self.is_write or self.migrate_project
+
+        # NOTE: Writes wait for their turn before the cached project is updated, so that they run one at a time in the
+        # order they arrived instead of failing when the project's lock is contended. Reads don't wait for the queue and
+        # operations whose caller already holds the queue don't enqueue again.
+        queue: ContextManager
+        if is_write and not self.skip_lock and self._write_queue is None:
+            queue = Project.get_write_queue(
+                self.user.user_id, self.request_data["git_url"], self.request_data.get("branch")
+            )
+        else:
+            queue = contextlib.nullcontext()
+
+        with queue:
+            project = LocalRepositoryCache().get(
+                self.cache,
+                self.request_data["git_url"],
+                self.request_data.get("branch"),
+                self.user,
+                self.clone_depth is not None,
+                stale_ok=not is_write,
+            )
+
+            self.context["project_id"] = project.project_id
+
+            if self.skip_lock:
+                lock = contextlib.suppress()
+            elif is_write:
+                lock = project.write_lock()
+            else:
+                lock = project.read_lock()
+            try:
+                with project.concurrency_lock():
+                    with lock:
+                        # NOTE: Get up-to-date version of object
+                        current_project = Project.load(project.project_id)
+                        if self.migrate_project:
+                            self.ensure_migrated(current_project)
+
+                        self.project_path = current_project.abs_path
+
+                        with renku_project_context(self.project_path):
+                            return self.renku_op()
+            except (portalocker.LockException, portalocker.AlreadyLocked, LockError) as e:
+                raise IntermittentLockError() from e
 
     def remote(self):
         """Execute renku operation against remote project."""
@@ -244,19 +347,45 @@ class RenkuOpSyncMixin(RenkuOperationMixin, metaclass=ABCMeta):
             raise RenkuException("unable to sync with remote since no operation has been executed")
 
         with Repository(self.project_path) as repository:
-            return push_changes(repository, remote=remote)
+            branch = push_changes(repository, remote=remote)
+
+        if self.cache is not None and "git_url" in self.context:
+            self.cache.invalidate_responses(self.context["git_url"])
+
+        return branch
 
     def execute_and_sync(self, remote="origin"):
         """Execute operation which controller implements and sync with the remote."""
         # NOTE: This will return the operation result as well as name of the branch to which it has been pushed.
         self.is_write = True
 
-        result = self.execute_op()
+        # NOTE: Hold the project's write queue until the changes are pushed, otherwise the next write could change the
+        # cached project before it's synced and the push would include its changes or fail.
+        is_local = (
+            "git_url" in self.context
+            and not self.context.get("is_delayed", False)
+            and "user_id" in (self.user_data or {})
+            and getattr(self, "user", None) is not None
+            and self.cache is not None
+        )
+        queue: ContextManager
+        if is_local and not self.skip_lock:
+            queue = self._write_queue = Project.get_write_queue(
+                self.user.user_id, self.request_data["git_url"], self.request_data.get("branch")
+            )
+        else:
+            queue = contextlib.nullcontext()
+
+        try:
+            with queue:
+                result = self.execute_op()
 
-        if isinstance(result, Job):
-            return result, None
+                if isinstance(result, Job):
+                    return result, None
 
-        if hasattr(result, "output"):
-            result = result.output
+                if hasattr(result, "output"):
+                    result = result.output
 
-        return result, self.sync(remote=remote)
+                return result, self.sync(remote=remote)
+        finally:
+            self._write_queue = None
@@ -15,6 +15,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Renku service cache upload files controller."""
+import hashlib
 import os
 import shutil
 from pathlib import Path
@@ -27,10 +28,18 @@ from renku.core.util.os import bytes_to_unit
 from renku.ui.service.config import CACHE_UPLOADS_PATH, MAX_CONTENT_LENGTH, SUPPORTED_ARCHIVES
 from renku.ui.service.controllers.api.abstract import ServiceCtrl
 from renku.ui.service.controllers.api.mixins import RenkuOperationMixin
-from renku.ui.service.errors import IntermittentFileExistsError, UserUploadTooLargeError
+from renku.ui.service.errors import (
+    IntermittentFileExistsError,
+    UserUploadChecksumError,
+    UserUploadInvalidChunkError,
+    UserUploadTooLargeError,
+)
 from renku.ui.service.serializers.cache import FileUploadRequest, FileUploadResponseRPC, extract_file
 from renku.ui.service.views import result_response
 
+PARTIAL_UPLOAD_NAME = "upload.partial"
+UPLOAD_BUFFER_SIZE = 1024 * 1024
+
 
 class UploadFilesCtrl(ServiceCtrl, RenkuOperationMixin):
     """Controller for upload files endpoint."""
@@ -74,6 +83,9 @@ class UploadFilesCtrl(ServiceCtrl, RenkuOperationMixin):
 
     def process_chunked_upload(self):
         """Process upload done in chunks."""
+        if self.response_builder.get("total_size") is None:
+            raise UserUploadInvalidChunkError(file_name=self.file.filename, reason="total file size is missing")
+
         if self.response_builder["total_size"] > MAX_CONTENT_LENGTH:
             if MAX_CONTENT_LENGTH > 524288000:
                 max_size = bytes_to_unit(MAX_CONTENT_LENGTH, "gb")
@@ -83,6 +95,9 @@ class UploadFilesCtrl(ServiceCtrl, RenkuOperationMixin):
                 max_size_str = f"{max_size} mb"
             raise UserUploadTooLargeError(maximum_size=max_size_str, exception=None)
 
+        offset = self._chunk_offset()
+        self._validate_chunk(offset)
+
         chunked_id = self.response_builder["chunked_id"]
 
         chunks_dir: Path = self.user_cache_dir / chunked_id
@@ -91,23 +106,22 @@ class UploadFilesCtrl(ServiceCtrl, RenkuOperationMixin):
         current_chunk = self.response_builder["chunk_index"]
         total_chunks = self.response_builder["chunk_count"]
 
-        file_path = chunks_dir / str(current_chunk)
-        relative_path = file_path.relative_to(chunks_dir)
-
-        self.file.save(str(file_path))
+        # NOTE: Chunks are written at their offset into a single file, so the upload doesn't need to be reassembled
+        partial_file_path = chunks_dir / PARTIAL_UPLOAD_NAME
+        self._write_chunk(partial_file_path, offset)
 
-        with self.cache.model_db.lock(f"chunked_upload_{self.user.user_id}_{chunked_id}"):
+        received_chunks = self.cache.add_received_chunk(self.user, chunked_id, current_chunk)
+        if received_chunks == 1:
             self.cache.set_file_chunk(
                 self.user,
                 {
                     "chunked_id": chunked_id,
-                    "file_name": str(current_chunk),
-                    "relative_path": str(relative_path),
+                    "file_name": self.file.filename,
+                    "relative_path": PARTIAL_UPLOAD_NAME,
                 },
             )
-            completed = len(list(self.cache.get_chunks(self.user, chunked_id))) == total_chunks
 
-        if not completed:
+        if received_chunks != total_chunks:
             return {}
 
         target_file_path = self.user_cache_dir / self.file.filename
@@ -118,11 +132,13 @@ class UploadFilesCtrl(ServiceCtrl, RenkuOperationMixin):
             else:
                 raise IntermittentFileExistsError(file_name=self.file.filename)
 
-        with open(target_file_path, "wb") as target_file:
-            for file_number in range(total_chunks):
-                with (chunks_dir / str(file_number)).open("rb") as chunk:
-                    shutil.copyfileobj(chunk, target_file)
+        checksum = self.response_builder.get("chunked_checksum")
+        try:
+            if checksum:
+                self._verify_checksum(partial_file_path, checksum)
 
+            partial_file_path.rename(target_file_path)
+        finally:
             shutil.rmtree(chunks_dir)
             self.cache.invalidate_chunks(self.user, chunked_id)
 
@@ -130,6 +146,87 @@ class UploadFilesCtrl(ServiceCtrl, RenkuOperationMixin):
 
         return self.postprocess_file(target_file_path)
 
+    def _chunk_offset(self) -> int:
+        """Byte offset of the current chunk in the uploaded file."""
+        if self.response_builder.get("chunk_byte_offset") is not None:
+            return self.response_builder["chunk_byte_offset"]
+
+        chunk_index = self.response_builder["chunk_index"]
+        if self.response_builder.get("chunk_size"):
+            return chunk_index * self.response_builder["chunk_size"]
+
+        # NOTE: Without offsets, all chunks except for the last one are expected to have the same size
+        chunk_size = self._chunk_length()
+
+        if chunk_index == self.response_builder["chunk_count"] - 1 and self.response_builder.get("total_size"):
+            return self.response_builder["total_size"] - chunk_size
+
+        return chunk_index * chunk_size
+
+    def _chunk_length(self) -> int:
+        """Size of the current chunk in bytes."""
+        stream = self.file.stream
+        length = stream.seek(0, os.SEEK_END)
+        stream.seek(0)
+
+        return length
+
+    def _validate_chunk(self, offset: int):
+        """Check that the current chunk is part of the upload and fits into the uploaded file."""
+        chunk_index = self.response_builder["chunk_index"]
+        chunk_count = self.response_builder["chunk_count"]
+        total_size = self.response_builder["total_size"]
+        end = offset + self._chunk_length()
+
+        if not 0 <= chunk_index < chunk_count:
+            reason = f"chunk index {chunk_index} is outside of the {chunk_count} chunks of the file"
+        elif offset < 0:
+            reason = f"chunk offset {offset} is negative"
+        elif end > total_size:
+            reason = f"chunk ends at {end} after the end of the file at {total_size}"
+        else:
+            return
+
+        raise UserUploadInvalidChunkError(file_name=self.file.filename, reason=reason)
+
+    def _write_chunk(self, file_path: Path, offset: int):
+        """Write the current chunk at an offset into a file."""
+        total_size = self.response_builder.get("total_size")
+
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT, 0o644)
+        try:
+            # NOTE: Allocate the whole file up front; ranges of chunks that weren't received yet stay sparse
+            if total_size and os.fstat(fd).st_size < total_size:
+                os.ftruncate(fd, total_size)
+
+            while True:
+                data = self.file.stream.read(UPLOAD_BUFFER_SIZE)
+                if not data:
+                    break
+
+                view = memoryview(data)
+                while view:
+                    written = os.pwrite(fd, view, offset)
+                    offset += written
+                    view = view[written:]
+        finally:
+            os.close(fd)
+
+    def _verify_checksum(self, file_path: Path, checksum: str):
+        """Check that an uploaded file has the checksum sent by the client."""
+        algorithm, _, expected = checksum.partition(":")
+
+        digest = hashlib.new(algorithm)
+        with file_path.open("rb") as file:
+            for data in iter(lambda: file.read(UPLOAD_BUFFER_SIZE), b""):
+                digest.update(data)
+
+        actual = digest.hexdigest()
+        if actual != expected.lower():
+            raise UserUploadChecksumError(
+                file_name=self.file.filename, expected=f"{algorithm}:{expected}", actual=f"{algorithm}:{actual}"
+            )
+
     def process_file(self):
         """Process uploaded file."""
 
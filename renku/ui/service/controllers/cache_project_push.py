@@ -0,0 +1,57 @@
+#
+# Copyright 2020 - Swiss Data Science Center (SDSC)
+# A partnership between École Polytechnique Fédérale de Lausanne (EPFL) and
+# Eidgenössische Technische Hochschule Zürich (ETHZ).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Renku service cache project push controller."""
+import hmac
+from typing import Optional
+
+from renku.ui.service.config import WEBHOOK_SECRET
+from renku.ui.service.controllers.api.abstract import ServiceCtrl
+from renku.ui.service.errors import UserAnonymousError
+from renku.ui.service.gateways.repository_cache import LocalRepositoryCache
+from renku.ui.service.serializers.cache import ProjectPushEventRequest, ProjectPushEventResponseRPC
+from renku.ui.service.views import result_response
+
+BRANCH_REFERENCE_PREFIX = "refs/heads/"
+
+
+class ProjectPushCtrl(ServiceCtrl):
+    """Controller for refreshing cached projects when changes are pushed to them."""
+
+    REQUEST_SERIALIZER = ProjectPushEventRequest()
+    RESPONSE_SERIALIZER = ProjectPushEventResponseRPC()
+
+    def __init__(self, request_data, secret: Optional[str]):
+        """Construct a project push controller."""
+        self.ctx = ProjectPushCtrl.REQUEST_SERIALIZER.load(request_data)
+        self.secret = secret
+
+    def renku_op(self):
+        """Renku operation for the controller."""
+        reference = self.ctx["ref"]
+        if not reference.startswith(BRANCH_REFERENCE_PREFIX):
+            # NOTE: Cached projects are only checked out on branches
+            return {"refreshed": 0}
+
+        branch = reference[len(BRANCH_REFERENCE_PREFIX) :]
+        return {"refreshed": LocalRepositoryCache().refresh_remote(self.ctx["project"]["git_http_url"], branch)}
+
+    def to_response(self):
+        """Execute controller flow and serialize to service response."""
+        if not WEBHOOK_SECRET or not hmac.compare_digest(self.secret or "", WEBHOOK_SECRET):
+            raise UserAnonymousError()
+
+        return result_response(ProjectPushCtrl.RESPONSE_SERIALIZER, self.renku_op())
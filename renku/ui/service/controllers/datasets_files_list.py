@@ -17,6 +17,7 @@
 """Renku service datasets files controller."""
 
 from renku.command.dataset import list_files_command
+from renku.core.dataset.dataset import get_dataset_file_cursor
 from renku.ui.service.controllers.api.abstract import ServiceCtrl
 from renku.ui.service.controllers.api.mixins import RenkuOperationMixin
 from renku.ui.service.serializers.datasets import DatasetFilesListRequest, DatasetFilesListResponseRPC
@@ -42,10 +43,31 @@ class DatasetsFilesListCtrl(ServiceCtrl, RenkuOperationMixin):
 
     def renku_op(self):
         """Renku operation for the controller."""
-        result = list_files_command().build().execute(datasets=[self.ctx["name"]])
+
+        def split_patterns(patterns):
+            return [p.strip() for p in patterns.split(",") if p.strip()] if patterns else None
+
+        result = (
+            list_files_command()
+            .build()
+            .execute(
+                datasets=[self.ctx["name"]],
+                include=split_patterns(self.ctx.get("include")),
+                exclude=split_patterns(self.ctx.get("exclude")),
+                limit=self.ctx.get("limit"),
+                offset=self.ctx.get("offset", 0),
+                cursor=self.ctx.get("cursor"),
+            )
+        )
         return result.output
 
     def to_response(self):
         """Execute controller flow and serialize to service response."""
-        self.ctx["files"] = self.execute_op()
+        files = self.execute_op()
+        self.ctx["files"] = files
+
+        limit = self.ctx.get("limit")
+        if limit and files and len(files) == limit:
+            self.ctx["next_cursor"] = get_dataset_file_cursor(files[-1])
+
         return result_response(DatasetsFilesListCtrl.RESPONSE_SERIALIZER, self.ctx)
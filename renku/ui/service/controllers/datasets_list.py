@@ -18,7 +18,7 @@
 
 from renku.command.dataset import list_datasets_command
 from renku.ui.service.controllers.api.abstract import ServiceCtrl
-from renku.ui.service.controllers.api.mixins import RenkuOperationMixin
+from renku.ui.service.controllers.api.mixins import RenkuOperationMixin, cached_response
 from renku.ui.service.serializers.datasets import DatasetListRequest, DatasetListResponseRPC
 from renku.ui.service.views import result_response
 
@@ -28,6 +28,7 @@ class DatasetsListCtrl(ServiceCtrl, RenkuOperationMixin):
 
     REQUEST_SERIALIZER = DatasetListRequest()
     RESPONSE_SERIALIZER = DatasetListResponseRPC()
+    METADATA_ONLY = True
 
     def __init__(self, cache, user_data, request_data):
         """Construct a datasets list controller."""
@@ -44,6 +45,7 @@ class DatasetsListCtrl(ServiceCtrl, RenkuOperationMixin):
         result = list_datasets_command().build().execute()
         return result.output
 
+    @cached_response
     def to_response(self):
         """Execute controller flow and serialize to service response."""
         self.ctx["datasets"] = self.execute_op()
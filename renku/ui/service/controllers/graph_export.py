@@ -15,6 +15,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Renku graph export controller."""
+import tempfile
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, Optional
+from urllib.parse import quote_plus, urlencode
 
 from requests import RequestException
 from sentry_sdk import capture_exception
@@ -23,9 +27,12 @@ from renku.command.graph import export_graph_command
 from renku.command.migrate import migrations_check
 from renku.command.view_model.graph import DotFormat
 from renku.core.errors import RenkuException
-from renku.ui.service.config import PROJECT_CLONE_NO_DEPTH
+from renku.ui.service.config import CACHE_GRAPHS_PATH, PROJECT_CLONE_NO_DEPTH
 from renku.ui.service.controllers.api.abstract import ServiceCtrl
-from renku.ui.service.controllers.api.mixins import RenkuOperationMixin
+from renku.ui.service.controllers.api.mixins import RenkuOperationMixin, cached_response
+from renku.ui.service.jobs.contexts import enqueue_retry
+from renku.ui.service.jobs.graph import graph_export_job
+from renku.ui.service.jobs.queues import GRAPH_JOB_QUEUE
 from renku.ui.service.serializers.graph import (
     GraphExportCallbackError,
     GraphExportCallbackSuccess,
@@ -34,16 +41,49 @@ from renku.ui.service.serializers.graph import (
 )
 from renku.ui.service.views import result_response
 
+# NOTE: Media type and file extension of exported graphs per format
+GRAPH_FORMATS = {
+    "json-ld": ("application/ld+json", "jsonld"),
+    "rdf": ("application/rdf+xml", "rdf"),
+    "nt": ("application/n-triples", "nt"),
+    "dot": ("text/vnd.graphviz", "dot"),
+    "dot-landscape": ("text/vnd.graphviz", "dot"),
+}
+CHUNK_SIZE = 65536
+
+
+def get_graph_export_path(job_id: str, format: str) -> Path:
+    """Return the path of the graph exported by a job."""
+    return CACHE_GRAPHS_PATH / f"{job_id}.{GRAPH_FORMATS[format][1]}"
+
+
+def _form_encoded(data: Dict[str, Any], name: str, stream: IO[bytes]) -> Iterator[bytes]:
+    """Form-encode ``data`` and the content of ``stream`` as field ``name`` chunk by chunk."""
+    fields = urlencode({key: value for key, value in data.items() if value is not None})
+    yield f"{fields}&{name}=".encode("ascii") if fields else f"{name}=".encode("ascii")
+
+    while True:
+        chunk = stream.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        yield quote_plus(chunk).encode("ascii")
+
 
 class GraphExportCtrl(ServiceCtrl, RenkuOperationMixin):
     """Controller for export graph endpoint."""
 
     REQUEST_SERIALIZER = GraphExportRequest()
     RESPONSE_SERIALIZER = GraphExportResponseRPC()
+    METADATA_ONLY = True
 
-    def __init__(self, cache, user_data, request_data):
-        """Construct a datasets list controller."""
+    def __init__(self, cache, user_data, request_data, output_path: Optional[Path] = None):
+        """Construct a graph export controller.
+
+        Args:
+            output_path(Optional[Path]): Write the graph to this file instead of returning it (Default value = None).
+        """
         self.ctx = GraphExportCtrl.REQUEST_SERIALIZER.load(request_data)
+        self.output_path = output_path
         super().__init__(cache, user_data, request_data, clone_depth=PROJECT_CLONE_NO_DEPTH)
 
     @property
@@ -51,6 +91,11 @@ class GraphExportCtrl(ServiceCtrl, RenkuOperationMixin):
         """Controller operation context."""
         return self.ctx
 
+    def use_metadata_view(self) -> bool:
+        """Whether the operation can run against a read-only metadata view of the project."""
+        # NOTE: Metadata views are shallow and don't contain history of other revisions
+        return self.context["revision"] in (None, "HEAD") and super().use_metadata_view()
+
     def renku_op(self):
         """Renku operation for the controller."""
         result = migrations_check().build().execute().output
@@ -64,27 +109,28 @@ class GraphExportCtrl(ServiceCtrl, RenkuOperationMixin):
         }
 
         try:
-            result = export_graph_command().build().execute(revision_or_range=self.context["revision"])
-
-            format = self.context["format"]
-
-            if format == "json-ld":
-                result = result.output.as_jsonld_string(indentation=None)
-            elif format == "rdf":
-                result = result.output.as_rdf_string()
-            elif format == "nt":
-                result = result.output.as_nt_string()
-            elif format == "dot":
-                result = result.output.as_dot_string(format=DotFormat.FULL)
-            elif format == "dot-landscape":
-                result = result.output.as_dot_string(format=DotFormat.FULL_LANDSCAPE)
-            else:
-                raise NotImplementedError(f"Format {format} is not supported on this endpoint.")
+            if self.output_path:
+                # NOTE: Write to a temporary file first so that an incomplete graph is never served
+                partial_path = self.output_path.with_name(f"{self.output_path.name}.partial")
+                with open(partial_path, "wb") as output:
+                    self.write_graph(output)
+                partial_path.replace(self.output_path)
 
-            if self.context.get("callback_url"):
-                self.report_success(callback_payload, {"payload": result}, self.context["callback_url"])
+                if self.context.get("callback_url"):
+                    with open(self.output_path, "rb") as output:
+                        self.report_success(callback_payload, output, self.context["callback_url"])
+
+                return str(self.output_path)
+
+            with tempfile.TemporaryFile() as output:
+                self.write_graph(output)
 
-            return result
+                if self.context.get("callback_url"):
+                    output.seek(0)
+                    self.report_success(callback_payload, output, self.context["callback_url"])
+
+                output.seek(0)
+                return output.read().decode("utf-8")
         except (RequestException, RenkuException, MemoryError) as e:
             if self.context.get("callback_url"):
                 self.report_recoverable(callback_payload, e, self.context["callback_url"])
@@ -94,8 +140,43 @@ class GraphExportCtrl(ServiceCtrl, RenkuOperationMixin):
                 self.report_unrecoverable(callback_payload, e, self.context["callback_url"])
             raise
 
+    def write_graph(self, output: IO[bytes]):
+        """Export the graph and serialize it to a binary stream."""
+        graph = export_graph_command().build().execute(revision_or_range=self.context["revision"]).output
+
+        format = self.context["format"]
+
+        if format == "json-ld":
+            graph.write_jsonld(output, indentation=None)
+        elif format == "rdf":
+            graph.write_rdf(output)
+        elif format == "nt":
+            graph.write_nt(output)
+        elif format == "dot":
+            graph.write_dot(output, format=DotFormat.FULL)
+        elif format == "dot-landscape":
+            graph.write_dot(output, format=DotFormat.FULL_LANDSCAPE)
+        else:
+            raise NotImplementedError(f"Format {format} is not supported on this endpoint.")
+
+    def enqueue_export(self):
+        """Export the graph to a file in a job on the graph queue."""
+        # NOTE: Remove the delayed mark so that the job exports the graph instead of enqueuing itself again
+        self.context.pop("is_delayed")
+
+        job = self.cache.make_job(self.user, job_data={"renku_op": "graph_export", "ctrl_context": self.context})
+
+        with enqueue_retry(GRAPH_JOB_QUEUE) as queue:
+            queue.enqueue(graph_export_job, self.context, self.user_data, job.job_id)
+
+        return result_response(GraphExportCtrl.JOB_RESPONSE_SERIALIZER, job)
+
+    @cached_response
     def to_response(self):
         """Execute controller flow and serialize to service response."""
+        if self.context.get("is_delayed") and "user_id" in self.user_data:
+            return self.enqueue_export()
+
         self.ctx["graph"] = self.execute_op()
         return result_response(GraphExportCtrl.RESPONSE_SERIALIZER, self.ctx)
 
@@ -127,15 +208,19 @@ class GraphExportCtrl(ServiceCtrl, RenkuOperationMixin):
         data = GraphExportCallbackError().load(payload)
         requests.post(callback_url, data=data)
 
-    def report_success(self, request_payload, graph_payload, callback_url):
-        """Report to callback URL success state."""
+    def report_success(self, request_payload, graph, callback_url):
+        """Report to callback URL success state, streaming the graph from a binary stream."""
         from renku.core.util import requests
 
-        data = GraphExportCallbackSuccess().load({**request_payload, **graph_payload})
+        data = GraphExportCallbackSuccess().load(request_payload)
 
         if not callback_url:
             return data
 
-        requests.post(callback_url, data=data)
+        requests.post(
+            callback_url,
+            data=_form_encoded(data, "payload", graph),
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
 
         return data
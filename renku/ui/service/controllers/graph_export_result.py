@@ -0,0 +1,62 @@
+#
+# Copyright 2020 - Swiss Data Science Center (SDSC)
+# A partnership between École Polytechnique Fédérale de Lausanne (EPFL) and
+# Eidgenössische Technische Hochschule Zürich (ETHZ).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Renku graph export result controller."""
+from flask import send_file
+
+from renku.ui.service.cache.models.job import USER_JOB_STATE_COMPLETED
+from renku.ui.service.controllers.api.abstract import ServiceCtrl
+from renku.ui.service.controllers.api.mixins import RenkuOperationMixin
+from renku.ui.service.controllers.graph_export import GRAPH_FORMATS, get_graph_export_path
+from renku.ui.service.errors import IntermittentFileNotExistsError
+from renku.ui.service.serializers.graph import GraphExportResultRequest
+
+
+class GraphExportResultCtrl(ServiceCtrl, RenkuOperationMixin):
+    """Controller for downloading graphs exported by graph export jobs."""
+
+    REQUEST_SERIALIZER = GraphExportResultRequest()
+
+    def __init__(self, cache, user_data, request_data):
+        """Construct a graph export result controller."""
+        self.ctx = GraphExportResultCtrl.REQUEST_SERIALIZER.load(request_data)
+        super().__init__(cache, user_data, request_data)
+
+    @property
+    def context(self):
+        """Controller operation context."""
+        return self.ctx
+
+    def renku_op(self):
+        """Renku operation for the controller."""
+        job_id = self.context["job_id"]
+        job = self.cache.get_job(self.user, job_id)
+
+        if job is None or job.state != USER_JOB_STATE_COMPLETED or job.renku_op != "graph_export":
+            raise IntermittentFileNotExistsError(file_name=job_id)
+
+        format = job.ctrl_context["format"]
+        path = get_graph_export_path(job_id, format)
+
+        if not path.exists():
+            raise IntermittentFileNotExistsError(file_name=job_id)
+
+        return path, GRAPH_FORMATS[format][0]
+
+    def to_response(self):
+        """Execute controller flow and stream the exported graph."""
+        path, mimetype = self.renku_op()
+        return send_file(path, mimetype=mimetype, as_attachment=True, download_name=path.name)
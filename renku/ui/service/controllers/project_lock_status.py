@@ -48,22 +48,29 @@ class ProjectLockStatusCtrl(ServiceCtrl, RenkuOperationMixin):
         return self.ctx
 
     def get_lock_status(self) -> bool:
-        """Return True if a project is write-locked."""
+        """Return True if a project is write-locked or has queued write operations."""
         if "project_id" in self.context:
             try:
                 project = self.cache.get_project(self.user, self.context["project_id"])
             except IntermittentProjectIdError:
                 return False
         elif "git_url" in self.context and "user_id" in self.user_data:
-            try:
-                project = Project.get(
-                    (Project.user_id == self.user_data["user_id"]) & (Project.git_url == self.context["git_url"])
-                )
-            except ValueError:
+            project = next(
+                (
+                    project
+                    for project in Project.iterate(Project.user_id, self.user_data["user_id"])
+                    if project.git_url == self.context["git_url"]
+                ),
+                None,
+            )
+            if project is None:
                 return False
         else:
             raise errors.RenkuException("context does not contain `project_id` or `git_url` or missing `user_id`")
 
+        if len(project.write_queue()) > 0:
+            return True
+
         try:
             with project.read_lock(timeout=self.ctx["timeout"]):
                 return False
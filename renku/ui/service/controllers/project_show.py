@@ -17,7 +17,7 @@
 """Renku service project show controller."""
 from renku.command.project import show_project_command
 from renku.ui.service.controllers.api.abstract import ServiceCtrl
-from renku.ui.service.controllers.api.mixins import RenkuOperationMixin
+from renku.ui.service.controllers.api.mixins import RenkuOperationMixin, cached_response
 from renku.ui.service.serializers.project import ProjectShowRequest, ProjectShowResponseRPC
 from renku.ui.service.views import result_response
 
@@ -27,6 +27,7 @@ class ProjectShowCtrl(ServiceCtrl, RenkuOperationMixin):
 
     REQUEST_SERIALIZER = ProjectShowRequest()
     RESPONSE_SERIALIZER = ProjectShowResponseRPC()
+    METADATA_ONLY = True
 
     def __init__(self, cache, user_data, request_data, migrate_project=False):
         """Construct a project edit controller."""
@@ -44,6 +45,7 @@ class ProjectShowCtrl(ServiceCtrl, RenkuOperationMixin):
         result = show_project_command().build().execute()
         return result.output
 
+    @cached_response
     def to_response(self):
         """Execute controller flow and serialize to service response."""
         result = self.execute_op()
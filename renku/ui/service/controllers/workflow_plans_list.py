@@ -19,7 +19,7 @@
 from renku.command.command_builder.command import Command
 from renku.core.workflow.plan import get_plans_with_metadata
 from renku.ui.service.controllers.api.abstract import ServiceCtrl
-from renku.ui.service.controllers.api.mixins import RenkuOperationMixin
+from renku.ui.service.controllers.api.mixins import RenkuOperationMixin, cached_response
 from renku.ui.service.serializers.workflows import WorkflowPlansListRequest, WorkflowPlansListResponseRPC
 from renku.ui.service.views import result_response
 
@@ -29,6 +29,7 @@ class WorkflowPlansListCtrl(ServiceCtrl, RenkuOperationMixin):
 
     REQUEST_SERIALIZER = WorkflowPlansListRequest()
     RESPONSE_SERIALIZER = WorkflowPlansListResponseRPC()
+    METADATA_ONLY = True
 
     def __init__(self, cache, user_data, request_data):
         """Construct a plans list controller."""
@@ -46,6 +47,7 @@ class WorkflowPlansListCtrl(ServiceCtrl, RenkuOperationMixin):
         result = plan_list_command.build().execute()
         return result.output
 
+    @cached_response
     def to_response(self):
         """Execute controller flow and serialize to service response."""
         self.ctx["plans"] = self.execute_op()
@@ -419,6 +419,34 @@ class UserUploadTooLargeError(ServiceError):
         )
 
 
+class UserUploadChecksumError(ServiceError):
+    """The checksum of an uploaded file doesn't match the checksum sent by the user."""
+
+    code = SVC_ERROR_USER + 151
+    userMessage = "The file '{file_name}' was corrupted during the upload. Please upload it again."
+    devMessage = "Checksum of the uploaded file '{file_name}' doesn't match: expected {expected} but got {actual}."
+
+    def __init__(self, file_name: str, expected: str, actual: str):
+        super().__init__(
+            userMessage=self.userMessage.format(file_name=file_name),
+            devMessage=self.devMessage.format(file_name=file_name, expected=expected, actual=actual),
+        )
+
+
+class UserUploadInvalidChunkError(ServiceError):
+    """A chunk of an upload doesn't fit into the uploaded file."""
+
+    code = SVC_ERROR_USER + 152
+    userMessage = "The upload of file '{file_name}' is invalid. Please upload it again."
+    devMessage = "Invalid chunk of the uploaded file '{file_name}': {reason}"
+
+    def __init__(self, file_name: str, reason: str):
+        super().__init__(
+            userMessage=self.userMessage.format(file_name=file_name),
+            devMessage=self.devMessage.format(file_name=file_name, reason=reason),
+        )
+
+
 class ProgramInvalidGenericFieldsError(ServiceError):
     """One or more fields are unexpected.
 
@@ -827,3 +855,14 @@ class IntermittentCacheError(ServiceError):
 
     def __init__(self, exception=None):
         super().__init__(exception=exception)
+
+
+class IntermittentProjectBusyError(ServiceError):
+    """Too many write operations are queued on a project."""
+
+    code = SVC_ERROR_INTERMITTENT + 204
+    userMessage = "The project is being modified by too many other operations. Please try again later."
+    devMessage = "The write queue of the project is full."
+
+    def __init__(self, exception=None):
+        super().__init__(exception=exception)
@@ -15,11 +15,16 @@
 # limitations under the License.
 """Repository cache interface."""
 
+import hashlib
 import os
 import shutil
+import tempfile
+import time
 import uuid
+from contextlib import contextmanager, nullcontext
 from datetime import datetime
-from typing import Optional
+from pathlib import Path
+from typing import Iterator, Optional
 from urllib.parse import urlparse
 
 import portalocker
@@ -27,16 +32,27 @@ from marshmallow import ValidationError
 
 from renku.command.clone import project_clone_command
 from renku.core import errors
+from renku.core.constant import RENKU_HOME
 from renku.core.util.contexts import renku_project_context
 from renku.core.util.os import normalize_to_ascii
 from renku.domain_model.git import GitURL
 from renku.infrastructure.repository import Repository
 from renku.ui.service.cache import ServiceCache
-from renku.ui.service.cache.models.project import Project
+from renku.ui.service.cache.base import BaseCache
+from renku.ui.service.cache.models.project import LOCK_TIMEOUT, Project
 from renku.ui.service.cache.models.user import User
-from renku.ui.service.config import PROJECT_CLONE_DEPTH_DEFAULT
+from renku.ui.service.config import (
+    CACHE_DIR,
+    CACHE_METADATA_PATH,
+    CACHE_MIRRORS_PATH,
+    CACHE_QUOTA,
+    PROJECT_CLONE_DEPTH_DEFAULT,
+    PROJECT_MAX_STALENESS,
+)
 from renku.ui.service.errors import IntermittentCacheError, IntermittentLockError
 from renku.ui.service.interfaces.repository_cache import IRepositoryCache
+from renku.ui.service.jobs.contexts import enqueue_retry
+from renku.ui.service.jobs.queues import REFRESH_QUEUE_PROJECTS
 from renku.ui.service.logger import service_log
 from renku.ui.service.utils import normalize_git_url
 
@@ -45,18 +61,25 @@ class LocalRepositoryCache(IRepositoryCache):
     """Cache for project repos stored on local disk."""
 
     def get(
-        self, cache: ServiceCache, git_url: str, branch: Optional[str], user: User, shallow: bool = True
+        self,
+        cache: ServiceCache,
+        git_url: str,
+        branch: Optional[str],
+        user: User,
+        shallow: bool = True,
+        stale_ok: bool = False,
     ) -> Project:
-        """Get a project from cache (clone if necessary)."""
+        """Get a project from cache (clone if necessary).
+
+        If ``stale_ok`` is set, a cached project that is slightly out of date is returned right away and refreshed in
+        the background.
+        """
         if git_url is None:
             raise ValidationError("Invalid `git_url`, URL is empty", "git_url")
 
         git_url = normalize_git_url(git_url)
-        try:
-            project = Project.get(
-                (Project.user_id == user.user_id) & (Project.git_url == git_url) & (Project.branch == branch)
-            )
-        except ValueError:
+        project = Project.find_by_remote(user.user_id, git_url, branch)
+        if project is None:
             # project not found in DB
             return self._clone_project(cache, git_url, branch, user, shallow)
 
@@ -68,7 +91,7 @@ class LocalRepositoryCache(IRepositoryCache):
         if not shallow and project.is_shallow:
             self._unshallow_project(project, user)
 
-        self._maybe_update_cache(project, user)
+        self._maybe_update_cache(project, user, stale_ok=stale_ok)
 
         if not project.initialized:
             raise errors.UninitializedProject(project.git_url)
@@ -77,6 +100,109 @@ class LocalRepositoryCache(IRepositoryCache):
 
         return project
 
+    def get_commit_sha(self, git_url: str, branch: Optional[str], user: User) -> str:
+        """Get the latest commit of a branch in the remote repository using the user's credentials.
+
+        Args:
+            git_url(str): The project's Git URL.
+            branch(Optional[str]): The branch or tag to use; the remote's default branch if not set.
+            user(User): The user whose credentials are used.
+
+        Returns:
+            str: The commit SHA.
+        """
+        if git_url is None:
+            raise ValidationError("Invalid `git_url`, URL is empty", "git_url")
+
+        git_url = normalize_git_url(git_url)
+
+        if branch:
+            patterns = [f"refs/heads/{branch}", f"refs/tags/{branch}"]
+            # NOTE: Prefer branches and the commit that an annotated tag points to
+            candidates = [patterns[0], f"refs/tags/{branch}^{{}}", patterns[1]]
+        else:
+            patterns = candidates = ["HEAD"]
+
+        references = Repository.list_remote_references(git_url_with_auth(git_url, user), *patterns)
+        sha = next((references[c] for c in candidates if c in references), None)
+        if not sha:
+            raise errors.GitReferenceNotFoundError(f"Cannot find reference '{branch or 'HEAD'}' in {git_url}")
+
+        return sha
+
+    @contextmanager
+    def get_metadata(
+        self, git_url: str, branch: Optional[str], user: User, commit_sha: Optional[str] = None
+    ) -> Iterator[Path]:
+        """Get a read-only view of a project's metadata at the latest commit of a branch.
+
+        Views only contain ``.renku`` and top-level files from a shallow, blobless clone. They are stored by commit SHA
+        and never change, so they are shared between users and requests. The remote is queried with the user's
+        credentials to check access and find the latest commit unless ``commit_sha`` was already resolved that way.
+        The view is locked while it's used, so that it isn't removed by the cleanup.
+
+        Args:
+            git_url(str): The project's Git URL.
+            branch(Optional[str]): The branch or tag to use; the remote's default branch if not set.
+            user(User): The user requesting the view.
+            commit_sha(Optional[str]): The latest commit as returned by ``get_commit_sha`` (Default value = None).
+
+        Returns:
+            Iterator[Path]: The path of the metadata view.
+        """
+        sha = commit_sha or self.get_commit_sha(git_url, branch, user)
+        git_url = normalize_git_url(git_url)
+        url_with_auth = git_url_with_auth(git_url, user)
+
+        views_path = CACHE_METADATA_PATH / hashlib.sha256(git_url.encode("utf-8")).hexdigest()
+        path = views_path / sha
+
+        if not path.exists():
+            views_path.mkdir(parents=True, exist_ok=True)
+
+            with portalocker.Lock(f"{path}.lock", flags=portalocker.LOCK_EX, timeout=LOCK_TIMEOUT):
+                if not path.exists():
+                    self._create_metadata_view(url_with_auth, git_url, sha, branch, path)
+
+        with portalocker.Lock(f"{path}.lock", flags=portalocker.LOCK_SH | portalocker.LOCK_NB, timeout=LOCK_TIMEOUT):
+            if not path.exists():
+                # NOTE: The view was removed by the cleanup before it was locked
+                raise FileNotFoundError(f"Metadata view {path} was removed")
+
+            # NOTE: Modification time is used to remove unused views
+            os.utime(path)
+
+            yield path
+
+    @staticmethod
+    def _create_metadata_view(url_with_auth: str, git_url: str, sha: str, branch: Optional[str], path: Path):
+        """Clone only metadata of a project at a commit."""
+        from renku.core.util.git import clone_repository
+
+        with tempfile.TemporaryDirectory(dir=path.parent) as tempdir:
+            clone_path = Path(tempdir) / "clone"
+            repository = clone_repository(
+                url_with_auth,
+                path=clone_path,
+                install_githooks=False,
+                install_lfs=False,
+                depth=1,
+                checkout_revision=branch,
+                clone_filter="blob:none",
+                sparse_paths=[RENKU_HOME],
+            )
+            # NOTE: Views are shared between users, so don't keep anyone's credentials in them
+            repository.run_git_command("remote", "set-url", "origin", git_url)
+
+            if repository.head.commit.hexsha != sha:
+                # NOTE: Remote changed after it was queried; the next request will create a view for the new commit
+                raise errors.GitError(f"Remote {git_url} changed while creating metadata view")
+
+            if not (clone_path / RENKU_HOME).exists():
+                raise errors.UninitializedProject(git_url)
+
+            clone_path.rename(path)
+
     def evict(self, project: Project):
         """Evict a project from cache."""
         try:
@@ -90,9 +216,36 @@ class LocalRepositoryCache(IRepositoryCache):
 
     def evict_expired(self):
         """Evict expired projects from cache."""
-        for project in Project.all():
-            if project.ttl_expired():
-                self.evict(project)
+        Project.rebuild_age_index()
+
+        for project in Project.iterate_by_age(max_age=Project.default_ttl()):
+            self.evict(project)
+
+        self.evict_over_quota()
+        self._collect_mirrors()
+        self._collect_metadata_views()
+
+    def evict_over_quota(self, quota: Optional[int] = None):
+        """Evict least recently used projects while the cache volume uses more than ``quota`` bytes.
+
+        Usage is measured for the whole filesystem that contains the cache directory since walking the cache directory
+        after each eviction would be too slow. Files outside of the cache count towards the quota, so the cache should
+        be on a dedicated volume.
+
+        Args:
+            quota(Optional[int]): Maximum number of bytes used on the cache volume, ``RENKU_SVC_CACHE_QUOTA`` if not
+                set. A quota of 0 disables eviction (Default value = None).
+        """
+        quota = CACHE_QUOTA if quota is None else quota
+        if not quota:
+            return
+
+        for project in Project.iterate_by_age():
+            if shutil.disk_usage(CACHE_DIR).used <= quota:
+                return
+
+            service_log.info(f"cache volume is over quota, evicting least recently used project {project.project_id}")
+            self.evict(project)
 
     def _update_project_access_date(self, project: Project):
         """Update the access date of the project to current datetime."""
@@ -132,18 +285,10 @@ class LocalRepositoryCache(IRepositoryCache):
 
         try:
             with project.write_lock(), renku_project_context(project.abs_path, check_git_path=False):
-                try:
-                    # NOTE: If two requests ran at the same time, by the time we acquire the lock a project might
-                    # already be cloned by an earlier request.
-                    found_project = Project.get(
-                        (Project.user_id == user.user_id)
-                        & (Project.git_url == git_url)
-                        & (Project.branch == branch)
-                        & (Project.project_id != project.project_id)
-                    )
-                except ValueError:
-                    pass
-                else:
+                # NOTE: If two requests ran at the same time, by the time we acquire the lock a project might
+                # already be cloned by an earlier request.
+                found_project = Project.find_by_remote(user.user_id, git_url, branch)
+                if found_project is not None and found_project.project_id != project.project_id:
                     if found_project.abs_path.exists():
                         service_log.debug(f"project already cloned, skipping clone: {git_url}")
                         self._update_project_access_date(found_project)
@@ -157,23 +302,28 @@ class LocalRepositoryCache(IRepositoryCache):
                     for d in dirs:
                         shutil.rmtree(os.path.join(root, d))
 
-                repo, project.initialized = (
-                    project_clone_command()
-                    .build()
-                    .execute(
-                        git_url_with_auth(project, user),
-                        path=project.abs_path,
-                        depth=project.clone_depth,
-                        raise_git_except=True,
-                        config={
-                            "user.name": user.fullname,
-                            "user.email": user.email,
-                            "pull.rebase": False,
-                        },
-                        checkout_revision=project.branch,
-                    )
-                ).output
-                project.save()
+                mirror_path = self._update_mirror(project, user)
+
+                # NOTE: Hold a shared lock on the mirror so that it isn't garbage collected while cloning
+                with self._mirror_read_lock(mirror_path) if mirror_path else nullcontext():
+                    repo, project.initialized = (
+                        project_clone_command()
+                        .build()
+                        .execute(
+                            git_url_with_auth(project.git_url, user),
+                            path=project.abs_path,
+                            depth=project.clone_depth,
+                            raise_git_except=True,
+                            config={
+                                "user.name": user.fullname,
+                                "user.email": user.email,
+                                "pull.rebase": False,
+                            },
+                            checkout_revision=project.branch,
+                            reference=mirror_path,
+                        )
+                    ).output
+                    project.save()
 
                 service_log.debug(f"project successfully cloned: {repo}")
 
@@ -201,13 +351,64 @@ class LocalRepositoryCache(IRepositoryCache):
         except (portalocker.LockException, portalocker.AlreadyLocked, errors.LockError) as e:
             raise IntermittentLockError() from e
 
-    def _maybe_update_cache(self, project: Project, user: User):
+    def refresh(self, project: Project, user: User):
+        """Fetch the latest changes of a cached project in the background."""
+        from renku.ui.service.jobs.projects import refresh_project_job
+
+        # NOTE: Don't enqueue a refresh while another one for the same project is pending
+        if not BaseCache.cache.set(get_refresh_key(project), 1, nx=True, ex=PROJECT_MAX_STALENESS):
+            return
+
+        with enqueue_retry(REFRESH_QUEUE_PROJECTS) as queue:
+            queue.enqueue(refresh_project_job, project.project_id, user.user_id, datetime.utcnow().isoformat())
+
+    def refresh_remote(self, git_url: str, branch: Optional[str] = None) -> int:
+        """Refresh all cached projects of a remote repository in the background, e.g. after a push.
+
+        Args:
+            git_url(str): The remote's Git URL.
+            branch(Optional[str]): Only refresh clones of this branch and of the default branch (Default value = None).
+
+        Returns:
+            int: Number of projects that are refreshed.
+        """
+        refreshed = 0
+
+        for project in Project.iterate(Project.git_url, normalize_git_url(git_url)):
+            if branch is not None and project.branch and project.branch != branch:
+                continue
+
+            try:
+                user = User.get(User.user_id == project.user_id)
+            except ValueError:
+                continue
+
+            self.refresh(project, user)
+            refreshed += 1
+
+        return refreshed
+
+    def _maybe_update_cache(self, project: Project, user: User, stale_ok: bool = False):
         """Update the cache from the remote if it's out of date."""
         from renku.ui.service.controllers.api.mixins import PROJECT_FETCH_TIME
 
         if project.fetch_age < PROJECT_FETCH_TIME:
             return
 
+        if stale_ok and project.fetch_age < PROJECT_MAX_STALENESS:
+            # NOTE: Serve the cached version and update it in the background (stale-while-revalidate)
+            self.refresh(project, user)
+            return
+
+        self.update(project, user)
+
+    def update(self, project: Project, user: User):
+        """Fetch the latest changes of a cached project."""
+        if (project.abs_path / ".git" / "objects" / "info" / "alternates").exists():
+            # NOTE: Objects that are already in the shared mirror aren't fetched again. The mirror is only fetched if
+            # no other request did it recently; otherwise, the project is fetched right away.
+            self._update_mirror(project, user)
+
         try:
             with project.write_lock(), Repository(project.abs_path) as repository:
                 try:
@@ -219,6 +420,15 @@ class LocalRepositoryCache(IRepositoryCache):
                         if project.clone_depth is not None and project.clone_depth > 0
                         else None,
                     )
+                    # NOTE: Don't discard commits of a write that wasn't synced yet; they're pushed by the write itself
+                    unpushed = repository.run_git_command(
+                        "rev-list", "--count", f"origin/{repository.active_branch}..HEAD"
+                    )
+                    if int(unpushed or 0) > 0:
+                        service_log.warning(
+                            f"project {project.project_id}:{project.name} has unpushed commits, not updating it"
+                        )
+                        return
                     repository.reset(f"origin/{repository.active_branch}", hard=True)
                 except errors.GitCommandError as e:
                     project.purge()
@@ -229,10 +439,124 @@ class LocalRepositoryCache(IRepositoryCache):
         except (portalocker.LockException, portalocker.AlreadyLocked, errors.LockError) as e:
             raise IntermittentLockError() from e
 
+    def _update_mirror(self, project: Project, user: User) -> Optional[Path]:
+        """Create or update the shared bare mirror of a project's remote repository.
+
+        Clones of the same remote for all users and branches borrow objects from the mirror (using Git alternates), so
+        each object is downloaded and stored only once. The mirror is fetched with the requesting user's credentials,
+        which are never stored in it. Clones still fetch from the remote with their own user's credentials, so access
+        control is enforced by the remote.
 
-def git_url_with_auth(project: Project, user: User):
+        Args:
+            project(Project): The project whose remote should be mirrored.
+            user(User): The user whose credentials are used to fetch.
+
+        Returns:
+            Optional[Path]: Path of the mirror or None if it couldn't be updated.
+        """
+        path = get_mirror_path(project.git_url)
+
+        # NOTE: Don't wait for the exclusive lock if the mirror is fresh; check again once the lock is acquired since
+        # another request might have fetched it in the meantime.
+        if is_mirror_fresh(path):
+            return path
+
+        try:
+            with portalocker.Lock(f"{path}.lock", flags=portalocker.LOCK_EX, timeout=LOCK_TIMEOUT):
+                if is_mirror_fresh(path):
+                    return path
+
+                if path.exists():
+                    repository = Repository(path)
+                else:
+                    repository = Repository.initialize(path, bare=True)
+                    with repository.get_configuration(writable=True) as config:
+                        # NOTE: Clones reference objects in the mirror, so they must never be pruned
+                        config.set_value("gc", "pruneExpire", "never")
+
+                repository.run_git_command(
+                    "fetch",
+                    git_url_with_auth(project.git_url, user),
+                    "+refs/heads/*:refs/heads/*",
+                    "+refs/tags/*:refs/tags/*",
+                    quiet=True,
+                )
+        except (portalocker.LockException, portalocker.AlreadyLocked, errors.GitError) as e:
+            service_log.warning(f"Couldn't update mirror of {project.git_url}, cloning without it", exc_info=e)
+            return None
+
+        return path
+
+    @staticmethod
+    def _mirror_read_lock(path: Path):
+        """Shared lock on a mirror that prevents it from being garbage collected."""
+        return portalocker.Lock(f"{path}.lock", flags=portalocker.LOCK_SH, timeout=LOCK_TIMEOUT)
+
+    def _collect_mirrors(self):
+        """Remove mirrors that aren't used by any cached project and compact the remaining ones."""
+        used_mirrors = {get_mirror_path(project.git_url) for project in Project.iterate()}
+
+        for path in CACHE_MIRRORS_PATH.glob("*.git"):
+            try:
+                with portalocker.Lock(
+                    f"{path}.lock", flags=portalocker.LOCK_EX | portalocker.LOCK_NB, fail_when_locked=True
+                ):
+                    if path in used_mirrors:
+                        Repository(path).run_git_command("gc", auto=True, quiet=True)
+                    else:
+                        service_log.debug(f"purging unused mirror {path}")
+                        shutil.rmtree(path)
+            except (portalocker.LockException, portalocker.AlreadyLocked):
+                # NOTE: Mirror is being updated or cloned from
+                continue
+            except (errors.GitError, OSError) as e:
+                service_log.error(f"Couldn't collect mirror {path}", exc_info=e)
+
+    def _collect_metadata_views(self):
+        """Remove metadata views that weren't used recently."""
+        ttl = int(os.getenv("RENKU_SVC_CLEANUP_TTL_PROJECTS", 1800))
+
+        for path in CACHE_METADATA_PATH.glob("*/*"):
+            if not path.is_dir() or time.time() - path.stat().st_mtime < ttl:
+                continue
+
+            # NOTE: Views that are in use are locked by their readers; they are removed by a later cleanup
+            try:
+                with portalocker.Lock(f"{path}.lock", flags=portalocker.LOCK_EX | portalocker.LOCK_NB, timeout=0):
+                    if time.time() - path.stat().st_mtime < ttl:
+                        continue
+
+                    service_log.debug(f"purging metadata view {path}")
+                    shutil.rmtree(path, ignore_errors=True)
+                    Path(f"{path}.lock").unlink(missing_ok=True)
+            except (portalocker.LockException, portalocker.AlreadyLocked):
+                continue
+
+
+def get_refresh_key(project: Project) -> str:
+    """Cache key that marks a pending background refresh of a project."""
+    return f"{BaseCache.namespace}.refresh.{project.project_id}"
+
+
+def get_mirror_path(git_url: str) -> Path:
+    """Path of the shared bare mirror of a remote repository."""
+    digest = hashlib.sha256(normalize_git_url(git_url).encode("utf-8")).hexdigest()
+    return CACHE_MIRRORS_PATH / f"{digest}.git"
+
+
+def is_mirror_fresh(path: Path) -> bool:
+    """Whether a mirror was fetched less than ``PROJECT_FETCH_TIME`` seconds ago."""
+    from renku.ui.service.controllers.api.mixins import PROJECT_FETCH_TIME
+
+    try:
+        return time.time() - (path / "FETCH_HEAD").stat().st_mtime < PROJECT_FETCH_TIME
+    except FileNotFoundError:
+        return False
+
+
+def git_url_with_auth(git_url: str, user: User):
     """Format url with auth."""
-    git_url = urlparse(normalize_git_url(project.git_url))
+    parsed_url = urlparse(normalize_git_url(git_url))
 
-    url = "oauth2:{}@{}".format(user.token, git_url.netloc)
-    return git_url._replace(netloc=url).geturl()
+    url = "oauth2:{}@{}".format(user.token, parsed_url.netloc)
+    return parsed_url._replace(netloc=url).geturl()
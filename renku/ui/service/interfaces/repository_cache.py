@@ -16,7 +16,8 @@
 """Repository cache interface."""
 
 from abc import ABC
-from typing import Optional
+from pathlib import Path
+from typing import ContextManager, Optional
 
 from renku.ui.service.cache import ServiceCache
 from renku.ui.service.cache.models.project import Project
@@ -27,11 +28,31 @@ class IRepositoryCache(ABC):
     """Interface for repository cache manager."""
 
     def get(
-        self, cache: ServiceCache, git_url: str, branch: Optional[str], user: User, shallow: bool = True
+        self,
+        cache: ServiceCache,
+        git_url: str,
+        branch: Optional[str],
+        user: User,
+        shallow: bool = True,
+        stale_ok: bool = False,
     ) -> Project:
         """Get a project from cache (clone if necessary)."""
         raise NotImplementedError()
 
+    def get_commit_sha(self, git_url: str, branch: Optional[str], user: User) -> str:
+        """Get the latest commit of a branch in the remote repository."""
+        raise NotImplementedError()
+
+    def get_metadata(
+        self, git_url: str, branch: Optional[str], user: User, commit_sha: Optional[str] = None
+    ) -> ContextManager[Path]:
+        """Get a read-only view of a project's metadata at the latest commit of a branch."""
+        raise NotImplementedError()
+
+    def refresh_remote(self, git_url: str, branch: Optional[str] = None) -> int:
+        """Refresh all cached projects of a remote repository in the background."""
+        raise NotImplementedError()
+
     def evict(self, project: Project):
         """Evict a project from cache."""
         raise NotImplementedError()
@@ -39,3 +60,7 @@ class IRepositoryCache(ABC):
     def evict_expired(self):
         """Evict expired projects from cache."""
         raise NotImplementedError()
+
+    def evict_over_quota(self, quota: Optional[int] = None):
+        """Evict least recently used projects while the cache volume uses more than ``quota`` bytes."""
+        raise NotImplementedError()
@@ -16,9 +16,12 @@
 # limitations under the License.
 """Cleanup jobs."""
 import shutil
+import time
+from typing import Optional, Set
 
 from renku.ui.service.cache import ServiceCache
-from renku.ui.service.cache.models.job import USER_JOB_STATE_ENQUEUED, USER_JOB_STATE_IN_PROGRESS
+from renku.ui.service.cache.models.file import File
+from renku.ui.service.config import CACHE_GRAPHS_PATH
 from renku.ui.service.logger import worker_log
 
 
@@ -27,36 +30,50 @@ def cache_files_cleanup():
     cache = ServiceCache()
     worker_log.debug("executing cache files cleanup")
 
-    for user, files in cache.user_files():
-        jobs = [
-            job for job in cache.get_jobs(user) if job.state in [USER_JOB_STATE_ENQUEUED, USER_JOB_STATE_IN_PROGRESS]
-        ]
-
-        for file in files:
-            if file.is_locked(jobs):
-                continue
-
-            if file.exists() and file.ttl_expired():
-                worker_log.debug(f"purging file {file.file_id}:{file.file_name}")
-                file.purge()
-            elif not file.exists():
-                file.delete()
-
-    for user, chunks in cache.user_chunks():
-        jobs = [
-            job for job in cache.get_jobs(user) if job.state in [USER_JOB_STATE_ENQUEUED, USER_JOB_STATE_IN_PROGRESS]
-        ]
-
-        chunk_folders = set()
-
-        for chunk in chunks:
-            if chunk.exists() and chunk.ttl_expired():
-                worker_log.debug(f"purging chunk {chunk.chunk_file_id}:{chunk.file_name}")
-                chunk.purge()
-                chunk_folders.add(chunk.abs_path.parent)
-            elif not chunk.exists():
-                chunk.delete()
-                chunk_folders.add(chunk.abs_path.parent)
-
-        for chunk_folder in chunk_folders:
-            shutil.rmtree(chunk_folder, ignore_errors=True)
+    locked: Optional[Set[str]] = None
+
+    for file in cache.expired_files():
+        if locked is None:
+            # NOTE: Collect the ids locked by active jobs once and only if there are expired files.
+            locked = set()
+            for job in cache.get_active_jobs():
+                locked.update(value.decode("utf-8") if isinstance(value, bytes) else value for value in job.locked)
+
+        if file.file_id in locked:
+            continue
+
+        if file.exists():
+            worker_log.debug(f"purging file {file.file_id}:{file.file_name}")
+            file.purge()
+        else:
+            file.delete()
+
+    chunk_folders = set()
+
+    for chunk in cache.expired_chunks():
+        if chunk.exists():
+            worker_log.debug(f"purging chunk {chunk.chunk_file_id}:{chunk.file_name}")
+            chunk.purge()
+        else:
+            chunk.delete()
+        chunk_folders.add(chunk.abs_path.parent)
+
+    for chunk_folder in chunk_folders:
+        shutil.rmtree(chunk_folder, ignore_errors=True)
+
+    # NOTE: Graphs exported by jobs expire like uploaded files
+    expired_at = time.time() - File.default_ttl()
+    for graph in CACHE_GRAPHS_PATH.iterdir():
+        try:
+            if graph.stat().st_mtime <= expired_at:
+                worker_log.debug(f"purging exported graph {graph.name}")
+                graph.unlink()
+        except FileNotFoundError:
+            pass
+
+    # NOTE: Cleanup runs periodically, so it reports how effective the response cache is
+    for endpoint, metrics in cache.get_response_metrics().items():
+        worker_log.info(
+            f"response cache of {endpoint}: {metrics['hits']} hits, {metrics['misses']} misses, "
+            f"hit rate {metrics['hit_rate']:.2f}"
+        )
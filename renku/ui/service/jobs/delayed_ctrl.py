@@ -16,6 +16,7 @@
 # limitations under the License.
 """Delayed controller jobs."""
 import importlib
+import time
 
 from renku.ui.service.logger import worker_log
 from renku.ui.service.views.decorators import requires_cache
@@ -34,7 +35,11 @@ def to_ctrl(cache, context, user_data, renku_module, renku_ctrl):
 @requires_cache
 def delayed_ctrl_job(cache, context, user_data, job_id, renku_module, renku_ctrl):
     """Delayed controller job."""
+    started_at = time.monotonic()
     ctrl = to_ctrl(cache, context, user_data, renku_module, renku_ctrl)
+    # NOTE: Loading a controller imports the renku stack unless the worker preloaded it
+    worker_log.debug(f"loaded controller {renku_ctrl} in {time.monotonic() - started_at:.3f}s")
+
     result = ctrl.to_response().json
 
     user = cache.ensure_user(user_data)
@@ -0,0 +1,42 @@
+#
+# Copyright 2020 - Swiss Data Science Center (SDSC)
+# A partnership between École Polytechnique Fédérale de Lausanne (EPFL) and
+# Eidgenössische Technische Hochschule Zürich (ETHZ).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Graph jobs."""
+from renku.ui.service.logger import worker_log
+from renku.ui.service.views.decorators import requires_cache
+
+
+@requires_cache
+def graph_export_job(cache, context, user_data, job_id):
+    """Export a project's graph to a file in the cache."""
+    from renku.ui.service.controllers.graph_export import GraphExportCtrl, get_graph_export_path
+
+    user = cache.ensure_user(user_data)
+    worker_log.debug(f"executing graph export job for {user.user_id}:{user.fullname}")
+
+    user_job = cache.get_job(user, job_id)
+    user_job.in_progress()
+
+    try:
+        output_path = get_graph_export_path(job_id, context["format"])
+        GraphExportCtrl(cache, user_data, context, output_path=output_path).execute_op()
+    except BaseException as e:
+        user_job.fail_job(str(e))
+
+        # NOTE: Reraise exception, so we see trace in job metadata and in metrics as failed job.
+        raise
+
+    user_job.complete()
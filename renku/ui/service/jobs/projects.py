@@ -0,0 +1,53 @@
+#
+# Copyright 2020 - Swiss Data Science Center (SDSC)
+# A partnership between École Polytechnique Fédérale de Lausanne (EPFL) and
+# Eidgenössische Technische Hochschule Zürich (ETHZ).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Project cache jobs."""
+from datetime import datetime
+
+from renku.ui.service.cache.base import BaseCache
+from renku.ui.service.cache.models.project import Project
+from renku.ui.service.cache.models.user import User
+from renku.ui.service.gateways.repository_cache import LocalRepositoryCache, get_refresh_key
+from renku.ui.service.logger import worker_log
+
+
+def refresh_project_job(project_id, user_id, requested_at=None):
+    """Fetch the latest changes of a cached project."""
+    try:
+        project = Project.load(project_id)
+        user = User.get(User.user_id == user_id)
+    except (KeyError, ValueError):
+        # NOTE: Project was evicted or user logged out in the meantime
+        return
+
+    try:
+        # NOTE: Wait for writes on the project, so that commits that they didn't push yet aren't reset
+        with project.write_queue():
+            try:
+                project = Project.load(project_id)
+            except KeyError:
+                return
+
+            # NOTE: Skip the refresh if the project was fetched while waiting, e.g. by a write
+            if requested_at is not None and project.last_fetched_at >= datetime.fromisoformat(requested_at):
+                worker_log.debug(f"project {project.project_id}:{project.name} was fetched in the meantime")
+                return
+
+            if project.exists():
+                worker_log.debug(f"refreshing project {project.project_id}:{project.name}")
+                LocalRepositoryCache().update(project, user)
+    finally:
+        BaseCache.cache.delete(get_refresh_key(project))
@@ -24,6 +24,7 @@ from renku.ui.service.cache.config import REDIS_NAMESPACE
 
 CLEANUP_QUEUE_FILES = f"{REDIS_NAMESPACE}.cache.cleanup.files"
 CLEANUP_QUEUE_PROJECTS = f"{REDIS_NAMESPACE}.cache.cleanup.projects"
+REFRESH_QUEUE_PROJECTS = f"{REDIS_NAMESPACE}.cache.refresh.projects"
 
 DATASETS_JOB_QUEUE = f"{REDIS_NAMESPACE}.datasets.jobs"
 MIGRATIONS_JOB_QUEUE = f"{REDIS_NAMESPACE}.project.migrations"
@@ -42,6 +43,7 @@ DELAYED_CTRL_CONFIG_SET = f"{REDIS_NAMESPACE}.delayed.ctrl.SetConfigCtrl"
 QUEUES = [
     CLEANUP_QUEUE_FILES,
     CLEANUP_QUEUE_PROJECTS,
+    REFRESH_QUEUE_PROJECTS,
     DATASETS_JOB_QUEUE,
     MIGRATIONS_JOB_QUEUE,
     GRAPH_JOB_QUEUE,
@@ -19,7 +19,7 @@ import time
 import uuid
 from urllib.parse import urlparse
 
-from marshmallow import Schema, ValidationError, fields, post_load, pre_load, validates_schema
+from marshmallow import EXCLUDE, Schema, ValidationError, fields, post_load, pre_load, validates, validates_schema
 from marshmallow_oneofschema import OneOfSchema
 from werkzeug.utils import secure_filename
 
@@ -37,6 +37,8 @@ from renku.ui.service.serializers.common import (
 )
 from renku.ui.service.serializers.rpc import JsonRPCResponse
 
+CHECKSUM_ALGORITHMS = ["md5", "sha1", "sha256", "sha512"]
+
 
 def extract_file(request):
     """Extract file from Flask request.
@@ -84,6 +86,13 @@ class FileUploadRequest(ArchiveSchema):
     total_size = fields.Integer(
         data_key="dztotalfilesize", load_default=None, metadata={"description": "Dropzone total file size."}
     )
+    chunked_checksum = fields.String(
+        load_default=None,
+        metadata={
+            "description": "Checksum of the whole file for chunked uploads as '<algorithm>:<hex digest>', "
+            "e.g. 'sha256:9f86d08...'. The assembled file is verified against it."
+        },
+    )
 
     @validates_schema
     def validate_requires(self, data, **kwargs):
@@ -91,6 +100,16 @@ class FileUploadRequest(ArchiveSchema):
         if data.get("dzuuid") is not None and ("dzchunkindex" not in data or "dztotalchunkcount" not in data):
             raise ValidationError("'dzchunkindex' and 'dztotalchunkcount' are required when 'dzuuid' is set.")
 
+    @validates("chunked_checksum")
+    def validate_chunked_checksum(self, value, **kwargs):
+        """Validate the checksum of chunked uploads."""
+        if value is None:
+            return
+
+        algorithm, _, digest = value.partition(":")
+        if algorithm not in CHECKSUM_ALGORITHMS or not digest:
+            raise ValidationError(f"Checksum must be '<algorithm>:<hex digest>' with one of {CHECKSUM_ALGORITHMS}.")
+
 
 class FileUploadResponse(Schema):
     """Response schema for file upload."""
@@ -406,3 +425,34 @@ class ProjectMigrationCheckResponseRPC(JsonRPCResponse):
     """RPC response schema for project migration check."""
 
     result = fields.Nested(ProjectMigrationCheckResponse)
+
+
+class ProjectPushEventProject(Schema):
+    """Project details of a push event."""
+
+    class Meta:
+        unknown = EXCLUDE
+
+    git_http_url = fields.String(required=True, metadata={"description": "Git URL of the project."})
+
+
+class ProjectPushEventRequest(Schema):
+    """Request schema for a push event (e.g. a GitLab push webhook)."""
+
+    class Meta:
+        unknown = EXCLUDE
+
+    ref = fields.String(required=True, metadata={"description": "Pushed reference, e.g. 'refs/heads/master'."})
+    project = fields.Nested(ProjectPushEventProject, required=True)
+
+
+class ProjectPushEventResponse(Schema):
+    """Response schema for a push event."""
+
+    refreshed = fields.Integer(metadata={"description": "Number of cached projects that are refreshed."})
+
+
+class ProjectPushEventResponseRPC(JsonRPCResponse):
+    """RPC response schema for a push event."""
+
+    result = fields.Nested(ProjectPushEventResponse)
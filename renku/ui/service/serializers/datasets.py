@@ -15,7 +15,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Renku service datasets serializers."""
-from marshmallow import Schema, ValidationError, fields, post_load
+from marshmallow import Schema, ValidationError, fields, post_load, validate
 
 from renku.domain_model.dataset import DatasetCreatorsJson as DatasetCreators
 from renku.domain_model.dataset import DatasetDetailsJson as DatasetDetails
@@ -146,6 +146,21 @@ class DatasetListResponseRPC(JsonRPCResponse):
 class DatasetFilesListRequest(DatasetNameSchema, RemoteRepositorySchema):
     """Request schema for dataset files list view."""
 
+    include = fields.String(
+        load_default=None, metadata={"description": "Comma-separated patterns of file paths to include."}
+    )
+    exclude = fields.String(
+        load_default=None, metadata={"description": "Comma-separated patterns of file paths to exclude."}
+    )
+    limit = fields.Integer(
+        load_default=None, validate=validate.Range(min=1), metadata={"description": "Maximum number of files to list."}
+    )
+    offset = fields.Integer(load_default=0, validate=validate.Range(min=0), metadata={"description": "Files to skip."})
+    cursor = fields.String(
+        load_default=None,
+        metadata={"description": "List files after the last file of a previous response; use its 'next_cursor'."},
+    )
+
 
 class DatasetFileDetails(DatasetNameSchema):
     """Serialize dataset files to a response object."""
@@ -159,6 +174,9 @@ class DatasetFilesListResponse(DatasetNameSchema):
     """Response schema for dataset files list view."""
 
     files = fields.List(fields.Nested(DatasetFileDetails), required=True)
+    next_cursor = fields.String(
+        metadata={"description": "Cursor to list the next files; it's only set if there might be more files."}
+    )
 
 
 class DatasetFilesListResponseRPC(JsonRPCResponse):
@@ -43,6 +43,12 @@ class GraphExportResponseRPC(JsonRPCResponse):
     result = fields.Nested(GraphExportResponse)
 
 
+class GraphExportResultRequest(Schema):
+    """Request schema for downloading a graph exported by a job."""
+
+    job_id = fields.String(required=True, metadata={"description": "Id of the graph export job."})
+
+
 class GraphExportCallback(Schema):
     """Callback serializer for graph build."""
 
@@ -23,6 +23,7 @@ from renku.ui.service.controllers.cache_files_upload import UploadFilesCtrl
 from renku.ui.service.controllers.cache_list_uploaded import ListUploadedFilesCtrl
 from renku.ui.service.controllers.cache_migrate_project import MigrateProjectCtrl
 from renku.ui.service.controllers.cache_migrations_check import MigrationsCheckCtrl
+from renku.ui.service.controllers.cache_project_push import ProjectPushCtrl
 from renku.ui.service.gateways.gitlab_api_provider import GitlabAPIProvider
 from renku.ui.service.gateways.repository_cache import LocalRepositoryCache
 from renku.ui.service.jobs.cleanup import cache_files_cleanup
@@ -210,4 +211,31 @@ def cache_cleanup(user_data, cache):
     return jsonify({"result": "ok"})
 
 
+@cache_blueprint.route("/cache.project_push", methods=["POST"], provide_automatic_options=False, versions=[V2_1])
+@handle_common_except
+@accepts_json
+def project_push_view():
+    """
+    Refresh cached projects after changes were pushed to them.
+
+    ---
+    post:
+      description: Push webhook (e.g. from GitLab) that refreshes cached clones of the pushed project in the
+        background. The webhook's secret token must be sent in the ``X-Gitlab-Token`` header.
+      requestBody:
+        content:
+          application/json:
+            schema: ProjectPushEventRequest
+      responses:
+        200:
+          description: Number of cached projects that are refreshed.
+          content:
+            application/json:
+              schema: ProjectPushEventResponseRPC
+      tags:
+        - cache
+    """
+    return ProjectPushCtrl(dict(request.json), request.headers.get("X-Gitlab-Token")).to_response()  # type: ignore
+
+
 cache_blueprint = add_v1_specific_endpoints(cache_blueprint)
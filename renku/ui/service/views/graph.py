@@ -19,8 +19,9 @@ from flask import request
 
 from renku.ui.service.config import SERVICE_PREFIX
 from renku.ui.service.controllers.graph_export import GraphExportCtrl
+from renku.ui.service.controllers.graph_export_result import GraphExportResultCtrl
 from renku.ui.service.views.api_versions import ALL_VERSIONS, VersionedBlueprint
-from renku.ui.service.views.decorators import accepts_json, optional_identity, requires_cache
+from renku.ui.service.views.decorators import accepts_json, optional_identity, requires_cache, requires_identity
 from renku.ui.service.views.error_handlers import handle_common_except, handle_graph_errors
 
 GRAPH_BLUEPRINT_TAG = "graph"
@@ -46,11 +47,42 @@ def graph_build_view(user_data, cache):
             schema: GraphExportRequest
       responses:
         200:
-          description: "Status of the graph building"
+          description: "Status of the graph building, or the enqueued job if `is_delayed` is set"
           content:
             application/json:
-              schema: GraphExportResponseRPC
+              schema:
+                oneOf:
+                  - GraphExportResponseRPC
+                  - DelayedResponseRPC
       tags:
         - graph
     """
     return GraphExportCtrl(cache, user_data, dict(request.json)).to_response()  # type: ignore
+
+
+@graph_blueprint.route("/graph.export.result", methods=["GET"], provide_automatic_options=False, versions=ALL_VERSIONS)
+@handle_common_except
+@requires_cache
+@requires_identity
+def graph_export_result_view(user_data, cache):
+    """
+    Download a graph exported by a delayed graph export.
+
+    ---
+    get:
+      description: Stream the graph exported by a completed graph export job.
+      parameters:
+        - in: query
+          schema: GraphExportResultRequest
+      responses:
+        200:
+          description: "The exported graph in the requested format"
+          content:
+            application/octet-stream:
+              schema:
+                type: string
+                format: binary
+      tags:
+        - graph
+    """
+    return GraphExportResultCtrl(cache, user_data, dict(request.args)).to_response()
@@ -15,7 +15,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Renku service worker."""
+import importlib
 import os
+import pkgutil
+import time
 from contextlib import contextmanager
 
 import sentry_sdk
@@ -24,7 +27,7 @@ from sentry_sdk.integrations.rq import RqIntegration
 
 from renku.core.errors import ConfigurationError, UsageError
 from renku.ui.service.cache.config import REDIS_NAMESPACE
-from renku.ui.service.config import SENTRY_ENABLED, SENTRY_SAMPLERATE
+from renku.ui.service.config import SENTRY_ENABLED, SENTRY_SAMPLERATE, WORKER_PRELOAD
 from renku.ui.service.jobs.queues import QUEUES, WorkerQueues
 from renku.ui.service.logger import DEPLOYMENT_LOG_LEVEL, worker_log
 
@@ -36,6 +39,59 @@ if SENTRY_ENABLED:
         integrations=[RqIntegration()],
     )
 
+# NOTE: Packages that jobs import, directly or lazily, and that are preloaded with all their submodules
+PRELOAD_PACKAGES = ["renku.command", "renku.ui.service.controllers", "renku.ui.service.jobs"]
+PRELOAD_MODULES = ["networkx", "pyld", "rdflib"]
+
+
+class RenkuWorker(Worker):
+    """Worker that reports how long work horses take to start up and to execute a job.
+
+    The startup time is measured from forking the work horse until the job is performed and is stored in the job's
+    ``meta``. Both the startup and the execution time are logged.
+    """
+
+    _forked_at = None
+
+    def fork_work_horse(self, job, queue):
+        """Spawn a work horse and record when it was forked."""
+        self._forked_at = time.monotonic()
+        super().fork_work_horse(job, queue)
+
+    def perform_job(self, job, queue):
+        """Perform a job and record its startup and execution times."""
+        started_at = time.monotonic()
+        job.meta["startup_time"] = started_at - self._forked_at if self._forked_at else 0.0
+        job.save_meta()
+
+        try:
+            return super().perform_job(job, queue)
+        finally:
+            # NOTE: The job may already be deleted, so the execution time is only logged; RQ stores its start and end
+            worker_log.info(
+                f"job {job.id} ({job.func_name}) startup: {job.meta['startup_time']:.3f}s, "
+                f"execution: {time.monotonic() - started_at:.3f}s"
+            )
+
+
+def preload_modules():
+    """Import modules used by jobs so that work horses forked from this process don't import them again."""
+    started_at = time.monotonic()
+
+    for name in PRELOAD_MODULES:
+        importlib.import_module(name)
+
+    for name in PRELOAD_PACKAGES:
+        package = importlib.import_module(name)
+        for module in pkgutil.walk_packages(package.__path__, prefix=f"{name}."):
+            try:
+                importlib.import_module(module.name)
+            except ImportError as e:
+                # NOTE: Modules that depend on optional packages which aren't installed can't be preloaded
+                worker_log.debug(f"cannot preload {module.name}: {e}")
+
+    worker_log.info(f"preloaded modules in {time.monotonic() - started_at:.2f}s")
+
 
 @contextmanager
 def worker(queue_list):
@@ -46,7 +102,7 @@ def worker(queue_list):
         # NOTE: logging configuration has been moved to `.work(logging_level=)`
         worker_log.info(f"worker log level set to {DEPLOYMENT_LOG_LEVEL}")
 
-        rq_worker = Worker(queue_list, connection=WorkerQueues.connection, log_job_description=False)
+        rq_worker = RenkuWorker(queue_list, connection=WorkerQueues.connection, log_job_description=False)
         worker_log.info("worker created")
 
         return rq_worker
@@ -69,6 +125,9 @@ def start_worker(queue_list):
 
     worker_log.info(f"working on queues: {q}")
 
+    if WORKER_PRELOAD:
+        preload_modules()
+
     with worker(q) as rq_worker:
         worker_log.info("running worker")
         rq_worker.work(logging_level=DEPLOYMENT_LOG_LEVEL)
@@ -2693,7 +2693,7 @@ def test_dataset_update_web_file(runner, project, mocker):
     mocker.patch("renku.core.util.requests.get_redirect_url", lambda _: uri)
     mocker.patch(
         "renku.core.util.requests.download_file",
-        lambda base_directory, url, filename, extract: (cache, [Path(new_file)]),
+        lambda base_directory, url, filename, extract, **_: (cache, [Path(new_file)], {}),
     )
 
     result = runner.invoke(cli, ["dataset", "create", "local-data"])
@@ -2733,7 +2733,7 @@ def test_dataset_update_web_file(runner, project, mocker):
     assert dataset.files[0].entity.checksum == "1bc6411450b62581e5cea1174c15269c249dd4ea"
 
     # check deletion doesn't happen without --delete
-    def _fake_raise(base_directory, url, filename, extract):
+    def _fake_raise(base_directory, url, filename, extract, **_):
         raise errors.RequestError
 
     mocker.patch("renku.core.util.requests.download_file", _fake_raise)
@@ -2754,6 +2754,49 @@ def test_dataset_update_web_file(runner, project, mocker):
     assert 0 == len(dataset.files)
 
 
+def test_dataset_update_unmodified_web_file(runner, project, mocker):
+    """Test web files aren't downloaded when update if their recorded validators show that they didn't change."""
+    uri = "http://www.example.com/myfile.txt"
+
+    cache = project.path / ".renku" / "cache"
+    cache.mkdir(parents=True, exist_ok=True)
+    new_file = cache / "myfile.txt"
+    new_file.write_text("output")
+
+    mocker.patch("renku.core.util.requests.get_redirect_url", lambda _: uri)
+    download_file = mocker.patch(
+        "renku.core.util.requests.download_file", return_value=(cache, [Path(new_file)], {"etag": '"v1"'})
+    )
+
+    result = runner.invoke(cli, ["dataset", "add", "--create", "local-data", uri])
+    assert 0 == result.exit_code, format_result_exception(result)
+    remote_validators = json.loads((cache / "remote-validators.json").read_text())
+    assert {"etag": '"v1"'} == remote_validators["data/local-data/myfile.txt"]["validators"]
+
+    download_file.reset_mock()
+    is_modified = mocker.patch("renku.core.util.requests.is_modified", return_value=False)
+
+    result = runner.invoke(cli, ["dataset", "update", "local-data"])
+
+    assert 0 == result.exit_code, format_result_exception(result)
+    is_modified.assert_called_once_with(uri, {"etag": '"v1"'})
+    assert 0 == download_file.call_count
+
+    # NOTE: Modified files are downloaded and their validators are recorded again
+    is_modified.return_value = True
+    new_file.write_text("output2")
+    download_file.return_value = (cache, [Path(new_file)], {"etag": '"v2"'})
+
+    result = runner.invoke(cli, ["dataset", "update", "local-data"])
+
+    assert 0 == result.exit_code, format_result_exception(result)
+    assert 1 == download_file.call_count
+    dataset = get_dataset_with_injection("local-data")
+    assert dataset.files[0].entity.checksum == "1bc6411450b62581e5cea1174c15269c249dd4ea"
+    remote_validators = json.loads((cache / "remote-validators.json").read_text())
+    assert {"etag": '"v2"'} == remote_validators["data/local-data/myfile.txt"]["validators"]
+
+
 @pytest.mark.parametrize(
     "storage", ["s3://s3.endpoint/bucket/path", "azure://renkupythontest1/test-private-1", "/local/file/storage"]
 )
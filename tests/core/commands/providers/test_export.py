@@ -0,0 +1,86 @@
+#
+# Copyright 2020-2023 Swiss Data Science Center (SDSC)
+# A partnership between École Polytechnique Fédérale de Lausanne (EPFL) and
+# Eidgenössische Technische Hochschule Zürich (ETHZ).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Dataset export unit tests."""
+
+from types import SimpleNamespace
+
+from renku.core.dataset.providers.export import ExportJournal, upload_files
+from renku.domain_model.dataset import Dataset
+from renku.domain_model.project_context import project_context
+from renku.infrastructure.repository import Repository
+
+
+def _get_file(path, checksum):
+    return SimpleNamespace(entity=SimpleNamespace(path=path, checksum=checksum))
+
+
+def test_export_journal(tmp_path):
+    """Test an export journal records uploaded files and survives interruptions."""
+    dataset = Dataset(name="my-dataset")
+    file = _get_file("data/my-dataset/a", "1234")
+
+    with project_context.with_path(tmp_path):
+        journal = ExportJournal(provider="zenodo", dataset=dataset, destination="https://zenodo.org")
+
+        assert journal.deposition is None
+
+        journal.start(42)
+        journal.add(file)
+        # NOTE: Simulate an export that was killed while recording a file
+        with open(journal.path, "a") as f:
+            f.write('{"path": "data/my-dataset/b", "che')
+
+        resumed = ExportJournal(provider="zenodo", dataset=dataset, destination="https://zenodo.org")
+
+        assert "42" == resumed.deposition
+        assert resumed.is_uploaded(file)
+        assert not resumed.is_uploaded(_get_file("data/my-dataset/a", "5678"))
+        assert not resumed.is_uploaded(_get_file("data/my-dataset/b", "1234"))
+        assert ExportJournal(provider="dataverse", dataset=dataset, destination="https://zenodo.org").deposition is None
+
+        resumed.remove()
+
+        assert not journal.path.exists()
+
+
+def test_upload_files_skips_uploaded_files(tmp_path):
+    """Test uploading files continues from where an interrupted export stopped."""
+    repository = Repository.initialize(tmp_path)
+    with repository.get_configuration(writable=True) as config:
+        config.set_value("user", "name", "Renku Bot")
+        config.set_value("user", "email", "renku@datascience.ch")
+    for name in ("a", "b"):
+        (tmp_path / name).write_text(f"content of {name}")
+    repository.add(all=True)
+    repository.commit("add files")
+    checksums = repository.get_object_hashes(["a", "b"])
+    files = [_get_file(name, checksums[name]) for name in ("a", "b")]
+    uploaded = {}
+
+    def upload(path, file):
+        with open(path) as f:
+            uploaded[file.entity.path] = f.read()
+
+    with project_context.with_path(tmp_path):
+        journal = ExportJournal(provider="zenodo", dataset=Dataset(name="my-dataset"), destination="")
+        journal.start(42)
+        journal.add(files[0])
+
+        upload_files(files=files, journal=journal, upload=upload)
+
+        assert {"b": "content of b"} == uploaded
+        assert journal.is_uploaded(files[1])
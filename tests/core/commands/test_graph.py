@@ -16,6 +16,7 @@
 # limitations under the License.
 """Graph building tests."""
 
+import io
 from datetime import datetime
 from unittest.mock import MagicMock
 
@@ -599,3 +600,19 @@ def test_graph_view_model():
     result = model.as_rdflib_graph()
     assert isinstance(result, Graph)
     assert len(result.all_nodes()) == 12
+
+    output = io.BytesIO()
+    model.write_jsonld(output)
+    assert model.as_jsonld_string(indentation=None) == output.getvalue().decode("utf-8")
+
+    output = io.BytesIO()
+    model.write_dot(output)
+    assert model.as_dot_string() == output.getvalue().decode("utf-8")
+
+    output = io.BytesIO()
+    model.write_nt(output)
+    assert len(model.as_nt_string()) == len(output.getvalue().decode("utf-8"))
+
+    output = io.BytesIO()
+    model.write_rdf(output)
+    assert output.getvalue().decode("utf-8").startswith("<?xml")
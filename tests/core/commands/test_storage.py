@@ -82,6 +82,30 @@ def test_lfs_storage_clean(runner, project, project_with_remote):
     assert 0 == result.exit_code, format_result_exception(result)
 
 
+def test_lfs_storage_clean_target_size(runner, project_with_remote):
+    """Test ``renku storage clean --free`` only cleans least recently accessed files until enough space is freed."""
+    for name in ("old", "new"):
+        path = project_context.path / name
+        path.write_text(name * 1000)
+        subprocess.call(["git", "lfs", "track", name])
+
+    project_with_remote.repository.add("*")
+    project_with_remote.repository.commit("Tracked in lfs")
+    project_with_remote.repository.push("origin", no_verify=True)
+
+    for name, access_time in (("old", 1000), ("new", 2000)):
+        path = project_context.path / name
+        os.utime(path, (access_time, path.stat().st_mtime))
+
+    result = runner.invoke(cli, ["storage", "clean", "--free", "1kb", "old", "new"], catch_exceptions=False)
+
+    assert 0 == result.exit_code, format_result_exception(result)
+    assert "Reclaimed" in result.output
+    assert "version https://git-lfs.github.com/spec/v1" in (project_context.path / "old").read_text()
+    assert "new" * 1000 == (project_context.path / "new").read_text()
+    assert not project_with_remote.repository.is_dirty(untracked_files=False)
+
+
 def test_lfs_storage_unpushed_clean(runner, project_with_remote):
     """Test ``renku storage clean`` command for unpushed files."""
     with (project_context.path / "tracked").open("w") as fp:
@@ -16,11 +16,12 @@
 # limitations under the License.
 """Storage tests."""
 
+import hashlib
 import re
 
 import pytest
 
-from renku.core.storage import get_lfs_migrate_filters, track_paths_in_storage
+from renku.core.storage import get_lfs_migrate_filters, get_lfs_pointer, track_paths_in_storage
 from renku.domain_model.project_context import project_context
 
 
@@ -52,3 +53,15 @@ def test_renku_in_lfs_migrate_exclude_filter(project):
 
     assert ",.renku," in excludes[1]
     assert ",.renku/**," in excludes[1]
+
+
+def test_get_lfs_pointer(tmp_path):
+    """Test LFS object id and size are calculated in-process."""
+    content = b"some content" * 1000
+    path = tmp_path / "file"
+    path.write_bytes(content)
+
+    oid, size = get_lfs_pointer(path)
+
+    assert hashlib.sha256(content).hexdigest() == oid
+    assert len(content) == size
@@ -0,0 +1,82 @@
+#
+# Copyright 2017-2023 - Swiss Data Science Center (SDSC)
+# A partnership between École Polytechnique Fédérale de Lausanne (EPFL) and
+# Eidgenössische Technische Hochschule Zürich (ETHZ).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""RClone storage tests."""
+
+from pathlib import Path
+
+import pytest
+
+from renku.infrastructure.storage.rclone import RCloneStorage, get_common_destination, group_by_common_root
+
+
+def test_group_by_common_root():
+    """Test grouping URIs by their common directory."""
+    uris = [
+        "s3://bucket/data/a.csv",
+        "s3://bucket/data/sub/b.csv",
+        "s3://other-bucket/c.csv",
+        "s3://bucket/data/d.csv",
+    ]
+
+    groups = group_by_common_root(uris)
+
+    assert {
+        "s3://bucket/data": [(0, "a.csv"), (1, "sub/b.csv"), (3, "d.csv")],
+        "s3://other-bucket": [(2, "c.csv")],
+    } == groups
+
+
+@pytest.mark.parametrize(
+    "destinations, directory",
+    [
+        (["/project/data/a.csv", "/project/data/sub/b.csv"], Path("/project/data")),
+        (["/project/data/a.csv", "/elsewhere/sub/b.csv"], None),
+        (["/project/data/x.csv", "/project/data/sub/b.csv"], None),
+    ],
+)
+def test_get_common_destination(destinations, directory):
+    """Test finding a directory that has the same layout as the storage."""
+    assert directory == get_common_destination(
+        paths=["a.csv", "sub/b.csv"], destinations=[Path(d) for d in destinations]
+    )
+
+
+def test_upload_many(tmp_path, mocker):
+    """Test uploading many files runs a single RClone command."""
+    sources = []
+    for name in ("a.csv", "b.csv"):
+        source = tmp_path / "sources" / name
+        source.parent.mkdir(exist_ok=True)
+        source.write_text(name)
+        sources.append(source)
+
+    commands = []
+
+    def run_rclone_command(command, *args, env=None, **kwargs):
+        staging, root = args
+        uploaded = Path(kwargs["files_from_raw"]).read_text().splitlines()
+        commands.append((command, root, {p: (Path(staging) / p).read_text() for p in uploaded}, kwargs["copy_links"]))
+        return ""
+
+    mocker.patch("renku.infrastructure.storage.rclone.run_rclone_command", run_rclone_command)
+    provider = mocker.MagicMock()
+    provider.convert_to_storage_uri.side_effect = lambda uri: uri
+    storage = RCloneStorage(storage_scheme="s3", provider=provider, credentials={}, provider_configuration={})
+
+    storage.upload_many([(sources[0], "s3://bucket/data/a.csv"), (sources[1], "s3://bucket/data/sub/b.csv")])
+
+    assert [("copy", "s3://bucket/data", {"a.csv": "a.csv", "sub/b.csv": "b.csv"}, True)] == commands
@@ -15,6 +15,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Test Repository."""
+import hashlib
 from pathlib import Path
 
 import pytest
@@ -314,6 +315,67 @@ def test_get_content_from_lfs(tmp_path):
     assert "Updated on 01.06.2022" in output_path.read_text()
 
 
+def test_copy_contents_to_files(tmp_path):
+    """Test copying content of multiple objects in a batch."""
+    repository = Repository.initialize(tmp_path / "repository")
+    with repository.get_configuration(writable=True) as config:
+        config.set_value("user", "name", "Renku Bot")
+        config.set_value("user", "email", "renku@datascience.ch")
+
+    small, large, pointer = repository.path / "small", repository.path / "large", repository.path / "pointer"
+    small.write_text("small")
+    large.write_bytes(b"large" * 1000)
+    lfs_content = b"LFS content"
+    oid = hashlib.sha256(lfs_content).hexdigest()
+    pointer.write_text(f"version https://git-lfs.github.com/spec/v1\noid sha256:{oid}\nsize {len(lfs_content)}\n")
+    # NOTE: Store the LFS object locally so that it isn't fetched from a remote
+    object_path = repository.lfs.get_object_path(oid)
+    object_path.parent.mkdir(parents=True)
+    object_path.write_bytes(lfs_content)
+    repository.add(all=True)
+    repository.commit("Add files")
+
+    paths = [small, large, "pointer", small]
+    checksums = [repository.get_object_hash(path=p, revision="HEAD") for p in paths]
+    output_paths = [tmp_path / str(i) for i in range(len(paths))]
+
+    repository.copy_contents_to_files(paths=paths, checksums=checksums, output_paths=output_paths)
+
+    assert b"small" == output_paths[0].read_bytes()
+    assert b"large" * 1000 == output_paths[1].read_bytes()
+    assert lfs_content == output_paths[2].read_bytes()
+    assert b"small" == output_paths[3].read_bytes()
+
+    with pytest.raises(errors.FileNotFound):
+        repository.copy_contents_to_files(
+            paths=["non-existing", small], checksums=["0" * 40, checksums[0]], output_paths=output_paths[:2]
+        )
+
+
+def test_get_raw_contents(tmp_path):
+    """Test reading raw content of multiple files including missing ones whose paths contain spaces."""
+    repository = Repository.initialize(tmp_path / "repository")
+    with repository.get_configuration(writable=True) as config:
+        config.set_value("user", "name", "Renku Bot")
+        config.set_value("user", "email", "renku@datascience.ch")
+
+    (repository.path / "a b").write_text("content")
+    (repository.path / "directory").mkdir()
+    (repository.path / "directory" / "file").write_text("file")
+    repository.add(all=True)
+    repository.commit("Add files")
+
+    contents = repository.get_raw_contents(paths=["missing c", "a b", "directory", "x y z", "directory/file"])
+
+    assert {
+        "missing c": None,
+        "a b": b"content",
+        "directory": None,
+        "x y z": None,
+        "directory/file": b"file",
+    } == contents
+
+
 @pytest.mark.parametrize(
     "paths, ignored",
     (
@@ -16,15 +16,18 @@
 # limitations under the License.
 """Dataset core tests."""
 
+import os
 from pathlib import Path
 
 import pytest
 
 from renku.core import errors
 from renku.core.config import get_value
-from renku.core.dataset.dataset_add import get_dataset_file_path_within_dataset
+from renku.core.dataset.dataset_add import get_dataset_file_path_within_dataset, upload_files_to_storage
+from renku.core.dataset.providers.models import DatasetAddAction, DatasetAddMetadata
 from renku.core.dataset.providers.s3 import S3Credentials, S3Provider, parse_s3_uri
-from renku.domain_model.dataset import Dataset
+from renku.domain_model.dataset import Dataset, DatasetFile
+from renku.domain_model.entity import Entity
 from renku.domain_model.enums import ConfigFilter
 
 
@@ -100,3 +103,145 @@ def test_get_within_dataset_path(entity_path, within_dataset_path):
     path = get_dataset_file_path_within_dataset(dataset=dataset, entity_path=entity_path)
 
     assert within_dataset_path == str(path)
+
+
+def _create_dataset_file(path: str, checksum: str = "0" * 40) -> DatasetFile:
+    return DatasetFile(entity=Entity(checksum=checksum, path=path))
+
+
+def test_dataset_files_index():
+    """Test finding, updating and removing dataset files keeps the files index consistent."""
+    dataset = Dataset(name="my-data")
+    dataset.add_or_update_files([_create_dataset_file("data/my-data/a"), _create_dataset_file("data/my-data/b")])
+
+    assert "data/my-data/a" == dataset.find_file("data/my-data/a").entity.path
+
+    updated_file = _create_dataset_file("data/my-data/a", checksum="1" * 40)
+    dataset.add_or_update_files(updated_file)
+
+    assert updated_file is dataset.find_file(Path("data/my-data/a"))
+    assert 2 == len(dataset.dataset_files)
+
+    dataset.unlink_file("data/my-data/b")
+
+    assert dataset.find_file("data/my-data/b") is None
+    assert {"data/my-data/a"} == {f.entity.path for f in dataset.files}
+
+    # NOTE: Files that are removed without using the dataset's API are not found
+    updated_file.remove()
+
+    assert dataset.find_file("data/my-data/a") is None
+
+    # NOTE: Replacing the files list invalidates the index
+    dataset.dataset_files = [_create_dataset_file("data/my-data/c")]
+
+    assert dataset.find_file("data/my-data/c") is not None
+    assert dataset.find_file("data/my-data/b") is None
+
+
+def test_add_files_to_large_dataset_is_linear(mocker):
+    """Test adding files to a large dataset checks each file a constant number of times."""
+    n_files = 1000
+    dataset = Dataset(name="my-data")
+    dataset.add_or_update_files([_create_dataset_file(f"data/my-data/existing-{i}") for i in range(n_files)])
+    new_files = [_create_dataset_file(f"data/my-data/new-{i}") for i in range(n_files)]
+    # NOTE: Half of the new files replace existing files with a different content
+    new_files += [_create_dataset_file(f"data/my-data/existing-{i}", "1" * 40) for i in range(0, n_files, 2)]
+    # NOTE: Force rebuilding the index so that its cost is counted as well
+    dataset._v_files_index = None
+    is_removed = mocker.spy(DatasetFile, "is_removed")
+
+    dataset.add_or_update_files(new_files)
+
+    assert 2 * n_files == len(dataset.files)
+    assert "1" * 40 == dataset.find_file("data/my-data/existing-0").entity.checksum
+    # NOTE: A linear scan of the dataset per added file checks ~n_files * len(new_files) files
+    assert is_removed.call_count <= 2 * (n_files + len(new_files))
+
+
+def test_filter_dataset_files_pagination(mocker):
+    """Test filtering dataset files with include/exclude patterns, limit, offset and cursor."""
+    from renku.core.dataset.dataset import filter_dataset_files, get_dataset_file_cursor
+
+    datasets = []
+    for name in ("data-1", "data-2"):
+        dataset = Dataset(name=name)
+        dataset.add_or_update_files([_create_dataset_file(f"data/{name}/{i}.csv") for i in range(5)])
+        dataset.add_or_update_files(_create_dataset_file(f"data/{name}/README.md"))
+        datasets.append(dataset)
+    dataset_gateway = mocker.MagicMock()
+    dataset_gateway.get_all_active_datasets.return_value = datasets
+
+    def get_paths(**kwargs):
+        records = filter_dataset_files(dataset_gateway=dataset_gateway, include=["*.csv"], exclude=["4.csv"], **kwargs)
+        return [r.entity.path for r in records], records
+
+    all_paths, _ = get_paths(immutable=True)
+
+    assert 8 == len(all_paths)
+    assert all_paths[2:5] == get_paths(immutable=True, limit=3, offset=2)[0]
+
+    first_page, records = get_paths(immutable=True, limit=3)
+    second_page, _ = get_paths(immutable=True, limit=3, cursor=get_dataset_file_cursor(records[-1]))
+
+    assert all_paths[:6] == first_page + second_page
+
+    with pytest.raises(errors.ParameterError):
+        get_paths(cursor="invalid")
+
+
+def test_filter_dataset_files_with_data_directory(mocker, tmp_path):
+    """Test new files in a dataset's data directory share the dataset's copy and are ordered by modification time."""
+    from renku.core.dataset.dataset import filter_dataset_files
+    from renku.domain_model.project_context import project_context
+
+    dataset = Dataset(name="my-data")
+    dataset.add_or_update_files(_create_dataset_file("data/my-data/existing"))
+    (tmp_path / "data" / "my-data").mkdir(parents=True)
+    (tmp_path / "data" / "my-data" / "existing").write_text("existing")
+    (tmp_path / "data" / "my-data" / "new").write_text("new")
+    dataset_gateway = mocker.MagicMock()
+    dataset_gateway.get_all_active_datasets.return_value = [dataset]
+    mocker.patch.object(DatasetFile, "from_path", side_effect=lambda path: _create_dataset_file(str(path)))
+
+    os.utime(tmp_path / "data" / "my-data" / "new", (1_600_000_000, 1_600_000_000))
+
+    with project_context.with_path(tmp_path):
+        records = filter_dataset_files(dataset_gateway=dataset_gateway, check_data_directory=True)
+        listed_again = filter_dataset_files(dataset_gateway=dataset_gateway, check_data_directory=True)
+
+    new, existing = records
+    assert "data/my-data/existing" == existing.entity.path
+    assert "data/my-data/new" == new.entity.path
+    assert existing.dataset._subject is new.dataset
+    assert dataset is not new.dataset
+    assert 1_600_000_000 == new.date_added.timestamp()
+    assert [r.date_added for r in records] == [r.date_added for r in listed_again]
+
+
+def test_upload_files_to_storage_failure_deletes_temporary_files(tmp_path, mocker):
+    """Test downloaded files are deleted and moved sources are kept if uploading to a dataset's storage fails."""
+    files = []
+    for action in (DatasetAddAction.DOWNLOAD, DatasetAddAction.MOVE):
+        source = tmp_path / action.name
+        source.write_text("data")
+        files.append(
+            DatasetAddMetadata(
+                entity_path=Path("data") / action.name,
+                url=str(source),
+                action=action,
+                source=source,
+                destination=source,
+                based_on=mocker.MagicMock(url=f"s3://bucket/{action.name}"),
+                upload_source=source,
+                delete_upload_source=True,
+            )
+        )
+    storage = mocker.MagicMock()
+    storage.upload_many.side_effect = errors.RCloneException("Upload failed")
+
+    with pytest.raises(errors.RCloneException):
+        upload_files_to_storage(files=files, storage=storage)
+
+    assert not files[0].upload_source.exists()
+    assert files[1].upload_source.exists()
@@ -0,0 +1,125 @@
+#
+# Copyright 2017-2023 - Swiss Data Science Center (SDSC)
+# A partnership between École Polytechnique Fédérale de Lausanne (EPFL) and
+# Eidgenössische Technische Hochschule Zürich (ETHZ).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test archive utilities."""
+
+import hashlib
+import io
+import tarfile
+import zipfile
+
+import pytest
+
+from renku.core import errors
+from renku.core.util.archive import extract_tar_stream, extract_zip, get_archive_type
+
+
+@pytest.mark.parametrize(
+    "filename, archive_type",
+    [("data.tar.gz", "tar"), ("DATA.TGZ", "tar"), ("data.tar.xz", "tar"), ("data.zip", "zip"), ("data.7z", None)],
+)
+def test_get_archive_type(filename, archive_type):
+    """Test detecting archive type from file name."""
+    assert archive_type == get_archive_type(filename)
+
+
+def test_extract_tar_stream(tmp_path):
+    """Test extracting a tar archive from a non-seekable stream."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:bz2") as archive:
+        info = tarfile.TarInfo("directory/file")
+        info.size = 4
+        info.mode = 0o755
+        archive.addfile(info, io.BytesIO(b"data"))
+        link = tarfile.TarInfo("link")
+        link.type = tarfile.SYMTYPE
+        link.linkname = "/etc/passwd"
+        archive.addfile(link)
+
+    class Stream:
+        def __init__(self, data):
+            self._data = io.BytesIO(data)
+
+        def read(self, size=-1):
+            return self._data.read(size)
+
+    hashes = extract_tar_stream(Stream(buffer.getvalue()), tmp_path)
+
+    path = tmp_path / "directory" / "file"
+    assert [path] == list(hashes)
+    assert b"data" == path.read_bytes()
+    assert hashlib.md5(b"data").hexdigest() == hashes[path].md5
+    assert path.stat().st_mode & 0o100
+    assert not (tmp_path / "link").exists()
+
+
+def test_extract_tar_stream_links(tmp_path):
+    """Test links to files in a tar archive are extracted as copies and other links are skipped."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+        # NOTE: Symbolic links can come before their target
+        for name, linkname in (("links/symlink", "../directory/file"), ("links/chained", "symlink")):
+            symlink = tarfile.TarInfo(name)
+            symlink.type = tarfile.SYMTYPE
+            symlink.linkname = linkname
+            archive.addfile(symlink)
+        info = tarfile.TarInfo("directory/file")
+        info.size = 4
+        archive.addfile(info, io.BytesIO(b"data"))
+        hardlink = tarfile.TarInfo("hardlink")
+        hardlink.type = tarfile.LNKTYPE
+        hardlink.linkname = "directory/file"
+        archive.addfile(hardlink)
+        outside = tarfile.TarInfo("outside")
+        outside.type = tarfile.LNKTYPE
+        outside.linkname = "../outside-file"
+        archive.addfile(outside)
+    (tmp_path / "outside-file").write_bytes(b"secret")
+    buffer.seek(0)
+
+    hashes = extract_tar_stream(buffer, tmp_path / "output")
+
+    root = tmp_path / "output"
+    links = {root / "hardlink", root / "links" / "symlink", root / "links" / "chained"}
+    assert links | {root / "directory" / "file"} == set(hashes)
+    for link in links:
+        assert not link.is_symlink()
+        assert b"data" == link.read_bytes()
+        assert hashes[root / "directory" / "file"] == hashes[link]
+    assert not (root / "outside").exists()
+
+
+def test_extract_zip(tmp_path):
+    """Test extracting a zip archive."""
+    with zipfile.ZipFile(tmp_path / "archive.zip", "w") as archive:
+        archive.writestr("directory/file", b"data")
+
+    hashes = extract_zip(tmp_path / "archive.zip", tmp_path / "output")
+
+    path = tmp_path / "output" / "directory" / "file"
+    assert [path] == list(hashes)
+    assert 4 == hashes[path].size
+
+
+def test_extract_prevents_path_traversal(tmp_path):
+    """Test archive members cannot be extracted outside of the destination."""
+    with zipfile.ZipFile(tmp_path / "archive.zip", "w") as archive:
+        archive.writestr("../outside", b"data")
+
+    with pytest.raises(errors.OperationError):
+        extract_zip(tmp_path / "archive.zip", tmp_path / "output")
+
+    assert not (tmp_path / "outside").exists()
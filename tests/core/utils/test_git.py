@@ -20,7 +20,8 @@ from typing import Optional
 
 import pytest
 
-from renku.core.util.git import get_remote, push_changes
+from renku.core.util.git import clone_repository, get_remote, push_changes
+from renku.infrastructure.repository import Repository
 from tests.fixtures.config import IT_PROTECTED_REMOTE_REPO_URL, IT_REMOTE_NON_RENKU_REPO_URL
 from tests.utils import retry_failed, write_and_commit_file
 
@@ -110,3 +111,90 @@ def test_push_to_diverged_branch(protected_git_repository, mocker):
     branch = protected_git_repository.branches[new_pushed_branch]
     assert commit_sha_after == branch.commit.hexsha
     assert f"origin/{branch.name}" == branch.remote_branch.name
+
+
+def test_partial_sparse_clone(tmp_path, mocker):
+    """Test cloning only metadata and checking out more directories on demand; the clone is reused if up-to-date."""
+    source = Repository.initialize(tmp_path / "source")
+    with source.get_configuration(writable=True) as config:
+        config.set_value("user", "name", "Renku Bot")
+        config.set_value("user", "email", "renku@datascience.ch")
+        config.set_value("uploadpack", "allowFilter", "true")
+    for path in (".renku/metadata/root", "README.md", "data/my-data/file", "data/other/file"):
+        (source.path / path).parent.mkdir(parents=True, exist_ok=True)
+        (source.path / path).write_text(path)
+    source.add(all=True)
+    source.commit("Add files")
+
+    def clone():
+        return clone_repository(
+            f"file://{source.path}",
+            path=tmp_path / "clone",
+            install_githooks=False,
+            install_lfs=False,
+            clean=True,
+            clone_filter="blob:none",
+            sparse_paths=[".renku"],
+        )
+
+    repository = clone()
+
+    assert repository.is_partial_clone
+    assert repository.is_sparse
+    assert (repository.path / ".renku" / "metadata" / "root").exists()
+    assert (repository.path / "README.md").exists()
+    assert not (repository.path / "data").exists()
+
+    repository.add_sparse_checkout_paths("data/my-data")
+
+    assert (repository.path / "data" / "my-data" / "file").exists()
+    assert not (repository.path / "data" / "other").exists()
+
+    checksum = source.get_object_hash(path="data/other/file", revision="HEAD")
+    repository.copy_contents_to_files(
+        paths=["data/other/file"], checksums=[checksum], output_paths=[tmp_path / "output"]
+    )
+
+    assert "data/other/file" == (tmp_path / "output").read_text()
+
+    fetch = mocker.spy(Repository, "fetch")
+    reused_repository = clone()
+
+    assert (reused_repository.path / "data" / "my-data" / "file").exists()
+    assert 0 == fetch.call_count
+
+
+def test_clone_with_reference(tmp_path):
+    """Test cloning while borrowing objects from a local mirror."""
+    source = Repository.initialize(tmp_path / "source")
+    with source.get_configuration(writable=True) as config:
+        config.set_value("user", "name", "Renku Bot")
+        config.set_value("user", "email", "renku@datascience.ch")
+    write_and_commit_file(source, "README.md", "content")
+
+    mirror = Repository.initialize(tmp_path / "mirror.git", bare=True)
+    mirror.run_git_command("fetch", f"file://{source.path}", "+refs/heads/*:refs/heads/*", quiet=True)
+
+    repository = clone_repository(
+        f"file://{source.path}",
+        path=tmp_path / "clone",
+        install_githooks=False,
+        install_lfs=False,
+        depth=1,
+        reference=mirror.path,
+    )
+
+    alternates = repository.path / ".git" / "objects" / "info" / "alternates"
+    assert str(mirror.path / "objects") == alternates.read_text().strip()
+    assert "content" == (repository.path / "README.md").read_text()
+
+    repository = clone_repository(
+        f"file://{source.path}",
+        path=tmp_path / "other-clone",
+        install_githooks=False,
+        install_lfs=False,
+        reference=tmp_path / "non-existing",
+    )
+
+    assert not (repository.path / ".git" / "objects" / "info" / "alternates").exists()
+    assert "content" == (repository.path / "README.md").read_text()
@@ -16,9 +16,15 @@
 # limitations under the License.
 """Test os utilities."""
 
+import hashlib
+import os
+import shutil
+import stat
+from pathlib import Path
+
 import pytest
 
-from renku.core.util.os import matches
+from renku.core.util.os import compile_path_patterns, copy_and_hash_file, copy_file_fast, hash_file_all, matches
 
 
 @pytest.mark.parametrize(
@@ -46,3 +52,100 @@ from renku.core.util.os import matches
 def test_path_match(path, pattern, should_match):
     """Test ``matches`` utility function that checks if a path matches a given pattern."""
     assert matches(path=path, pattern=pattern) is should_match
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        "*.csv",
+        "file*",
+        "data/*",
+        "a/*.csv",
+        "/abs/*.csv",
+        "*",
+        "data/a",
+        "[fF]ile?.csv",
+        "**/file1.csv",
+        "data/*/*.csv",
+    ],
+)
+@pytest.mark.parametrize(
+    "path", ["data/a/file1.csv", "data/a/b/file2.txt", "file3", "data/File1.csv", "/abs/x.csv", "data/a"]
+)
+def test_compile_path_patterns(path, pattern):
+    """Test compiled patterns match paths like ``Path.match``."""
+    assert Path(path).match(pattern) is compile_path_patterns([pattern])(path)
+
+
+def test_compile_multiple_path_patterns():
+    """Test compiled patterns match if any of the patterns matches."""
+    match = compile_path_patterns(["*.csv", "data/a"])
+
+    assert match("data/a/file1.csv")
+    assert match(Path("data/a"))
+    assert not match("data/b")
+
+
+def test_copy_file_fast(tmp_path):
+    """Test copying a file with the cheapest available method keeps its content and permissions."""
+    source = tmp_path / "source"
+    source.write_bytes(os.urandom(1024 * 1024))
+    source.chmod(0o750)
+    destination = tmp_path / "destination"
+    destination.write_text("will be overwritten")
+
+    method = copy_file_fast(source, destination)
+
+    assert method in ("reflink", "copy_file_range", "copy")
+    assert source.read_bytes() == destination.read_bytes()
+    assert 0o750 == stat.S_IMODE(destination.stat().st_mode)
+    assert not os.path.samefile(source, destination)
+
+
+def test_copy_file_fast_hardlink(tmp_path, monkeypatch):
+    """Test files are hardlinked if reflinks aren't supported and hardlinks are allowed."""
+    monkeypatch.setattr("renku.core.util.os._reflink", lambda source, destination: False)
+    source = tmp_path / "source"
+    source.write_text("content")
+    destination = tmp_path / "destination"
+    destination.write_text("will be replaced")
+
+    assert "hardlink" == copy_file_fast(source, destination, allow_hardlink=True)
+    assert os.path.samefile(source, destination)
+    assert "hardlink" == copy_file_fast(source, destination, allow_hardlink=True)
+    assert "content" == destination.read_text()
+    assert {"source", "destination"} == {p.name for p in tmp_path.iterdir()}
+
+
+@pytest.mark.parametrize("copy", [copy_file_fast, copy_and_hash_file])
+@pytest.mark.parametrize("hardlink", [False, True])
+def test_copy_to_same_file(tmp_path, copy, hardlink):
+    """Test copying a file onto itself or onto a hardlink of it fails without truncating it."""
+    source = tmp_path / "source"
+    source.write_text("content")
+    destination = source
+    if hardlink:
+        destination = tmp_path / "destination"
+        os.link(source, destination)
+
+    with pytest.raises(shutil.SameFileError):
+        copy(source, destination)
+
+    assert "content" == source.read_text()
+
+
+def test_copy_and_hash_file(tmp_path):
+    """Test hashes that are calculated while copying a file match hashes of the content."""
+    content = os.urandom(3 * 1024 * 1024 + 7)
+    source = tmp_path / "source"
+    source.write_bytes(content)
+    destination = tmp_path / "destination"
+
+    hashes = copy_and_hash_file(source, destination)
+
+    assert content == destination.read_bytes()
+    assert hashlib.sha1(f"blob {len(content)}\0".encode() + content).hexdigest() == hashes.git_sha1
+    assert hashlib.md5(content).hexdigest() == hashes.md5
+    assert hashlib.sha256(content).hexdigest() == hashes.sha256
+    assert len(content) == hashes.size
+    assert hashes == hash_file_all(destination)
@@ -0,0 +1,441 @@
+#
+# Copyright 2017-2023 - Swiss Data Science Center (SDSC)
+# A partnership between École Polytechnique Fédérale de Lausanne (EPFL) and
+# Eidgenössische Technische Hochschule Zürich (ETHZ).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test HTTP requests utilities."""
+
+import gzip
+import hashlib
+import http.server
+import io
+import os
+import tarfile
+import threading
+
+import portalocker
+import pytest
+import responses
+from urllib3.exceptions import ProtocolError
+
+from renku.core import errors
+from renku.core.util import requests
+
+CONTENT = os.urandom(3 * 1024 * 1024 + 17)
+ETAG = '"content-etag"'
+
+
+class _RangeRequestHandler(http.server.BaseHTTPRequestHandler):
+    """Serve ``content`` and support range requests."""
+
+    content = CONTENT
+    requests = []
+    # NOTE: Misbehaving servers send a range that starts elsewhere or encode the content
+    range_shift = 0
+    encode = False
+
+    def do_GET(self):  # noqa: N802
+        range_header = self.headers.get("Range")
+        self.requests.append(range_header)
+
+        start = 0
+        if range_header and self.headers.get("If-Range") == ETAG:
+            start = int(range_header.split("=", 1)[1].split("-", 1)[0])
+
+        if start >= len(self.content):
+            self.send_response(416)
+            self.send_header("Content-Range", f"bytes */{len(self.content)}")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        if start:
+            start -= self.range_shift
+        body = gzip.compress(self.content[start:]) if self.encode else self.content[start:]
+
+        self.send_response(206 if start else 200)
+        self.send_header("ETag", ETAG)
+        self.send_header("Content-Length", str(len(body)))
+        if self.encode:
+            self.send_header("Content-Encoding", "gzip")
+        if start:
+            self.send_header("Content-Range", f"bytes {start}-{len(self.content) - 1}/{len(self.content)}")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_):
+        pass
+
+
+@pytest.fixture
+def range_server():
+    """A local HTTP server that supports range requests."""
+    _RangeRequestHandler.content = CONTENT
+    _RangeRequestHandler.requests = []
+    _RangeRequestHandler.range_shift = 0
+    _RangeRequestHandler.encode = False
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _RangeRequestHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/data.bin", _RangeRequestHandler.requests
+    finally:
+        server.shutdown()
+        server.server_close()
+        requests.close_sessions()
+
+
+def test_sessions_are_pooled_per_host():
+    """Test requests to the same host reuse a session and different hosts get different sessions."""
+    try:
+        session = requests.get_session("https://example.com/some/path")
+
+        assert session is requests.get_session("https://EXAMPLE.com/other/path")
+        assert session is not requests.get_session("https://example.org/some/path")
+        assert session is not requests.get_session("http://example.com/some/path")
+
+        adapter = session.get_adapter("https://example.com")
+        assert requests._RENKU_REQUESTS_MAX_RETRIES == adapter.max_retries.total
+    finally:
+        requests.close_sessions()
+
+
+@responses.activate
+def test_requests_use_pooled_session(mocker):
+    """Test requests are sent through the pooled session."""
+    responses.add(responses.GET, "https://example.com/data", body="data")
+    responses.add(responses.HEAD, "https://example.com/data")
+
+    try:
+        session = requests.get_session("https://example.com")
+        get = mocker.spy(session, "get")
+        head = mocker.spy(session, "head")
+
+        assert "data" == requests.get("https://example.com/data").text
+        assert 200 == requests.head("https://example.com/data").status_code
+        assert 1 == get.call_count
+        assert 1 == head.call_count
+    finally:
+        requests.close_sessions()
+
+
+@responses.activate
+def test_pooled_sessions_do_not_store_cookies():
+    """Test cookies set by a response are not sent with later requests that share the session."""
+    responses.add(responses.GET, "https://example.com/login", headers={"Set-Cookie": "session-id=secret; Path=/"})
+    responses.add(responses.GET, "https://example.com/data", body="data")
+
+    try:
+        requests.get("https://example.com/login")
+        requests.get("https://example.com/data")
+
+        assert "session-id" in responses.calls[0].response.headers["Set-Cookie"]
+        assert "Cookie" not in responses.calls[1].request.headers
+        assert 0 == len(requests.get_session("https://example.com").cookies)
+    finally:
+        requests.close_sessions()
+
+
+@responses.activate
+def test_pooled_sessions_send_cookies_along_redirects():
+    """Test cookies set while following redirects are sent with the redirected request only."""
+    responses.add(
+        responses.GET,
+        "https://example.com/download",
+        status=302,
+        headers={"Set-Cookie": "confirm=yes; Path=/", "Location": "https://example.com/file"},
+    )
+    responses.add(responses.GET, "https://example.com/file", body="data")
+
+    try:
+        assert "data" == requests.get("https://example.com/download").text
+        requests.get("https://example.com/file")
+
+        assert "confirm=yes" == responses.calls[1].request.headers["Cookie"]
+        assert "Cookie" not in responses.calls[2].request.headers
+    finally:
+        requests.close_sessions()
+
+
+def test_download_file_resumes_partial_download(range_server, tmp_path):
+    """Test a partially-downloaded file is resumed using a range request."""
+    url, received_ranges = range_server
+    partial_path = tmp_path / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.part"
+    partial_path.write_bytes(CONTENT[:1000])
+    partial_path.with_suffix(".validator").write_text(ETAG)
+
+    checksum = f"sha256:{hashlib.sha256(CONTENT).hexdigest()}"
+    _, paths, validators = requests.download_file(tmp_path, url, filename=None, extract=False, checksum=checksum)
+
+    assert ["bytes=1000-"] == received_ranges
+    assert {"etag": ETAG, "content-length": str(len(CONTENT))} == validators
+    assert "data.bin" == paths[0].name
+    assert CONTENT == paths[0].read_bytes()
+    assert not partial_path.exists()
+    assert not partial_path.with_suffix(".validator").exists()
+    assert [] == list(tmp_path.glob("*.lock"))
+
+
+@pytest.mark.parametrize("range_shift, encode", [(10, False), (0, True)], ids=["wrong-start", "encoded"])
+def test_download_file_restarts_if_range_cannot_be_appended(range_server, tmp_path, range_shift, encode):
+    """Test a download is restarted if a partial response doesn't continue the partially-downloaded file."""
+    url, received_ranges = range_server
+    _RangeRequestHandler.range_shift = range_shift
+    _RangeRequestHandler.encode = encode
+    partial_path = tmp_path / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.part"
+    partial_path.write_bytes(CONTENT[:1000])
+    partial_path.with_suffix(".validator").write_text(ETAG)
+
+    checksum = f"sha256:{hashlib.sha256(CONTENT).hexdigest()}"
+    _, paths, _ = requests.download_file(tmp_path, url, filename=None, extract=False, checksum=checksum)
+
+    assert ["bytes=1000-", None] == received_ranges
+    assert CONTENT == paths[0].read_bytes()
+
+
+def test_download_file_doesnt_resume_encoded_content(mocker, tmp_path):
+    """Test partial downloads of encoded content aren't resumed since the saved content was decoded."""
+    url = "https://example.com/data.bin"
+    partial_path = tmp_path / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.part"
+    content = io.BytesIO(gzip.compress(CONTENT))
+
+    def read(size, decode_content):
+        if content.tell() > 1000:
+            raise ProtocolError("Connection dropped")
+        return content.read(size)
+
+    response = mocker.MagicMock(status_code=200, headers={"etag": ETAG, "content-encoding": "gzip"})
+    response.raw.read = read
+    response.__enter__.return_value = response
+    session = mocker.patch("renku.core.util.requests.get_session")
+    session.return_value.get.return_value = response
+
+    with pytest.raises(errors.RequestError):
+        requests.download_file(tmp_path, url, filename="data.bin", extract=False)
+
+    assert not partial_path.with_suffix(".validator").exists()
+    assert all("Range" not in c.kwargs["headers"] for c in session.return_value.get.call_args_list)
+
+
+def test_download_file_checksum_mismatch(range_server, tmp_path):
+    """Test a download fails if its checksum doesn't match."""
+    url, _ = range_server
+
+    with pytest.raises(errors.RequestError, match="Checksum mismatch"):
+        requests.download_file(tmp_path, url, filename="data.bin", extract=False, checksum="md5:0123456789abcdef")
+
+    assert [] == list(tmp_path.glob("*.part"))
+
+
+@pytest.mark.parametrize("partial_content", [CONTENT, CONTENT + b"stale data"], ids=["complete", "too-large"])
+def test_download_file_unsatisfiable_range(range_server, tmp_path, partial_content):
+    """Test a complete partial download is used and a partial download larger than the file is restarted."""
+    url, received_ranges = range_server
+    partial_path = tmp_path / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.part"
+    partial_path.write_bytes(partial_content)
+    partial_path.with_suffix(".validator").write_text(ETAG)
+
+    checksum = f"sha256:{hashlib.sha256(CONTENT).hexdigest()}"
+    _, paths, _ = requests.download_file(tmp_path, url, filename=None, extract=False, checksum=checksum)
+
+    assert CONTENT == paths[0].read_bytes()
+    expected_ranges = [f"bytes={len(partial_content)}-"] + ([] if partial_content == CONTENT else [None])
+    assert expected_ranges == received_ranges
+
+
+def test_download_file_while_another_download_is_running(range_server, tmp_path):
+    """Test concurrent downloads of the same URL don't write to the same partial file."""
+    url, received_ranges = range_server
+    name = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    partial_path = tmp_path / f"{name}.part"
+    partial_path.write_bytes(b"partial data of the other download")
+
+    with portalocker.Lock(tmp_path / f"{name}.lock", flags=portalocker.LOCK_EX | portalocker.LOCK_NB):
+        _, paths, _ = requests.download_file(tmp_path, url, filename=None, extract=False)
+
+    assert CONTENT == paths[0].read_bytes()
+    assert [None] == received_ranges
+    assert b"partial data of the other download" == partial_path.read_bytes()
+    assert [partial_path] == list(tmp_path.glob("*.part"))
+
+
+def test_iterate_content_adapts_chunk_size(mocker):
+    """Test chunks grow while data arrives fast and keep their size if a chunk size is passed."""
+
+    def get_response():
+        content = io.BytesIO(CONTENT)
+        return mocker.Mock(raw=mocker.Mock(read=lambda size, decode_content: content.read(size)))
+
+    fixed_chunks = list(requests._iterate_content(get_response(), chunk_size=16 * 1024))
+    adaptive_chunks = list(requests._iterate_content(get_response(), chunk_size=None))
+
+    assert CONTENT == b"".join(fixed_chunks) == b"".join(adaptive_chunks)
+    assert {16 * 1024} == {len(c) for c in fixed_chunks[:-1]}
+    assert requests._MIN_CHUNK_SIZE == len(adaptive_chunks[0])
+    assert all(len(a) < len(b) for a, b in zip(adaptive_chunks[:-2], adaptive_chunks[1:-1]))
+    assert len(adaptive_chunks) < len(fixed_chunks) / 10
+
+
+@pytest.mark.parametrize("checksum", [None, "sha256"])
+def test_download_and_extract_streams_tar_archives(range_server, tmp_path, mocker, checksum):
+    """Test tar archives are extracted while downloading without storing the archive."""
+    url, received_ranges = range_server
+    url = url.replace("data.bin", "data.tar.gz")
+
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+        for name, content in (("data.bin", CONTENT), ("directory/file", b"some content")):
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            archive.addfile(info, io.BytesIO(content))
+    _RangeRequestHandler.content = buffer.getvalue()
+
+    if checksum:
+        checksum = f"sha256:{hashlib.sha256(_RangeRequestHandler.content).hexdigest()}"
+    download_with_resume = mocker.spy(requests, "_download_with_resume")
+
+    root, hashes, validators = requests.download_and_extract(tmp_path, url, checksum=checksum)
+
+    assert 0 == download_with_resume.call_count
+    assert {"etag": ETAG, "content-length": str(len(_RangeRequestHandler.content))} == validators
+    assert [None] == received_ranges
+    assert {root / "data.bin", root / "directory" / "file"} == set(hashes)
+    assert CONTENT == (root / "data.bin").read_bytes()
+    assert hashlib.sha256(b"some content").hexdigest() == hashes[root / "directory" / "file"].sha256
+    assert [] == list(tmp_path.glob("**/*.tar.gz"))
+
+
+def test_download_and_extract_tar_checksum_mismatch(range_server, tmp_path):
+    """Test streamed extraction fails and cleans up if the archive's checksum doesn't match."""
+    url, _ = range_server
+
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+        info = tarfile.TarInfo("file")
+        info.size = 4
+        archive.addfile(info, io.BytesIO(b"data"))
+    _RangeRequestHandler.content = buffer.getvalue()
+
+    with pytest.raises(errors.RequestError, match="Checksum mismatch"):
+        requests.download_and_extract(tmp_path, url.replace("data.bin", "data.tgz"), checksum="md5:0123")
+
+    assert [] == [p for p in tmp_path.rglob("*") if p.is_file()]
+
+
+def test_download_and_extract_non_archive(range_server, tmp_path):
+    """Test files that aren't archives are returned as they are."""
+    url, _ = range_server
+
+    root, hashes, _ = requests.download_and_extract(tmp_path, url.replace("data.bin", "data.tar"))
+
+    assert [root / "data.tar"] == list(hashes)
+    assert CONTENT == (root / "data.tar").read_bytes()
+
+
+@responses.activate
+@pytest.mark.parametrize(
+    "status, headers, modified",
+    [
+        (304, {}, False),
+        (200, {"ETag": '"v1"', "Content-Length": "42"}, False),
+        (200, {"ETag": '"v2"', "Content-Length": "42"}, True),
+        (200, {"Content-Length": "43"}, True),
+        (200, {"Content-Length": "42"}, None),
+        (404, {}, None),
+    ],
+)
+def test_is_modified(status, headers, modified):
+    """Test checking if a remote file changed using its recorded validators."""
+    responses.add(
+        responses.HEAD,
+        "https://example.com/data",
+        status=status,
+        headers=headers,
+        match=[responses.matchers.header_matcher({"If-None-Match": '"v1"'})],
+    )
+
+    try:
+        assert modified == requests.is_modified("https://example.com/data", {"etag": '"v1"', "content-length": "42"})
+    finally:
+        requests.close_sessions()
+
+
+def test_multipart_file_stream(tmp_path):
+    """Test streaming a multipart body from a file."""
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"0123456789" * 1000)
+
+    with requests.MultipartFileStream(path, filename='my "file".bin', fields={"jsonData": "{}"}) as body:
+        content = b""
+        while True:
+            chunk = body.read(4096)
+            if not chunk:
+                break
+            content += chunk
+
+        assert len(body) == len(content) == body.tell()
+
+        body.seek(0)
+
+        assert content == body.read()
+
+    boundary = body.content_type.split("boundary=")[1]
+    assert content.startswith(
+        f'--{boundary}\r\nContent-Disposition: form-data; name="jsonData"\r\n\r\n{{}}\r\n'.encode()
+    )
+    assert b'filename="my %22file%22.bin"' in content
+    assert content.endswith(b"0123456789" * 1000 + f"\r\n--{boundary}--\r\n".encode())
+
+
+@responses.activate
+def test_get_cached(tmp_path, monkeypatch):
+    """Test metadata responses are cached on disk and revalidated once they are stale."""
+    monkeypatch.setenv("RENKU_METADATA_CACHE_DIR", str(tmp_path))
+    url = "https://example.com/records/42"
+    responses.add(responses.GET, url, json={"id": 42}, headers={"ETag": '"v1"'})
+
+    try:
+        assert {"id": 42} == requests.get_cached(url).json()
+        assert {"id": 42} == requests.get_cached(url).json()
+        assert 1 == len(responses.calls)
+
+        # NOTE: Requests with different headers (e.g. credentials) don't share cached responses
+        requests.get_cached(url, headers={"Authorization": "Bearer token"})
+        assert 2 == len(responses.calls)
+
+        responses.replace(responses.GET, url, status=304)
+        response = requests.get_cached(url, ttl=0)
+    finally:
+        requests.close_sessions()
+
+    assert {"id": 42} == response.json()
+    assert '"v1"' == responses.calls[-1].request.headers["If-None-Match"]
+
+
+@responses.activate
+def test_get_cached_no_store(tmp_path, monkeypatch):
+    """Test responses that must not be stored aren't cached."""
+    monkeypatch.setenv("RENKU_METADATA_CACHE_DIR", str(tmp_path))
+    url = "https://example.com/records/42"
+    responses.add(responses.GET, url, json={"id": 42}, headers={"Cache-Control": "no-store"})
+
+    try:
+        requests.get_cached(url)
+        requests.get_cached(url)
+    finally:
+        requests.close_sessions()
+
+    assert 2 == len(responses.calls)
+    assert not list(tmp_path.rglob("*.json"))
@@ -17,10 +17,13 @@
 """Test various utilities."""
 
 import os
+import threading
 
 from renku.core.errors import ParameterError
 from renku.core.util.git import shorten_message
 from renku.core.util.urls import get_host
+from renku.core.util.util import MAX_TASKS_PER_HOST, ExecutionMetrics, ResourceClass, parallel_execute
+from renku.domain_model.project_context import project_context
 from tests.utils import raises
 
 
@@ -84,3 +87,62 @@ def test_shorten_message():
         shorten_message(short_message, -1)
     with raises(ParameterError):
         shorten_message(short_message, max_line, -1)
+
+
+def test_parallel_execute_metrics(tmp_path):
+    """Test parallel execution returns all results and collects timing metrics."""
+    metrics = ExecutionMetrics()
+
+    with project_context.with_path(tmp_path):
+        result = parallel_execute(
+            lambda url, value: [value * 2],
+            ["https://a.org/1", "https://b.org/2", "https://a.org/3"],
+            [1, 2, 3],
+            resource=ResourceClass.HTTP,
+            get_host=lambda url, _: url.split("/")[2],
+            metrics=metrics,
+        )
+
+    assert {2, 4, 6} == set(result)
+    assert 3 == metrics.tasks
+    assert metrics.mean_queue_wait >= 0
+    assert metrics.mean_run_time >= 0
+
+
+def test_parallel_execute_per_host_limits(tmp_path, monkeypatch):
+    """Test a busy host doesn't block executions for other hosts and executions without a host aren't limited."""
+    monkeypatch.delenv("RENKU_RUNNING_UNDER_TEST")
+    other_host_done = threading.Event()
+    barrier = threading.Barrier(MAX_TASKS_PER_HOST + 1, timeout=5)
+
+    def wait_for_other_host(url):
+        return [other_host_done.wait(timeout=5)]
+
+    def notify(url):
+        other_host_done.set()
+        return [True]
+
+    def wait_for_all(url):
+        barrier.wait()
+        return [True]
+
+    with project_context.with_path(tmp_path):
+        # NOTE: Workers beyond the host's limit must be used for the other host's execution
+        result = parallel_execute(
+            lambda url: notify(url) if "b.org" in url else wait_for_other_host(url),
+            [f"https://a.org/{i}" for i in range(MAX_TASKS_PER_HOST + 2)] + ["https://b.org/1"],
+            resource=ResourceClass.HTTP,
+            get_host=lambda url: url.split("/")[2],
+            max_workers=MAX_TASKS_PER_HOST + 1,
+        )
+
+        assert all(result)
+
+        result = parallel_execute(
+            wait_for_all,
+            [str(i) for i in range(MAX_TASKS_PER_HOST + 1)],
+            resource=ResourceClass.HTTP,
+            max_workers=MAX_TASKS_PER_HOST + 1,
+        )
+
+        assert all(result)
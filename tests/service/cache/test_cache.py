@@ -17,6 +17,7 @@
 """Test service cache."""
 import datetime
 import os
+import threading
 import time
 import uuid
 
@@ -276,6 +277,97 @@ def test_service_cache_make_project(svc_client_cache):
         assert project.ttl_expired()
 
 
+def test_service_cache_bulk_queries(svc_client_cache):
+    """Test composite project lookup and cursor-based iteration of cache records."""
+    from renku.ui.service.cache.models.job import Job
+    from renku.ui.service.cache.models.project import Project
+
+    client, _, cache = svc_client_cache
+
+    user = cache.ensure_user({"user_id": uuid.uuid4().hex})
+    user2 = cache.ensure_user({"user_id": uuid.uuid4().hex})
+    git_url = "https://github.com/SwissDataScienceCenter/renku-project-template.git"
+    project_data = {
+        "name": "renku-project-template",
+        "slug": "renku-project-template",
+        "git_url": git_url,
+        "owner": "SwissDataScienceCenter",
+    }
+
+    project = cache.make_project(user, {**project_data, "branch": "main"})
+    cache.make_project(user, {**project_data, "branch": "develop"})
+
+    found = Project.find_by_remote(user.user_id, git_url, "main")
+    assert project.project_id == found.project_id
+    assert Project.find_by_remote(user2.user_id, git_url, "main") is None
+    assert Project.find(project.project_id, user_id=user2.user_id) is None
+
+    project.delete()
+    assert Project.find_by_remote(user.user_id, git_url, "main") is None
+    develop = Project.find_by_remote(user.user_id, git_url, "develop")
+    assert develop
+
+    # NOTE: Projects cached by an older version without a lookup entry are found and get an entry
+    lookup_field = Project._lookup_field(user.user_id, git_url, "develop")
+    Project.__database__.hdel(Project._lookup_key(), lookup_field)
+
+    assert develop.project_id == Project.find_by_remote(user.user_id, f"{git_url}/", "develop").project_id
+    assert develop.project_id.encode("utf-8") == Project.__database__.hget(Project._lookup_key(), lookup_field)
+
+    for _ in range(25):
+        cache.make_job(user, job_data={"job_id": uuid.uuid4().hex})
+    cache.make_job(user2, job_data={"job_id": uuid.uuid4().hex})
+
+    jobs = list(cache.get_jobs(user))
+    assert 25 == len(jobs)
+    assert 25 == len({job.job_id for job in jobs})
+    assert 26 <= len(list(cache.get_active_jobs()))
+    assert 25 == len(list(Job.iterate(Job.user_id, user.user_id, batch_size=7)))
+
+    chunked_id = uuid.uuid4().hex
+    for user_ in (user, user2):
+        cache.set_file_chunk(
+            user_,
+            {
+                "chunk_file_id": uuid.uuid4().hex,
+                "chunked_id": chunked_id,
+                "file_name": "chunk",
+                "relative_path": "chunk",
+            },
+        )
+
+    assert 1 == len(list(cache.get_chunks(user, chunked_id)))
+    cache.invalidate_chunks(user, chunked_id)
+    assert 0 == len(list(cache.get_chunks(user, chunked_id)))
+    assert 1 == len(list(cache.get_chunks(user2, chunked_id)))
+
+
+def test_service_cache_rebuild_age_index(svc_client_cache):
+    """Test records stored without an age are added to the age index once even if the index already exists."""
+    from renku.ui.service.cache.models.project import Project
+
+    _, _, cache = svc_client_cache
+
+    user = cache.ensure_user({"user_id": uuid.uuid4().hex})
+    project_data = {"name": "project", "slug": "project", "git_url": "https://example.com/owner/project"}
+    old_project = cache.make_project(user, {**project_data, "owner": "old"})
+    project = cache.make_project(user, {**project_data, "owner": "new"})
+    # NOTE: Simulate a record stored by a version without the age index
+    Project.__database__.zrem(Project.age_index_key(), old_project.get_hash_id())
+    Project.__database__.delete(Project._query.make_key("age", "indexed"))
+
+    Project.rebuild_age_index()
+
+    project_ids = [p.project_id for p in Project.iterate_by_age()]
+    assert old_project.project_id in project_ids
+    assert project.project_id in project_ids
+
+    Project.__database__.zrem(Project.age_index_key(), old_project.get_hash_id())
+    Project.rebuild_age_index()
+
+    assert old_project.project_id not in [p.project_id for p in Project.iterate_by_age()]
+
+
 @pytest.mark.parametrize(
     "git_url, expected_git_url",
     [
@@ -293,3 +385,249 @@ def test_service_cache_make_project(svc_client_cache):
 def test_git_url_normalization(git_url, expected_git_url):
     """Test git url normalization function."""
     assert expected_git_url == normalize_git_url(git_url)
+
+
+def test_repository_cache_metadata_view(svc_client_cache, tmp_path, mocker):
+    """Test metadata views only contain project's metadata and are shared for the same commit."""
+    from renku.infrastructure.repository import Repository
+    from renku.ui.service.gateways.repository_cache import LocalRepositoryCache
+
+    _, _, cache = svc_client_cache
+
+    source = Repository.initialize(tmp_path / "source")
+    with source.get_configuration(writable=True) as config:
+        config.set_value("user", "name", "Renku Bot")
+        config.set_value("user", "email", "renku@datascience.ch")
+        config.set_value("uploadpack", "allowFilter", "true")
+    for path in (".renku/metadata/root", "Dockerfile", "data/my-data/file"):
+        (source.path / path).parent.mkdir(parents=True, exist_ok=True)
+        (source.path / path).write_text(path)
+    source.add(all=True)
+    source.commit("Add files")
+
+    git_url = f"file://{source.path}"
+    mocker.patch("renku.ui.service.gateways.repository_cache.git_url_with_auth", lambda url, _: url)
+    user = cache.ensure_user({"user_id": uuid.uuid4().hex, "token": "secret"})
+
+    with LocalRepositoryCache().get_metadata(git_url, None, user) as path:
+        assert (path / ".renku" / "metadata" / "root").exists()
+        assert (path / "Dockerfile").exists()
+        assert not (path / "data").exists()
+        assert source.head.commit.hexsha == path.name
+
+        with LocalRepositoryCache().get_metadata(git_url, source.active_branch.name, user) as other_path:
+            assert path == other_path
+
+        # NOTE: Views that are in use aren't removed
+        os.utime(path, (0, 0))
+        LocalRepositoryCache()._collect_metadata_views()
+
+        assert path.exists()
+
+    source.run_git_command("commit", "--allow-empty", "-m", "Empty commit")
+
+    with LocalRepositoryCache().get_metadata(git_url, None, user) as new_path:
+        assert path != new_path
+
+    os.utime(path, (0, 0))
+    LocalRepositoryCache()._collect_metadata_views()
+
+    assert not path.exists()
+    assert new_path.exists()
+
+
+def test_repository_cache_mirror_is_fetched_once_per_interval(svc_client_cache, tmp_path, mocker):
+    """Test a fresh mirror is used without locking or fetching it again."""
+    from renku.infrastructure.repository import Repository
+    from renku.ui.service.gateways import repository_cache
+    from renku.ui.service.gateways.repository_cache import LocalRepositoryCache, get_mirror_path, is_mirror_fresh
+
+    _, _, cache = svc_client_cache
+
+    source = Repository.initialize(tmp_path / "source")
+    with source.get_configuration(writable=True) as config:
+        config.set_value("user", "name", "Renku Bot")
+        config.set_value("user", "email", "renku@datascience.ch")
+    source.run_git_command("commit", "--allow-empty", "-m", "Initial commit")
+
+    git_url = f"file://{source.path}"
+    mocker.patch("renku.ui.service.gateways.repository_cache.git_url_with_auth", lambda url, _: url)
+    user = cache.ensure_user({"user_id": uuid.uuid4().hex, "token": "secret"})
+    project_data = {"project_id": uuid.uuid4().hex, "owner": "owner", "name": "source", "slug": "source"}
+    project = cache.make_project(user, {**project_data, "git_url": git_url}, persist=False)
+    mirror_path = get_mirror_path(git_url)
+
+    assert not is_mirror_fresh(mirror_path)
+    assert mirror_path == LocalRepositoryCache()._update_mirror(project, user)
+    assert is_mirror_fresh(mirror_path)
+    assert source.head.commit.hexsha == Repository(mirror_path).get_commit(source.active_branch.name).hexsha
+
+    lock = mocker.spy(repository_cache.portalocker, "Lock")
+
+    assert mirror_path == LocalRepositoryCache()._update_mirror(project, user)
+    assert 0 == lock.call_count
+
+
+def test_repository_cache_update_keeps_unpushed_commits(svc_client_cache, tmp_path):
+    """Test updating a cached project doesn't reset commits that weren't pushed yet."""
+    from renku.infrastructure.repository import Repository
+    from renku.ui.service.gateways.repository_cache import LocalRepositoryCache
+
+    _, _, cache = svc_client_cache
+
+    source = Repository.initialize(tmp_path / "source")
+    with source.get_configuration(writable=True) as config:
+        config.set_value("user", "name", "Renku Bot")
+        config.set_value("user", "email", "renku@datascience.ch")
+    source.run_git_command("commit", "--allow-empty", "-m", "Initial commit")
+
+    git_url = f"file://{source.path}"
+    user = cache.ensure_user({"user_id": uuid.uuid4().hex, "token": "secret"})
+    project_data = {"project_id": uuid.uuid4().hex, "owner": "owner", "name": "source", "slug": "source"}
+    project = cache.make_project(user, {**project_data, "git_url": git_url})
+
+    repository = Repository.clone_from(git_url, project.abs_path)
+    with repository.get_configuration(writable=True) as config:
+        config.set_value("user", "name", "Renku Bot")
+        config.set_value("user", "email", "renku@datascience.ch")
+    repository.run_git_command("commit", "--allow-empty", "-m", "Unpushed commit")
+    unpushed = repository.head.commit.hexsha
+
+    LocalRepositoryCache().update(project, user)
+
+    assert unpushed == Repository(project.abs_path).head.commit.hexsha
+
+    repository.run_git_command("reset", "--hard", "HEAD~")
+    source.run_git_command("commit", "--allow-empty", "-m", "Remote commit")
+
+    LocalRepositoryCache().update(project, user)
+
+    assert source.head.commit.hexsha == Repository(project.abs_path).head.commit.hexsha
+
+
+def test_service_cache_responses(svc_client_cache):
+    """Test caching responses by project commit and invalidating them."""
+    _, _, cache = svc_client_cache
+    git_url = "https://example.com/owner/project.git"
+
+    key = cache.get_response_key("DatasetsListCtrl", {"git_url": git_url}, "abc123", "1.0.0")
+
+    assert key == cache.get_response_key("DatasetsListCtrl", {"git_url": git_url}, "abc123", "1.0.0")
+    assert key != cache.get_response_key("DatasetsListCtrl", {"git_url": git_url}, "def456", "1.0.0")
+    assert key != cache.get_response_key("ProjectShowCtrl", {"git_url": git_url}, "abc123", "1.0.0")
+    assert key != cache.get_response_key("DatasetsListCtrl", {"git_url": git_url}, "abc123", "1.0.1")
+
+    assert cache.get_response("DatasetsListCtrl", key) is None
+
+    cache.set_response(git_url, key, b'{"result": {}}')
+
+    assert b'{"result": {}}' == cache.get_response("DatasetsListCtrl", key)
+
+    cache.invalidate_responses(normalize_git_url(git_url))
+
+    assert cache.get_response("DatasetsListCtrl", key) is None
+    assert {"hits": 1, "misses": 2, "hit_rate": 1 / 3} == cache.get_response_metrics()["DatasetsListCtrl"]
+
+
+def test_project_write_queue(svc_client_cache):
+    """Test write operations on a project run one at a time in order and are rejected when too many are queued."""
+    from renku.ui.service.cache.models.project import Project
+    from renku.ui.service.cache.write_queue import ProjectWriteQueue
+    from renku.ui.service.errors import IntermittentLockError, IntermittentProjectBusyError
+
+    key = Project.get_write_queue("user", "https://example.com/owner/project.git", None).key
+    assert key == Project.get_write_queue("user", "https://example.com/owner/project", "").key
+    assert key != Project.get_write_queue("user", "https://example.com/owner/project.git", "develop").key
+    assert key != Project.get_write_queue("other", "https://example.com/owner/project.git", None).key
+
+    queue = ProjectWriteQueue("project")
+
+    executed = []
+
+    def write(index):
+        with ProjectWriteQueue("project", timeout=10):
+            executed.append(index)
+            time.sleep(0.05)
+
+    with queue:
+        assert 1 == len(queue)
+
+        threads = []
+        for index in range(3):
+            threads.append(threading.Thread(target=write, args=(index,)))
+            threads[-1].start()
+            # NOTE: Wait for the operation to be enqueued
+            while len(queue) < index + 2:
+                time.sleep(0.01)
+
+        with pytest.raises(IntermittentLockError):
+            ProjectWriteQueue("project", timeout=0.2).acquire()
+        with pytest.raises(IntermittentProjectBusyError):
+            ProjectWriteQueue("project", max_length=4).acquire()
+
+        assert [] == executed
+
+    for thread in threads:
+        thread.join()
+
+    assert [0, 1, 2] == executed
+    assert 0 == len(queue)
+
+    # NOTE: Operations whose heartbeat expired are dropped from the queue
+    stale = ProjectWriteQueue("project")
+    stale.acquire()
+    stale._stop_heartbeat.set()
+    queue.cache.delete(stale._heartbeat_key(stale.ticket))
+
+    with ProjectWriteQueue("project", timeout=1):
+        assert 1 == len(queue)
+
+
+def test_project_write_queue_enqueues_atomically(svc_client_cache, mocker):
+    """Test an operation that takes a number while another one is enqueued doesn't get ahead of it."""
+    from renku.ui.service.cache.write_queue import ProjectWriteQueue
+    from renku.ui.service.errors import IntermittentLockError
+
+    other = ProjectWriteQueue("atomic")
+    queue = ProjectWriteQueue("atomic", timeout=0.5)
+    enqueue = queue._enqueue
+
+    def interleaved_enqueue(pipeline):
+        enqueue(pipeline)
+        if other.ticket is None:
+            # NOTE: The other operation is enqueued after this one read the sequence but before it was added
+            other.acquire()
+
+    mocker.patch.object(queue, "_enqueue", side_effect=interleaved_enqueue)
+
+    try:
+        with pytest.raises(IntermittentLockError):
+            queue.acquire()
+
+        assert 0 == other.cache.zrank(other.key, other.ticket)
+    finally:
+        other.release()
+
+
+def test_project_write_queue_is_held_until_synced(svc_client_cache, mocker):
+    """Test a write operation's changes are pushed before the next write on the project runs."""
+    from renku.ui.service.cache.models.project import Project
+    from renku.ui.service.controllers.api.mixins import RenkuOpSyncMixin
+
+    _, _, cache = svc_client_cache
+    git_url = "https://example.com/owner/project.git"
+    queue = Project.get_write_queue("user", git_url, None)
+
+    class WriteCtrl(RenkuOpSyncMixin):
+        context = {"git_url": git_url}
+
+        def renku_op(self):
+            pass
+
+    ctrl = WriteCtrl(cache, {"user_id": "user"}, {"git_url": git_url})
+    mocker.patch.object(ctrl, "execute_op", side_effect=lambda: ctrl._write_queue and len(queue))
+    mocker.patch.object(ctrl, "sync", side_effect=lambda remote: len(queue))
+
+    assert (1, 1) == ctrl.execute_and_sync()
+    assert ctrl._write_queue is None
+    assert 0 == len(queue)
@@ -40,7 +40,7 @@ def _mock_cache_sync(repository: Repository):
 
     current_reference = repository.head.reference if repository.head.is_valid() else repository.head.commit
 
-    def _mocked_repo_reset(self, project, user):
+    def _mocked_repo_reset(self, project, user, **_):
         """Mock repo reset to work with mocked renku save."""
         repository.reset(current_reference, hard=True)
 
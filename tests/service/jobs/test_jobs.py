@@ -15,6 +15,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Renku service job tests."""
+import datetime
 import io
 import os
 import uuid
@@ -22,7 +23,7 @@ import uuid
 import pytest
 
 from renku.ui.service.jobs.cleanup import cache_files_cleanup
-from tests.utils import assert_rpc_response, retry_failed
+from tests.utils import assert_rpc_response, modified_environ, retry_failed
 
 
 @pytest.mark.service
@@ -53,6 +54,24 @@ def test_cleanup_old_files(datapack_zip, svc_client_with_repo, service_job):
     assert 0 == len(response.json["result"]["files"])
 
 
+@pytest.mark.service
+@pytest.mark.jobs
+def test_cleanup_logs_response_cache_metrics(svc_client_cache, mocker):
+    """Test cleanup reports the hit rate of cached responses."""
+    from renku.ui.service.jobs import cleanup
+
+    _, _, cache = svc_client_cache
+    endpoint = f"Ctrl{uuid.uuid4().hex}"
+    cache.set_response("https://example.com/owner/project", "response-key", b"{}")
+    cache.get_response(endpoint, "response-key")
+    cache.get_response(endpoint, "missing-key")
+    info = mocker.spy(cleanup.worker_log, "info")
+
+    cache_files_cleanup()
+
+    info.assert_any_call(f"response cache of {endpoint}: 1 hits, 1 misses, hit rate 0.50")
+
+
 @pytest.mark.service
 @pytest.mark.jobs
 def test_cleanup_files_old_keys(svc_client_with_user, service_job, tmp_path):
@@ -127,3 +146,146 @@ def test_job_constructor_lock(svc_client_with_user, service_job):
     assert project.project_id == job.project_id
     assert user.user_id == job.user_id
     assert project.project_id in {_id.decode("utf-8") for _id in job.locked.members()}
+
+
+@pytest.mark.service
+@pytest.mark.jobs
+def test_refresh_stale_project_in_background(svc_client_with_user, mocker):
+    """Test stale projects are served from cache for reads and refreshed in the background."""
+    from renku.ui.service.gateways.repository_cache import LocalRepositoryCache
+    from renku.ui.service.jobs.projects import refresh_project_job
+    from renku.ui.service.jobs.queues import REFRESH_QUEUE_PROJECTS, WorkerQueues
+
+    svc_client, headers, cache, user = svc_client_with_user
+
+    project = {
+        "project_id": uuid.uuid4().hex,
+        "name": "my-project",
+        "slug": "my-project",
+        "owner": "me",
+        "git_url": "https://example.com/me/my-project.git",
+        "initialized": True,
+    }
+    project = cache.make_project(user, project)
+    project.last_fetched_at = datetime.datetime.utcnow() - datetime.timedelta(seconds=60)
+    project.save()
+    os.makedirs(str(project.abs_path), exist_ok=True)
+
+    update = mocker.patch.object(LocalRepositoryCache, "update")
+    queue = WorkerQueues.get(REFRESH_QUEUE_PROJECTS)
+
+    LocalRepositoryCache()._maybe_update_cache(project, user, stale_ok=True)
+    LocalRepositoryCache()._maybe_update_cache(project, user, stale_ok=True)
+
+    assert 0 == update.call_count
+    assert 1 == len(queue.jobs)
+
+    refresh_project_job(*queue.jobs[0].args)
+
+    assert 1 == update.call_count
+
+    LocalRepositoryCache()._maybe_update_cache(project, user, stale_ok=False)
+
+    assert 2 == update.call_count
+    assert 1 == len(queue.jobs)
+
+    event = {"ref": "refs/heads/master", "project": {"git_http_url": project.git_url}}
+
+    response = svc_client.post("/cache.project_push", json=event, headers={"X-Gitlab-Token": "secret"})
+
+    assert "error" in response.json
+
+    mocker.patch("renku.ui.service.controllers.cache_project_push.WEBHOOK_SECRET", "secret")
+    response = svc_client.post("/cache.project_push", json=event, headers={"X-Gitlab-Token": "secret"})
+
+    assert_rpc_response(response)
+    assert 1 == response.json["result"]["refreshed"]
+    assert 2 == len(queue.jobs)
+
+    # NOTE: Refreshes are skipped if the project was fetched after they were requested, e.g. by a write
+    project.last_fetched_at = datetime.datetime.utcnow()
+    project.save()
+    update.reset_mock()
+
+    refresh_project_job(project.project_id, user.user_id, queue.jobs[1].args[2])
+
+    assert 0 == update.call_count
+
+
+@pytest.mark.service
+@pytest.mark.jobs
+def test_evict_projects_by_age_and_quota(svc_client_with_user, mocker):
+    """Test projects are evicted when expired or least recently used when the cache is over quota."""
+    from renku.ui.service.gateways.repository_cache import LocalRepositoryCache
+
+    svc_client, headers, cache, user = svc_client_with_user
+
+    projects = []
+    for age in (600, 300, 0):
+        project = {
+            "project_id": uuid.uuid4().hex,
+            "name": f"project-{age}",
+            "slug": f"project-{age}",
+            "owner": "me",
+            "git_url": f"https://example.com/me/project-{age}.git",
+            "initialized": True,
+        }
+        project = cache.make_project(user, project)
+        project.accessed_at = datetime.datetime.utcnow() - datetime.timedelta(seconds=age)
+        project.save()
+        os.makedirs(str(project.abs_path), exist_ok=True)
+        projects.append(project)
+
+    with modified_environ(RENKU_SVC_CLEANUP_TTL_PROJECTS="450"):
+        LocalRepositoryCache().evict_expired()
+
+    assert not projects[0].exists()
+    assert projects[1].exists() and projects[2].exists()
+
+    disk_usage = mocker.patch("renku.ui.service.gateways.repository_cache.shutil.disk_usage")
+    disk_usage.side_effect = [mocker.Mock(used=200), mocker.Mock(used=50)]
+
+    LocalRepositoryCache().evict_over_quota(quota=100)
+
+    assert not projects[1].exists()
+    assert projects[2].exists()
+    assert [projects[2].project_id] == [p.project_id for p in cache.get_projects(user)]
+
+
+@pytest.mark.service
+@pytest.mark.jobs
+def test_worker_preload_and_job_timings(mock_redis, mocker, monkeypatch, tmp_path):
+    """Test the worker preloads modules and records job startup times."""
+    import sys
+
+    from renku.ui.service.jobs.queues import CLEANUP_QUEUE_FILES, WorkerQueues
+    from renku.ui.service.worker import RenkuWorker, preload_modules
+
+    # NOTE: Preload a throwaway package so that modules which other tests hold references to aren't re-imported
+    package = tmp_path / "preloaded_jobs"
+    package.mkdir()
+    (package / "__init__.py").touch()
+    (package / "job.py").write_text("VALUE = 42\n")
+    (package / "optional.py").write_text("import not_installed_package\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    mocker.patch("renku.ui.service.worker.PRELOAD_MODULES", ["json"])
+    mocker.patch("renku.ui.service.worker.PRELOAD_PACKAGES", ["preloaded_jobs"])
+
+    try:
+        preload_modules()
+
+        assert 42 == sys.modules["preloaded_jobs.job"].VALUE
+        assert "preloaded_jobs.optional" not in sys.modules
+    finally:
+        for name in ("preloaded_jobs", "preloaded_jobs.job"):
+            sys.modules.pop(name, None)
+
+    queue = WorkerQueues.get(CLEANUP_QUEUE_FILES)
+    job = queue.enqueue(cache_files_cleanup)
+    worker = RenkuWorker([queue], connection=WorkerQueues.connection)
+
+    assert worker.perform_job(job, queue)
+
+    job.refresh()
+    assert 0 <= job.meta["startup_time"]
+    assert job.is_finished
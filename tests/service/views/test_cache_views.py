@@ -16,6 +16,7 @@
 # limitations under the License.
 """Renku service cache view tests."""
 import copy
+import hashlib
 import io
 import json
 import uuid
@@ -32,7 +33,13 @@ from renku.domain_model.project_context import project_context
 from renku.domain_model.provenance.agent import Person
 from renku.infrastructure.gateway.dataset_gateway import DatasetGateway
 from renku.infrastructure.repository import Repository
-from renku.ui.service.errors import IntermittentFileExistsError, UserAnonymousError, UserRepoUrlInvalidError
+from renku.ui.service.errors import (
+    IntermittentFileExistsError,
+    UserAnonymousError,
+    UserRepoUrlInvalidError,
+    UserUploadChecksumError,
+    UserUploadInvalidChunkError,
+)
 from renku.ui.service.jobs.cleanup import cache_files_cleanup
 from renku.ui.service.serializers.headers import JWT_TOKEN_SECRET
 from tests.utils import assert_rpc_response, retry_failed
@@ -298,6 +305,92 @@ def test_file_chunked_upload_delete(svc_client, identity_headers, svc_cache_dir)
     assert not upload_path.exists()
 
 
+@pytest.mark.service
+@pytest.mark.parametrize("valid_checksum", [True, False])
+def test_file_chunked_upload_out_of_order(svc_client, identity_headers, svc_cache_dir, valid_checksum):
+    """Test chunks are written at their offset and the assembled file is verified against its checksum."""
+    headers = copy.deepcopy(identity_headers)
+    headers.pop("Content-Type")
+
+    upload_id = uuid.uuid4().hex
+    filename = uuid.uuid4().hex
+    chunks = [b"chunk1", b"chunk2", b"chunk3"]
+    checksum = hashlib.sha256(b"".join(chunks) if valid_checksum else b"corrupted").hexdigest()
+
+    def upload_chunk(index):
+        return svc_client.post(
+            "/cache.files_upload",
+            data=dict(
+                file=(io.BytesIO(chunks[index]), filename),
+                dzuuid=upload_id,
+                dzchunkindex=index,
+                dztotalchunkcount=3,
+                dzchunksize=6,
+                dzchunkbyteoffset=index * 6,
+                dztotalfilesize=18,
+                chunked_content_type="application/text",
+                chunked_checksum=f"sha256:{checksum}",
+            ),
+            headers=headers,
+        )
+
+    for index in [2, 0, 2]:
+        response = upload_chunk(index)
+
+        assert_rpc_response(response)
+        assert "files" not in response.json["result"]
+
+    upload_path = next(svc_cache_dir[1].rglob("*")) / upload_id
+    assert 18 == (upload_path / "upload.partial").stat().st_size
+
+    response = upload_chunk(1)
+
+    assert not upload_path.exists()
+    if valid_checksum:
+        assert_rpc_response(response)
+        assert 1 == len(response.json["result"]["files"])
+        assert "chunk1chunk2chunk3" == (upload_path.parent / filename).read_text()
+    else:
+        assert_rpc_response(response, "error")
+        assert UserUploadChecksumError.code == response.json["error"]["code"]
+        assert not (upload_path.parent / filename).exists()
+
+
+@pytest.mark.service
+@pytest.mark.parametrize(
+    "chunk_index, chunk_byte_offset, total_size",
+    [(0, -6, 18), (2, 18, 18), (0, 0, 3), (3, 12, 18), (-1, 0, 18)],
+    ids=["negative-offset", "offset-after-end", "chunk-after-end", "index-too-large", "negative-index"],
+)
+def test_file_chunked_upload_invalid_chunk(
+    svc_client, identity_headers, svc_cache_dir, chunk_index, chunk_byte_offset, total_size
+):
+    """Test chunks that don't fit into the uploaded file are rejected."""
+    headers = copy.deepcopy(identity_headers)
+    headers.pop("Content-Type")
+
+    upload_id = uuid.uuid4().hex
+
+    response = svc_client.post(
+        "/cache.files_upload",
+        data=dict(
+            file=(io.BytesIO(b"chunk1"), uuid.uuid4().hex),
+            dzuuid=upload_id,
+            dzchunkindex=chunk_index,
+            dztotalchunkcount=3,
+            dzchunksize=6,
+            dzchunkbyteoffset=chunk_byte_offset,
+            dztotalfilesize=total_size,
+            chunked_content_type="application/text",
+        ),
+        headers=headers,
+    )
+
+    assert_rpc_response(response, "error")
+    assert UserUploadInvalidChunkError.code == response.json["error"]["code"]
+    assert not list(svc_cache_dir[1].rglob(upload_id))
+
+
 @pytest.mark.service
 def test_file_upload_override(svc_client, identity_headers):
     """Check successful file upload."""
@@ -969,6 +1062,55 @@ def test_cache_gets_synchronized(local_remote_repository, directory_tree, quick_
     assert any(d.name == payload["name"] for d in datasets)
 
 
+@pytest.mark.service
+@pytest.mark.integration
+@pytest.mark.serial
+@retry_failed
+def test_datasets_list_response_is_cached(local_remote_repository, with_injection, mocker):
+    """Test datasets.list responses are served from cache until the project changes."""
+    from renku.ui.service.controllers.datasets_list import DatasetsListCtrl
+
+    svc_client, identity_headers, _, _, remote_repo_checkout, remote_url = local_remote_repository
+    renku_op = mocker.spy(DatasetsListCtrl, "renku_op")
+    params = {"git_url": remote_url}
+
+    response = svc_client.get("/datasets.list", query_string=params, headers=identity_headers)
+    cached_response = svc_client.get("/datasets.list", query_string=params, headers=identity_headers)
+
+    assert 200 == response.status_code == cached_response.status_code
+    assert response.json == cached_response.json
+    assert 1 == renku_op.call_count
+
+    # NOTE: A new commit in the remote changes the cache key
+    with project_context.with_path(remote_repo_checkout.path):
+        with with_injection(remote_repo_checkout):
+            with with_commit(
+                repository=project_context.repository,
+                transaction_id=project_context.transaction_id,
+                commit_message="Create dataset",
+            ):
+                with DatasetContext(name="my_dataset", create=True, commit_database=True) as dataset:
+                    dataset.creators = [Person(name="me", email="me@example.com", id="me_id")]
+    remote_repo_checkout.push()
+
+    response = svc_client.get("/datasets.list", query_string=params, headers=identity_headers)
+
+    assert 200 == response.status_code
+    assert ["my_dataset"] == [d["name"] for d in response.json["result"]["datasets"]]
+    assert 2 == renku_op.call_count
+
+    # NOTE: Changes made through the service are visible right away since syncing invalidates cached responses
+    payload = {"git_url": remote_url, "name": uuid.uuid4().hex}
+    response = svc_client.post("/datasets.create", data=json.dumps(payload), headers=identity_headers)
+    assert 200 == response.status_code
+
+    response = svc_client.get("/datasets.list", query_string=params, headers=identity_headers)
+
+    assert 200 == response.status_code
+    assert {"my_dataset", payload["name"]} == {d["name"] for d in response.json["result"]["datasets"]}
+    assert 3 == renku_op.call_count
+
+
 @pytest.mark.service
 @pytest.mark.integration
 def test_check_migrations_remote_anonymous(svc_client, it_remote_public_repo_url):
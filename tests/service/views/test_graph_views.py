@@ -121,3 +121,49 @@ def test_graph_export_with_revision(svc_client_cache, it_remote_repo_url):
     )
     assert "mailto:contact@justsam.io" in response.json["result"]["graph"]
     assert len(response.json["result"]["graph"]) > 4500
+
+
+@pytest.mark.service
+def test_graph_export_delayed(svc_client_cache, mocker):
+    """Test delayed graph export writes the graph to a file that can be downloaded and is streamed to callbacks."""
+    from urllib.parse import parse_qs
+
+    from renku.ui.service.controllers.graph_export import GraphExportCtrl
+    from renku.ui.service.jobs.graph import graph_export_job
+    from renku.ui.service.jobs.queues import GRAPH_JOB_QUEUE, WorkerQueues
+
+    svc_client, headers, _ = svc_client_cache
+    graph = "[" + ",".join(json.dumps({"@id": f"https://localhost/entities/{i}?a=b&c"}) for i in range(10000)) + "]"
+
+    mocker.patch.object(GraphExportCtrl, "execute_op", lambda self: self.renku_op())
+    mocker.patch.object(GraphExportCtrl, "write_graph", lambda self, output: output.write(graph.encode("utf-8")))
+    mocker.patch("renku.ui.service.controllers.graph_export.migrations_check")
+    callbacks = []
+    mocker.patch("renku.core.util.requests.post", lambda url, data, headers: callbacks.append(b"".join(data)))
+
+    payload = {
+        "git_url": "https://example.com/me/my-project",
+        "callback_url": "https://example.com/callback",
+        "is_delayed": True,
+    }
+    response = svc_client.get("/graph.export", data=json.dumps(payload), headers=headers)
+
+    assert_rpc_response(response)
+    job_id = response.json["result"]["job_id"]
+
+    response = svc_client.get("/graph.export.result", query_string={"job_id": job_id}, headers=headers)
+    assert_rpc_response(response, "error")
+
+    queue = WorkerQueues.get(GRAPH_JOB_QUEUE)
+    assert 1 == len(queue.jobs)
+    graph_export_job(*queue.jobs[0].args)
+
+    callback_data = parse_qs(callbacks[0].decode("ascii"))
+    assert [graph] == callback_data["payload"]
+    assert ["https://example.com/me/my-project"] == callback_data["project_url"]
+
+    response = svc_client.get("/graph.export.result", query_string={"job_id": job_id}, headers=headers)
+
+    assert 200 == response.status_code
+    assert "application/ld+json" == response.mimetype
+    assert graph == response.get_data(as_text=True)